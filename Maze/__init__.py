@@ -1,3 +1,33 @@
-from .generator import MazeGenerator
+from typing import TYPE_CHECKING, Any
+from importlib import import_module
 
-__all__ = ["MazeGenerator"]
+from .generator import MazeGenerator, ALGORITHMS, register_algorithm
+from .api import make_config, generate, solve, export, load
+
+if TYPE_CHECKING:
+    from .solvers import SOLVERS, register_solver
+    from .distance import DistanceField
+    from .profiling import GenerationProfile
+
+# Imported on first access (PEP 562), so `import Maze` stays cheap.
+_LAZY = {
+    "SOLVERS": ".solvers",
+    "register_solver": ".solvers",
+    "DistanceField": ".distance",
+    "GenerationProfile": ".profiling",
+}
+
+__all__ = [
+    "MazeGenerator", "ALGORITHMS", "register_algorithm",
+    "SOLVERS", "register_solver", "DistanceField", "GenerationProfile",
+    "make_config", "generate", "solve", "export", "load",
+]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the lazily exported names of the package on first use."""
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_LAZY[name], __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,418 @@
+from typing import (
+    TYPE_CHECKING, Callable, Collection, Dict, Iterable, Iterator, List,
+    Optional, Set, Tuple,
+)
+from array import array
+import random
+
+from .grid import NORTH, EAST, SOUTH, WEST, WALLS, VISITED, BLOCKED
+
+if TYPE_CHECKING:
+    from .generator import MazeGenerator
+
+
+def kruskal(gen: "MazeGenerator") -> None:
+    """
+    Generate maze using randomized Kruskal's algorithm.
+
+    Every interior wall between two free cells is shuffled, then opened
+    when it joins two different components of a union-find forest
+    (path halving keeps finds close to constant time).
+    """
+    grid = gen.maze
+    cells = grid.cells
+    width = grid.width
+    size = len(cells)
+
+    edges = array('i')
+    for i in range(size):
+        if cells[i] & BLOCKED:
+            continue
+        if i % width < width - 1 and not cells[i + 1] & BLOCKED:
+            edges.append(2 * i)
+        if i + width < size and not cells[i + width] & BLOCKED:
+            edges.append(2 * i + 1)
+    gen.rng.shuffle(edges)
+
+    parent = array('i', range(size))
+    for edge in edges:
+        i = edge >> 1
+        j = i + width if edge & 1 else i + 1
+
+        a = i
+        while parent[a] != a:
+            parent[a] = parent[parent[a]]
+            a = parent[a]
+        b = j
+        while parent[b] != b:
+            parent[b] = parent[parent[b]]
+            b = parent[b]
+
+        if a != b:
+            parent[a] = b
+            grid.open_wall(i, j)
+
+
+def prim(gen: "MazeGenerator") -> None:
+    """
+    Generate maze using randomized Prim's algorithm.
+
+    Starting from the entry, a random frontier cell is repeatedly
+    attached to a random neighbour already in the maze.
+    """
+    grid = gen.maze
+    cells = grid.cells
+    rng = gen.rng
+    in_frontier = bytearray(len(cells))
+    frontier: List[int] = []
+
+    def grow(i: int) -> None:
+        cells[i] |= VISITED
+        for j in grid.adjacent(i):
+            if not cells[j] & VISITED and not in_frontier[j]:
+                in_frontier[j] = 1
+                frontier.append(j)
+
+    grow(grid.index(gen.entry_x, gen.entry_y))
+
+    while frontier:
+        k = rng.randrange(len(frontier))
+        i = frontier[k]
+        frontier[k] = frontier[-1]
+        frontier.pop()
+
+        inside = [
+            j for j in grid.adjacent(i)
+            if cells[j] & (VISITED | BLOCKED) == VISITED
+        ]
+        grid.open_wall(i, rng.choice(inside))
+        grow(i)
+
+
+def wilson(gen: "MazeGenerator") -> None:
+    """
+    Generate maze using Wilson's algorithm.
+
+    Loop-erased random walks from every cell outside the tree are
+    carved into the maze once they hit it, which samples uniformly
+    among all spanning trees.
+    """
+    grid = gen.maze
+    cells = grid.cells
+    rng = gen.rng
+    size = len(cells)
+    step = array('i', [-1]) * size
+
+    cells[grid.index(gen.entry_x, gen.entry_y)] |= VISITED
+
+    for start in range(size):
+        i = start
+        while not cells[i] & VISITED:
+            free = [j for j in grid.adjacent(i) if not cells[j] & BLOCKED]
+            j = rng.choice(free)
+            step[i] = j
+            i = j
+
+        i = start
+        while not cells[i] & VISITED:
+            cells[i] |= VISITED
+            grid.open_wall(i, step[i])
+            i = step[i]
+
+
+def eller(gen: "MazeGenerator") -> None:
+    """Generate maze using Eller's algorithm, one row at a time."""
+    _write_rows(gen, eller_rows(
+        gen.width, gen.height, gen.forty_two_pos, gen.rng))
+
+
+def binary_tree(gen: "MazeGenerator") -> None:
+    """Generate maze using the binary tree algorithm (north/east bias)."""
+    _write_rows(gen, binary_tree_rows(
+        gen.width, gen.height, gen.forty_two_pos, gen.rng))
+
+
+def _write_rows(gen: "MazeGenerator", rows: Iterable[bytearray]) -> None:
+    """Copy generated wall rows into the grid and re-mark '42' cells."""
+    cells = gen.maze.cells
+    width = gen.width
+    for y, row in enumerate(rows):
+        cells[y * width:(y + 1) * width] = row
+    for x, y in gen.forty_two_pos:
+        cells[y * width + x] |= VISITED | BLOCKED
+
+
+def _blocked_rows(
+    blocked: Collection[Tuple[int, int]]
+) -> Dict[int, List[int]]:
+    """Group blocked cell coordinates by row."""
+    by_row: Dict[int, List[int]] = {}
+    for x, y in blocked:
+        by_row.setdefault(y, []).append(x)
+    return by_row
+
+
+def _free_mask(width: int, blocked_x: Optional[List[int]]) -> bytearray:
+    """Return a row mask with 1 for free cells and 0 for blocked ones."""
+    free = bytearray(b"\x01") * width
+    for x in blocked_x or ():
+        free[x] = 0
+    return free
+
+
+def _trap_cells(
+    width: int,
+    height: int,
+    by_row: Dict[int, List[int]]
+) -> Dict[int, Set[int]]:
+    """
+    Find free cells that can only be reached from the row above.
+
+    A cell escapes when it can reach the last row moving only down,
+    left or right through free cells. Cells that do not escape (such as
+    the pocket inside the '4') must be carved into from above, because
+    a row-by-row algorithm can never link them downwards.
+
+    Args:
+        width: Maze width in cells.
+        height: Maze height in cells.
+        by_row: Blocked x coordinates grouped by row.
+
+    Returns:
+        Trapped x coordinates grouped by row.
+    """
+    traps: Dict[int, Set[int]] = {}
+    escapes: Dict[int, bytearray] = {}
+
+    for y in sorted(by_row, reverse=True):
+        free = _free_mask(width, by_row[y])
+        if y == height - 1:
+            escapes[y] = free
+            continue
+
+        below = escapes.get(y + 1, bytearray(b"\x01") * width)
+        escape = bytearray(width)
+        x = 0
+        while x < width:
+            if not free[x]:
+                x += 1
+                continue
+            start = x
+            reaches_down = False
+            while x < width and free[x]:
+                if below[x]:
+                    reaches_down = True
+                x += 1
+            if reaches_down:
+                escape[start:x] = b"\x01" * (x - start)
+
+        escapes[y] = escape
+        trapped = {x for x in range(width) if free[x] and not escape[x]}
+        if trapped:
+            traps[y] = trapped
+
+    return traps
+
+
+def eller_rows(
+    width: int,
+    height: int,
+    blocked: Collection[Tuple[int, int]] = (),
+    rng: Optional[random.Random] = None
+) -> Iterator[bytearray]:
+    """
+    Generate a perfect maze row by row with Eller's algorithm.
+
+    Only the current row's set labels are kept, so memory is O(width)
+    whatever the height. Each yielded row is final and holds the wall
+    bits of its cells (N=1, E=2, S=4, W=8).
+
+    Blocked cells stay fully walled. Sets that cannot continue downwards
+    because of them are merged sideways first, and cells that can only
+    be entered from above are always carved into from the row above.
+
+    Args:
+        width: Maze width in cells.
+        height: Maze height in cells.
+        blocked: Coordinates of cells to leave closed ('42' pattern).
+        rng: Random number generator to draw from (a fresh unseeded
+            one if None).
+
+    Yields:
+        One bytearray of wall bits per row, from top to bottom.
+    """
+    if rng is None:
+        rng = random.Random()
+    by_row = _blocked_rows(blocked)
+    traps = _trap_cells(width, height, by_row)
+    labels = [-1] * width
+    parent = list(range(2 * width + 1))
+    north_open = bytearray(width)
+
+    def find(a: int) -> int:
+        while parent[a] != a:
+            parent[a] = parent[parent[a]]
+            a = parent[a]
+        return a
+
+    free_next = _free_mask(width, by_row.get(0))
+    for y in range(height):
+        last = y == height - 1
+        free = free_next
+        row = bytearray((WALLS,)) * width
+
+        next_id = max(labels) + 1
+        for x in range(width):
+            if north_open[x]:
+                row[x] &= ~NORTH
+            if not free[x]:
+                labels[x] = -1
+            elif labels[x] < 0:
+                labels[x] = next_id
+                next_id += 1
+        parent[:next_id] = range(next_id)
+
+        for x in range(width - 1):
+            if free[x] and free[x + 1]:
+                a = find(labels[x])
+                b = find(labels[x + 1])
+                if a != b and (last or rng.random() < 0.5):
+                    parent[a] = b
+                    row[x] &= ~EAST
+                    row[x + 1] &= ~WEST
+
+        if last:
+            yield row
+            return
+
+        free_next = _free_mask(width, by_row.get(y + 1))
+        trapped = traps.get(y + 1, set())
+        can_down = bytearray(
+            free[x] and free_next[x] and x not in trapped
+            for x in range(width)
+        )
+
+        while True:
+            going_down = {find(labels[x]) for x in range(width)
+                          if can_down[x]}
+            for x in range(width - 1):
+                if not (free[x] and free[x + 1]):
+                    continue
+                a = find(labels[x])
+                b = find(labels[x + 1])
+                if a != b and (a not in going_down or b not in going_down):
+                    parent[a] = b
+                    row[x] &= ~EAST
+                    row[x + 1] &= ~WEST
+                    break
+            else:
+                break
+
+        groups: Dict[int, List[int]] = {}
+        for x in range(width):
+            if can_down[x]:
+                groups.setdefault(find(labels[x]), []).append(x)
+
+        north_open = bytearray(width)
+        for members in groups.values():
+            north_open[rng.choice(members)] = 1
+            for x in members:
+                if rng.random() < 0.5:
+                    north_open[x] = 1
+        for x in trapped:
+            if free[x]:
+                north_open[x] = 1
+
+        renamed: Dict[int, int] = {}
+        for x in range(width):
+            if north_open[x]:
+                row[x] &= ~SOUTH
+                labels[x] = renamed.setdefault(find(labels[x]), len(renamed))
+            else:
+                labels[x] = -1
+
+        yield row
+
+
+def binary_tree_rows(
+    width: int,
+    height: int,
+    blocked: Collection[Tuple[int, int]] = (),
+    rng: Optional[random.Random] = None
+) -> Iterator[bytearray]:
+    """
+    Generate a perfect maze row by row with the binary tree algorithm.
+
+    Each cell opens either its north or its east wall, so every cell
+    leads to the top-right corner. A run of cells that cannot reach it
+    because of blocked cells is attached through a random north wall of
+    the run, or failing that to the cell west of the run. Rows are
+    yielded one step late because a row's south walls are only known
+    once the next row is done; memory stays O(width).
+
+    Args:
+        width: Maze width in cells.
+        height: Maze height in cells.
+        blocked: Coordinates of cells to leave closed ('42' pattern).
+        rng: Random number generator to draw from (a fresh unseeded
+            one if None).
+
+    Yields:
+        One bytearray of wall bits per row, from top to bottom.
+    """
+    if rng is None:
+        rng = random.Random()
+    by_row = _blocked_rows(blocked)
+    above_free = bytearray(width)
+    previous = bytearray(width)
+
+    for y in range(height):
+        free = _free_mask(width, by_row.get(y))
+        row = bytearray((WALLS,)) * width
+        run_start = 0
+
+        for x in range(width):
+            if not free[x]:
+                run_start = x + 1
+                continue
+            north = above_free[x]
+            east = x < width - 1 and free[x + 1]
+
+            if north and (not east or rng.random() < 0.5):
+                row[x] &= ~NORTH
+                previous[x] &= ~SOUTH
+                run_start = x + 1
+            elif east:
+                row[x] &= ~EAST
+                row[x + 1] &= ~WEST
+            else:
+                if y > 0 or x < width - 1:
+                    run = [c for c in range(run_start, x + 1)
+                           if above_free[c]]
+                    if run:
+                        c = rng.choice(run)
+                        row[c] &= ~NORTH
+                        previous[c] &= ~SOUTH
+                    elif run_start > 0 and free[run_start - 1]:
+                        row[run_start] &= ~WEST
+                        row[run_start - 1] &= ~EAST
+                run_start = x + 1
+
+        if y > 0:
+            yield previous
+        previous = row
+        above_free = free
+
+    if height > 0:
+        yield previous
+
+
+RowEngine = Callable[
+    [int, int, Collection[Tuple[int, int]], Optional[random.Random]],
+    Iterator[bytearray]
+]
+
+ROW_ALGORITHMS: Dict[str, RowEngine] = {
+    "ELLER": eller_rows,
+    "BINARY_TREE": binary_tree_rows,
+}
@@ -0,0 +1,238 @@
+from typing import Any, Dict, List, Optional, Tuple
+from collections import deque
+from itertools import compress
+import json
+import os
+
+from .grid import (
+    MazeGrid, NORTH, EAST, SOUTH, WEST, WALLS, BLOCKED, DEGREE,
+    open_neighbors,
+)
+from .distance import DistanceField
+
+Point = Tuple[int, int]
+
+_NODE = bytes(1 if value in (1, 3, 4) else 0 for value in range(256))
+_CORRIDOR = bytes(1 if value == 2 else 0 for value in range(256))
+_BLOCKED = bytes(1 if value & BLOCKED else 0 for value in range(256))
+
+
+def _corridor_ends(width: int) -> List[Tuple[int, int]]:
+    """Offsets of the two openings of a corridor cell, per wall value."""
+    offsets = ((NORTH, -width), (SOUTH, width), (WEST, -1), (EAST, 1))
+    ends = []
+    for walls in range(WALLS + 1):
+        found = [offset for bit, offset in offsets if not walls & bit]
+        ends.append((found[0], found[1]) if len(found) == 2 else (0, 0))
+    return ends
+
+
+def corridor_lengths(grid: MazeGrid, degree: bytes) -> Dict[int, int]:
+    """
+    Measure the corridors of a maze.
+
+    A corridor is a maximal run of cells with exactly two openings.
+    Runs are walked from the dead ends and junctions around them; cells
+    left over afterwards form closed rings, measured on their own. Each
+    cell is visited once.
+
+    Args:
+        grid: Maze grid.
+        degree: Number of openings per cell.
+
+    Returns:
+        Histogram mapping corridor length (in cells) to count.
+    """
+    cells = grid.cells
+    width = grid.width
+    size = len(cells)
+    seen = bytearray(size)
+    lengths: Dict[int, int] = {}
+    ends = _corridor_ends(width)
+
+    def walk(previous: int, i: int) -> int:
+        length = 0
+        while degree[i] == 2 and not seen[i]:
+            seen[i] = 1
+            length += 1
+            a, b = ends[cells[i] & WALLS]
+            a += i
+            previous, i = i, i + b if a == previous else a
+        return length
+
+    for i in compress(range(size), degree.translate(_NODE)):
+        for j in open_neighbors(cells, width, i):
+            if degree[j] == 2 and not seen[j]:
+                length = walk(i, j)
+                lengths[length] = lengths.get(length, 0) + 1
+
+    corridor = degree.translate(_CORRIDOR)
+    if sum(seen) < corridor.count(1):
+        for i in compress(range(size), corridor):
+            if not seen[i]:
+                length = walk(open_neighbors(cells, width, i)[0], i)
+                lengths[length] = lengths.get(length, 0) + 1
+
+    return dict(sorted(lengths.items()))
+
+
+def _count_parts(
+    grid: MazeGrid,
+    field: DistanceField
+) -> int:
+    """
+    Count the connected parts of the free cells.
+
+    Only needed when the entry cannot reach every free cell, which
+    generated mazes never do.
+
+    Args:
+        grid: Maze grid, '42' cells marked BLOCKED.
+        field: Distance field from the entry.
+
+    Returns:
+        Number of connected parts, the entry's included.
+    """
+    cells = grid.cells
+    width = grid.width
+    seen = cells.translate(_BLOCKED)
+    for i in range(len(cells)):
+        if field.distance[i] >= 0:
+            seen[i] = 1
+
+    parts = 1
+    for start in range(len(cells)):
+        if seen[start]:
+            continue
+        parts += 1
+        seen[start] = 1
+        queue = deque((start,))
+        while queue:
+            for j in open_neighbors(cells, width, queue.popleft()):
+                if not seen[j]:
+                    seen[j] = 1
+                    queue.append(j)
+    return parts
+
+
+def maze_stats(
+    grid: MazeGrid,
+    entry: Point,
+    exit: Point,
+    field: Optional[DistanceField] = None
+) -> Dict[str, Any]:
+    """
+    Compute difficulty statistics of a maze.
+
+    Degrees are counted with a translate table; the rest takes two BFS
+    passes (from the entry, then from the farthest cell found) and one
+    walk along the corridors, so the cost is linear in the cells.
+
+    Args:
+        grid: Maze grid, '42' cells marked BLOCKED.
+        entry: Entry point as (x, y) coordinates.
+        exit: Exit point as (x, y) coordinates.
+        field: Distance field from entry, if already computed.
+
+    Returns:
+        Dict with:
+            cells: Number of free (non '42') cells.
+            passages: Number of open walls between cells.
+            dead_ends: Cells with one opening.
+            junctions: Cells with three or four openings.
+            degree_histogram: Number of cells per count of openings.
+            solution_length: Steps from entry to exit (-1 if none).
+            solution_ratio: Cells on the solution over free cells.
+            diameter: Steps between the two cells found farthest apart
+                by the double BFS, and those cells. Exact for perfect
+                mazes, a lower bound when the maze has loops.
+            cyclomatic: Number of independent loops (passages - cells +
+                connected parts), 0 for a perfect maze.
+            corridors: Histogram of corridor lengths (see
+                corridor_lengths).
+            longest_corridor: Longest corridor in cells.
+            river_factor: Mean corridor length; high values mean long
+                winding passages with few branches.
+    """
+    if field is None:
+        field = DistanceField(grid, entry)
+    cells = grid.cells
+    width = grid.width
+    degree = bytes(cells.translate(DEGREE))
+
+    free = len(cells) - cells.translate(_BLOCKED).count(1)
+    histogram = {k: degree.count(k) for k in range(5)}
+    histogram[0] -= len(cells) - free
+    passages = sum(k * n for k, n in histogram.items()) // 2
+
+    reached = len(field.distance) - field.distance.count(-1)
+    parts = 1
+    if reached < free:
+        parts = _count_parts(grid, field)
+
+    far = field.farthest
+    second = DistanceField(grid, (far % width, far // width))
+    end = second.farthest
+
+    corridors = corridor_lengths(grid, degree)
+    count = sum(corridors.values())
+    steps = field.distance_to(*exit)
+
+    return {
+        "cells": free,
+        "passages": passages,
+        "dead_ends": histogram[1],
+        "junctions": histogram[3] + histogram[4],
+        "degree_histogram": histogram,
+        "solution_length": steps,
+        "solution_ratio": round((steps + 1) / free, 6) if free else 0.0,
+        "diameter": {
+            "length": second.max_distance,
+            "from": (far % width, far // width),
+            "to": (end % width, end // width),
+        },
+        "cyclomatic": passages - free + parts,
+        "corridors": corridors,
+        "longest_corridor": max(corridors, default=0),
+        "river_factor": round(
+            sum(k * n for k, n in corridors.items()) / count, 6)
+        if count else 0.0,
+    }
+
+
+def stats_path(output_file: str) -> str:
+    """
+    Return the path of the statistics sidecar of a maze file.
+
+    Args:
+        output_file: Path of the exported maze.
+
+    Returns:
+        The maze path with its extension replaced by .stats.json.
+    """
+    root, _ = os.path.splitext(output_file)
+    return root + ".stats.json"
+
+
+def write_stats(path: str, stats: Dict[str, Any]) -> None:
+    """
+    Write maze statistics as JSON.
+
+    Args:
+        path: Output path, usually stats_path(OUTPUT_FILE).
+        stats: Statistics from maze_stats.
+
+    Raises:
+        FileNotFoundError: If output file path is invalid.
+        PermissionError: If permission denied when writing file.
+    """
+    try:
+        with open(path, "w") as f:
+            json.dump(stats, f, indent=1)
+            f.write("\n")
+
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Error: {path} not found")
+
+    except PermissionError:
+        raise PermissionError("Error: Permission denied")
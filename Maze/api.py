@@ -0,0 +1,157 @@
+from typing import Any, Dict, List, Optional, Tuple
+
+from .generator import MazeGenerator
+
+Point = Tuple[int, int]
+
+
+def make_config(
+    width: int,
+    height: int,
+    entry: Point = (0, 0),
+    exit: Optional[Point] = None,
+    perfect: bool = True,
+    seed: Optional[int] = None,
+    **options: Any
+) -> Dict[str, Any]:
+    """
+    Build a configuration dict as parsed from a config file.
+
+    Args:
+        width: Maze width in cells.
+        height: Maze height in cells.
+        entry: Entry point as (x, y) coordinates.
+        exit: Exit point as (x, y). Defaults to the opposite corner.
+        perfect: Generate a perfect maze (no loops).
+        seed: Random seed, None for a random maze.
+        **options: Other config keys in any case, e.g. algorithm="ELLER",
+            output_file="maze.txt", loops=0.05, solver="ASTAR".
+
+    Returns:
+        Dict with upper-case keys, as used by MazeGenerator.
+    """
+    config: Dict[str, Any] = {
+        'WIDTH': width,
+        'HEIGHT': height,
+        'ENTRY': tuple(entry),
+        'EXIT': tuple(exit) if exit is not None else (width - 1, height - 1),
+        'PERFECT': perfect,
+        'SEED': seed,
+        'OUTPUT_FILE': None,
+    }
+    for key, value in options.items():
+        config[key.upper()] = value
+    return config
+
+
+def generate(
+    width: int,
+    height: int,
+    entry: Point = (0, 0),
+    exit: Optional[Point] = None,
+    perfect: bool = True,
+    seed: Optional[int] = None,
+    **options: Any
+) -> MazeGenerator:
+    """
+    Generate a maze in memory.
+
+    Nothing is written unless output_file is given.
+
+    Args:
+        width: Maze width in cells.
+        height: Maze height in cells.
+        entry: Entry point as (x, y) coordinates.
+        exit: Exit point as (x, y). Defaults to the opposite corner.
+        perfect: Generate a perfect maze (no loops).
+        seed: Random seed, None for a random maze.
+        **options: Other config keys (see make_config).
+
+    Returns:
+        The generator holding the maze.
+
+    Raises:
+        Exception: If maze is too small to place '42' pattern.
+        ValueError: If the algorithm name is unknown, or entry or exit
+            is on the '42' pattern.
+    """
+    config = make_config(width, height, entry, exit, perfect, seed,
+                         **options)
+    gen = MazeGenerator(config)
+    gen.generate(export=config['OUTPUT_FILE'] is not None)
+    return gen
+
+
+def solve(
+    maze: MazeGenerator,
+    solver: Optional[str] = None
+) -> List[Point]:
+    """
+    Return the path from entry to exit of a maze.
+
+    Args:
+        maze: Generated or loaded maze.
+        solver: Name of a solver in Maze.solvers.SOLVERS. Defaults to
+            the stored path of a loaded maze, then to the SOLVER config
+            key.
+
+    Returns:
+        List of (x, y) tuples from entry to exit.
+
+    Raises:
+        ValueError: If the solver is unknown.
+    """
+    if solver is None:
+        return maze.solution()
+    return maze.solve(solver)[0]
+
+
+def export(maze: MazeGenerator, path: str, **options: Any) -> None:
+    """
+    Write a maze file with its solution.
+
+    Args:
+        maze: Generated or loaded maze.
+        path: Output path; a .mzb extension selects the binary format,
+            .png and .ppm a picture, unless format is given.
+        **options: Config keys to override for this file, e.g.
+            format="BINARY", compression="ZLIB", stats=True, or
+            theme="BLUE", scale=4 for pictures. solver="ASTAR" writes
+            the path of that solver instead of the maze's solution.
+
+    Raises:
+        ValueError: If FORMAT, COMPRESSION or SOLVER is unknown, or
+            SCALE is not a positive integer.
+        FileNotFoundError: If output file path is invalid.
+        PermissionError: If permission denied when writing file.
+    """
+    config = dict(maze.config, OUTPUT_FILE=path)
+    config.pop('FORMAT', None)
+    overrides = {key.upper(): value for key, value in options.items()}
+    config.update(overrides)
+    if 'SOLVER' in overrides:
+        solution = maze.solve(overrides['SOLVER'])[0]
+    else:
+        solution = maze.solution()
+    MazeGenerator.export_to(
+        maze.maze, config, solution,
+        maze.stats() if config.get('STATS') else None)
+
+
+def load(path: str, validate: bool = True) -> MazeGenerator:
+    """
+    Load a maze file written by export (hex or binary format).
+
+    Args:
+        path: Path of the maze file.
+        validate: Check wall coherence and the stored path.
+
+    Returns:
+        A generator holding the loaded maze.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        PermissionError: If permission denied when reading the file.
+        ValueError: If the file is malformed or incoherent.
+    """
+    return MazeGenerator.from_file(path, validate)
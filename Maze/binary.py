@@ -0,0 +1,377 @@
+from typing import Any, Callable, Dict, List, Union
+import lzma
+import mmap
+import struct
+import zlib
+
+from .grid import MazeGrid, WALLS
+from .image import IMAGE_EXTENSIONS
+from .loader import MazeReader
+
+MAGIC = b"AMZB"
+VERSION = 1
+
+# magic, version, compression, flags, algorithm name length, width,
+# height, entry x, entry y, exit x, exit y, rows per frame, seed, steps
+HEADER = struct.Struct("<4sBBBBIIIIIIIqQ")
+
+FLAG_PERFECT = 1
+FLAG_SEED = 2
+
+FRAME_SIZE = 1 << 16
+FRAME_CACHE = 16
+
+BINARY_EXTENSIONS = (".mzb",)
+
+COMPRESSIONS: Dict[str, int] = {"NONE": 0, "ZLIB": 1, "LZMA": 2}
+
+_COMPRESS: Dict[int, Callable[[bytes], bytes]] = {
+    0: bytes,
+    1: zlib.compress,
+    2: lzma.compress,
+}
+_DECOMPRESS: Dict[int, Callable[[bytes], bytes]] = {
+    0: bytes,
+    1: zlib.decompress,
+    2: lzma.decompress,
+}
+
+_PACK_LOW = bytes(value & WALLS for value in range(256))
+_PACK_HIGH = bytes((value & WALLS) << 4 for value in range(256))
+_UNPACK_LOW = bytes(value & 0x0F for value in range(256))
+_UNPACK_HIGH = bytes(value >> 4 for value in range(256))
+
+_STEP_CODES = bytes(
+    "NESW".find(chr(value)) & 3 for value in range(256))
+_SHIFTS = tuple(
+    bytes((value << shift) & 0xFF for value in range(256))
+    for shift in (0, 2, 4, 6)
+)
+_STEP_NAMES = tuple(
+    "".join("NESW"[(value >> shift) & 3] for shift in (0, 2, 4, 6))
+    for value in range(256)
+)
+
+
+def _or_bytes(parts: List[Union[bytes, bytearray]], size: int) -> bytes:
+    """Bitwise OR of byte strings, each at most size bytes long."""
+    total = 0
+    for part in parts:
+        total |= int.from_bytes(part, "little")
+    return total.to_bytes(size, "little")
+
+
+def pack_cells(cells: Union[bytes, bytearray]) -> bytes:
+    """
+    Pack cell bytes two per byte (even cell low nibble, odd cell high).
+
+    Args:
+        cells: One byte per cell; only the wall bits are kept.
+
+    Returns:
+        (len(cells) + 1) // 2 bytes.
+    """
+    size = (len(cells) + 1) // 2
+    return _or_bytes([
+        cells[0::2].translate(_PACK_LOW),
+        cells[1::2].translate(_PACK_HIGH),
+    ], size)
+
+
+def unpack_cells(data: bytes) -> bytearray:
+    """
+    Unpack two cells per byte into one byte of wall bits per cell.
+
+    Args:
+        data: Packed cells as written by pack_cells.
+
+    Returns:
+        2 * len(data) cell bytes.
+    """
+    cells = bytearray(2 * len(data))
+    cells[0::2] = data.translate(_UNPACK_LOW)
+    cells[1::2] = data.translate(_UNPACK_HIGH)
+    return cells
+
+
+def pack_directions(directions: str) -> bytes:
+    """
+    Pack a direction string at 2 bits per step (N=0, E=1, S=2, W=3).
+
+    Args:
+        directions: String of direction characters (N, E, S, W).
+
+    Returns:
+        (len(directions) + 3) // 4 bytes, first step in the low bits.
+    """
+    codes = directions.encode().translate(_STEP_CODES)
+    codes += bytes(-len(codes) % 4)
+    return _or_bytes([
+        codes[shift::4].translate(_SHIFTS[shift]) for shift in range(4)
+    ], len(codes) // 4)
+
+
+def unpack_directions(data: bytes, steps: int) -> str:
+    """Unpack the first steps directions from a pack_directions stream."""
+    return "".join(map(_STEP_NAMES.__getitem__, data))[:steps]
+
+
+def output_format(config: Dict[str, Any]) -> str:
+    """
+    Return the output format selected by a configuration.
+
+    Args:
+        config: Dict with OUTPUT_FILE and optionally FORMAT.
+
+    Returns:
+        FORMAT if set, otherwise BINARY for OUTPUT_FILE names ending in
+        one of BINARY_EXTENSIONS, PNG or PPM for the IMAGE_EXTENSIONS
+        and HEX for anything else.
+    """
+    if config.get('FORMAT'):
+        return str(config['FORMAT']).upper()
+    name = str(config['OUTPUT_FILE']).lower()
+    if name.endswith(BINARY_EXTENSIONS):
+        return "BINARY"
+    for extension, image_format in IMAGE_EXTENSIONS.items():
+        if name.endswith(extension):
+            return image_format
+    return "HEX"
+
+
+def is_binary_file(path: str) -> bool:
+    """Return True if path starts with the binary maze magic bytes."""
+    try:
+        with open(path, "rb") as f:
+            return f.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+def write_binary(
+    grid: MazeGrid,
+    config: Dict[str, Any],
+    directions: str
+) -> None:
+    """
+    Write a maze to OUTPUT_FILE in the packed binary format.
+
+    The file is a fixed header, the algorithm name, a table of frame
+    offsets, then the frames: groups of packed rows of about FRAME_SIZE
+    bytes, and last the 2-bit direction stream. Frames are compressed
+    one by one (COMPRESSION=NONE, ZLIB or LZMA), so a reader only
+    inflates the frame holding the row it wants.
+
+    Args:
+        grid: Maze to write.
+        config: Dict with OUTPUT_FILE, ENTRY, EXIT, PERFECT, SEED and
+            optionally ALGORITHM and COMPRESSION.
+        directions: Solution as a string of N, E, S, W characters.
+
+    Raises:
+        ValueError: If COMPRESSION is unknown or SEED does not fit in
+            64 bits.
+        FileNotFoundError: If output file path is invalid.
+        PermissionError: If permission denied when writing file.
+    """
+    compression = str(config.get('COMPRESSION') or "NONE").upper()
+    if compression not in COMPRESSIONS:
+        raise ValueError(f"Unknown compression: {compression}")
+    codec = COMPRESSIONS[compression]
+    compress = _COMPRESS[codec]
+
+    seed = config['SEED']
+    if seed is not None and not -(1 << 63) <= seed < (1 << 63):
+        raise ValueError("SEED does not fit in the binary header")
+    flags = (FLAG_PERFECT if config['PERFECT'] else 0) | (
+        FLAG_SEED if seed is not None else 0)
+    algorithm = str(config.get('ALGORITHM') or "").encode()[:255]
+
+    width = grid.width
+    height = grid.height
+    row_bytes = (width + 1) // 2
+    rows_per_frame = max(1, FRAME_SIZE // row_bytes)
+    frames = -(-height // rows_per_frame) + 1
+    entry_x, entry_y = config['ENTRY']
+    exit_x, exit_y = config['EXIT']
+
+    header = HEADER.pack(
+        MAGIC, VERSION, codec, flags, len(algorithm), width, height,
+        entry_x, entry_y, exit_x, exit_y, rows_per_frame,
+        seed or 0, len(directions),
+    ) + algorithm
+    table = struct.Struct(f"<{frames + 1}Q")
+
+    path = config['OUTPUT_FILE']
+    try:
+        with open(path, "wb") as f:
+            f.write(header)
+            f.write(bytes(table.size))
+            offsets = [f.tell()]
+
+            cells = grid.cells
+            pad = b"\x00" if width % 2 else b""
+            raw: Union[bytes, bytearray]
+            for top in range(0, height, rows_per_frame):
+                bottom = min(top + rows_per_frame, height)
+                if pad:
+                    raw = pad.join(
+                        cells[y * width:(y + 1) * width]
+                        for y in range(top, bottom)) + pad
+                else:
+                    raw = cells[top * width:bottom * width]
+                f.write(compress(pack_cells(raw)))
+                offsets.append(f.tell())
+
+            f.write(compress(pack_directions(directions)))
+            offsets.append(f.tell())
+
+            f.seek(len(header))
+            f.write(table.pack(*offsets))
+
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Error: {path} not found")
+
+    except PermissionError:
+        raise PermissionError("Error: Permission denied")
+
+
+class BinaryMazeFile(MazeReader):
+    """
+    Memory-mapped reader for the packed binary format.
+
+    Any row is reached through the frame table: directly in an
+    uncompressed file, or by inflating only its frame in a compressed
+    one (the FRAME_CACHE most recent frames are kept).
+    """
+
+    def __init__(
+        self,
+        path: str
+    ) -> None:
+        """
+        Open and map a binary maze file.
+
+        Args:
+            path: Path of a file written by write_binary.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            PermissionError: If permission denied when reading the file.
+            ValueError: If the file layout is invalid.
+        """
+        try:
+            self._file = open(path, "rb")
+
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Error: {path} not found")
+
+        except PermissionError:
+            raise PermissionError("Error: Permission denied")
+
+        try:
+            self._view = mmap.mmap(
+                self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"Error: {path} is empty")
+
+        self._cached: Dict[int, bytes] = {}
+        try:
+            self._parse_header()
+        except (ValueError, struct.error) as e:
+            self.close()
+            raise ValueError(f"Invalid binary maze file {path}: {e}")
+
+    def _parse_header(self) -> None:
+        """Read the header, the algorithm name and the frame table."""
+        view = self._view
+        (magic, version, codec, flags, name_size, self.width, self.height,
+         entry_x, entry_y, exit_x, exit_y, self.rows_per_frame,
+         seed, steps) = HEADER.unpack_from(view, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("unknown magic or version")
+        if codec not in _DECOMPRESS:
+            raise ValueError(f"unknown compression {codec}")
+        if not self.width or not self.height or not self.rows_per_frame:
+            raise ValueError("empty maze")
+
+        self._codec = codec
+        self._decompress = _DECOMPRESS[codec]
+        self.perfect = bool(flags & FLAG_PERFECT)
+        self.seed = seed if flags & FLAG_SEED else None
+        start = HEADER.size + name_size
+        self.algorithm = view[HEADER.size:start].decode() or None
+        self.entry = (entry_x, entry_y)
+        self.exit = (exit_x, exit_y)
+        for point in (self.entry, self.exit):
+            if not (point[0] < self.width and point[1] < self.height):
+                raise ValueError(f"{point} is outside the maze")
+
+        self.row_bytes = (self.width + 1) // 2
+        frames = -(-self.height // self.rows_per_frame) + 1
+        self._offsets = struct.unpack_from(f"<{frames + 1}Q", view, start)
+        if list(self._offsets) != sorted(self._offsets) or (
+                self._offsets[-1] > len(view)):
+            raise ValueError("corrupt frame table")
+        self.directions = unpack_directions(self._frame(frames - 1), steps)
+
+    def _frame(self, index: int) -> bytes:
+        """Return frame index, decompressed, keeping recent frames."""
+        data = self._cached.get(index)
+        if data is None:
+            start, end = self._offsets[index:index + 2]
+            try:
+                data = self._decompress(self._view[start:end])
+            except (zlib.error, lzma.LZMAError):
+                raise ValueError(f"Corrupt frame {index} in maze file")
+            if len(self._cached) >= FRAME_CACHE:
+                del self._cached[next(iter(self._cached))]
+            self._cached[index] = data
+        return data
+
+    def _packed_row(self, y: int) -> bytes:
+        """Return the packed bytes of row y."""
+        if not 0 <= y < self.height:
+            raise IndexError("row index out of range")
+        frame, offset = divmod(y, self.rows_per_frame)
+        offset *= self.row_bytes
+        if self._codec == 0:
+            start = self._offsets[frame] + offset
+            data = self._view[start:start + self.row_bytes]
+        else:
+            data = self._frame(frame)[offset:offset + self.row_bytes]
+        if len(data) != self.row_bytes:
+            raise ValueError(f"Maze row {y} is truncated")
+        return data
+
+    def close(self) -> None:
+        """Release the memory map and the file."""
+        self._view.close()
+        self._file.close()
+
+    def walls(self, x: int, y: int) -> int:
+        """Return the wall bits of the cell (x, y)."""
+        value = self._packed_row(y)[x >> 1]
+        return (value >> 4) if x & 1 else value & 0x0F
+
+    def row(self, y: int) -> bytearray:
+        """
+        Decode one row of the maze.
+
+        Args:
+            y: Row index.
+
+        Returns:
+            One byte of wall bits per cell.
+
+        Raises:
+            IndexError: If y is outside the maze.
+            ValueError: If the row is truncated.
+        """
+        return unpack_cells(self._packed_row(y))[:self.width]
+
+    def to_grid(self) -> MazeGrid:
+        """Decode every row into a MazeGrid."""
+        return MazeGrid(
+            self.width, self.height, bytearray().join(self.rows()))
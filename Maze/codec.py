@@ -0,0 +1,154 @@
+from typing import Any, Union
+from importlib.util import find_spec
+import mmap
+
+from .grid import MazeGrid, WALLS
+
+# NumPy is only looked up here and imported on first use, so importing
+# the package stays cheap for callers that never touch the fast paths.
+HAS_NUMPY = find_spec("numpy") is not None
+
+HexData = Union[bytes, bytearray, mmap.mmap]
+
+HEX_DIGITS = b"0123456789ABCDEF"
+
+HEX_ENCODE = bytes(HEX_DIGITS[value & WALLS] for value in range(256))
+
+
+def _decode_table() -> bytes:
+    """Build the translate table from hex digits to values (0xFF if bad)."""
+    table = bytearray(b"\xff") * 256
+    for value, digit in enumerate(HEX_DIGITS):
+        table[digit] = value
+        table[ord(chr(digit).lower())] = value
+    return bytes(table)
+
+
+HEX_DECODE = _decode_table()
+
+
+def encode_row(row: Union[bytes, bytearray]) -> bytes:
+    """
+    Encode a row of cell bytes as hexadecimal digits.
+
+    Only the wall bits are kept; visited and blocked flags are dropped.
+
+    Args:
+        row: One byte per cell (N=1, E=2, S=4, W=8 wall bits).
+
+    Returns:
+        One ASCII hex digit per cell.
+    """
+    return bytes(row.translate(HEX_ENCODE))
+
+
+def decode_row(line: Union[bytes, bytearray]) -> bytearray:
+    """
+    Decode a line of hexadecimal digits into cell bytes.
+
+    Args:
+        line: One ASCII hex digit per cell, without the newline.
+
+    Returns:
+        One byte per cell holding its wall bits.
+
+    Raises:
+        ValueError: If the line contains a non-hexadecimal character.
+    """
+    row = bytearray(line.translate(HEX_DECODE))
+    if 0xFF in row:
+        raise ValueError(f"Invalid hexadecimal maze row: {line!r}")
+    return row
+
+
+def wall_array(grid: MazeGrid) -> Any:
+    """
+    Return a NumPy uint8 view of the grid, shaped (height, width).
+
+    The view shares memory with grid.cells, so writes go to the maze.
+
+    Args:
+        grid: Packed maze grid.
+
+    Returns:
+        numpy.ndarray of dtype uint8.
+
+    Raises:
+        ImportError: If NumPy is not installed.
+    """
+    if not HAS_NUMPY:
+        raise ImportError("NumPy is required for wall_array()")
+    import numpy
+    return numpy.frombuffer(grid.cells, dtype=numpy.uint8).reshape(
+        grid.height, grid.width)
+
+
+def encode_grid(grid: MazeGrid) -> bytes:
+    """
+    Encode the whole grid as hexadecimal rows, one line per row.
+
+    Uses one vectorized NumPy table lookup when NumPy is available,
+    otherwise a single bytes.translate over the packed storage.
+
+    Args:
+        grid: Packed maze grid.
+
+    Returns:
+        ASCII hex rows, each terminated by a newline.
+    """
+    width = grid.width
+    if HAS_NUMPY and grid.cells:
+        import numpy
+        lut = numpy.frombuffer(HEX_ENCODE, dtype=numpy.uint8)
+        out = numpy.empty((grid.height, width + 1), dtype=numpy.uint8)
+        out[:, :width] = lut[wall_array(grid)]
+        out[:, width] = ord("\n")
+        return bytes(out.tobytes())
+
+    digits = grid.cells.translate(HEX_ENCODE)
+    return b"".join(
+        [digits[start:start + width] + b"\n"
+         for start in range(0, len(digits), width)]
+    )
+
+
+def decode_grid(data: Union[bytes, bytearray]) -> MazeGrid:
+    """
+    Decode hexadecimal rows, as written by encode_grid, into a grid.
+
+    Args:
+        data: ASCII hex rows separated by newlines, without the trailer.
+
+    Returns:
+        A new MazeGrid holding the wall bits.
+
+    Raises:
+        ValueError: If rows have different lengths or contain a
+            non-hexadecimal character.
+    """
+    data = bytes(data).rstrip(b"\n")
+    if not data:
+        return MazeGrid(0, 0)
+    width = data.index(b"\n") if b"\n" in data else len(data)
+    height = data.count(b"\n") + 1
+    if len(data) != height * (width + 1) - 1:
+        raise ValueError("Maze rows have different lengths")
+
+    if HAS_NUMPY:
+        import numpy
+        lut = numpy.frombuffer(HEX_DECODE, dtype=numpy.uint8)
+        rows = numpy.frombuffer(data + b"\n", dtype=numpy.uint8)
+        rows = rows.reshape(height, width + 1)
+        if (rows[:, width] != ord("\n")).any():
+            raise ValueError("Maze rows have different lengths")
+        values = lut[rows[:, :width]]
+        if (values == 0xFF).any():
+            raise ValueError("Invalid hexadecimal digit in maze rows")
+        return MazeGrid(width, height, bytearray(values.tobytes()))
+
+    cells = bytearray(data.translate(HEX_DECODE, b"\n"))
+    if len(cells) != width * height:
+        raise ValueError("Maze rows have different lengths")
+    if 0xFF in cells:
+        raise ValueError("Invalid hexadecimal digit in maze rows")
+    return MazeGrid(width, height, cells)
@@ -0,0 +1,160 @@
+from typing import List, Tuple
+from array import array
+
+from .grid import MazeGrid, NORTH, EAST, SOUTH, WEST
+
+Point = Tuple[int, int]
+
+
+class DistanceField:
+    """
+    BFS distances and parents from one source cell, computed once.
+
+    The whole reachable area is explored in one O(cells) pass and kept
+    as two integer arrays, after which the distance to any cell is an
+    O(1) lookup and the path to it an O(path length) walk up the parent
+    array. A field from the exit gives every cell its hint direction.
+
+    Attributes:
+        width: Maze width in cells.
+        height: Maze height in cells.
+        source: Source cell as (x, y).
+        distance: Steps from the source per cell index, -1 when the
+            cell cannot be reached.
+        parents: Index of the previous cell on a shortest path from
+            the source, -1 when unreachable (the source is its own
+            parent).
+        farthest: Index of a reachable cell farthest from the source.
+        max_distance: Distance of that cell.
+    """
+
+    def __init__(self, grid: MazeGrid, source: Point) -> None:
+        """
+        Run the BFS from source over the whole maze.
+
+        Args:
+            grid: Maze grid.
+            source: Starting cell as (x, y) coordinates.
+
+        Raises:
+            ValueError: If source is outside the maze.
+        """
+        self.width = grid.width
+        self.height = grid.height
+        self.source = source
+        start = self._index(*source)
+
+        cells = grid.cells
+        w = self.width
+        last_row = (self.height - 1) * w
+        distance = array('i', [-1]) * len(cells)
+        parents = array('i', [-1]) * len(cells)
+        distance[start] = 0
+        parents[start] = start
+        frontier = [start]
+        step = 0
+        i = start
+
+        while frontier:
+            step += 1
+            level: List[int] = []
+            push = level.append
+
+            for i in frontier:
+                walls = cells[i]
+                x = i % w
+
+                if not walls & NORTH and i >= w and parents[i - w] < 0:
+                    parents[i - w] = i
+                    distance[i - w] = step
+                    push(i - w)
+
+                if not walls & SOUTH and i < last_row and parents[i + w] < 0:
+                    parents[i + w] = i
+                    distance[i + w] = step
+                    push(i + w)
+
+                if not walls & WEST and x > 0 and parents[i - 1] < 0:
+                    parents[i - 1] = i
+                    distance[i - 1] = step
+                    push(i - 1)
+
+                if not walls & EAST and x < w - 1 and parents[i + 1] < 0:
+                    parents[i + 1] = i
+                    distance[i + 1] = step
+                    push(i + 1)
+
+            frontier = level
+
+        self.distance = distance
+        self.parents = parents
+        self.farthest = i
+        self.max_distance = distance[i]
+
+    def _index(self, x: int, y: int) -> int:
+        """Return the index of cell (x, y), checking the bounds."""
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            raise ValueError(f"Cell ({x}, {y}) is outside the maze.")
+        return y * self.width + x
+
+    def distance_to(self, x: int, y: int) -> int:
+        """
+        Return the number of steps from the source to a cell.
+
+        Args:
+            x: X coordinate of the cell.
+            y: Y coordinate of the cell.
+
+        Returns:
+            The distance, or -1 if the cell cannot be reached.
+        """
+        return self.distance[self._index(x, y)]
+
+    def path_to(self, x: int, y: int) -> List[Point]:
+        """
+        Return a shortest path from the source to a cell.
+
+        Args:
+            x: X coordinate of the target cell.
+            y: Y coordinate of the target cell.
+
+        Returns:
+            List of (x, y) tuples from the source to the target, empty
+            if the target cannot be reached.
+        """
+        i = self._index(x, y)
+        parents = self.parents
+        if parents[i] < 0:
+            return []
+        w = self.width
+        path = [(x, y)]
+        while parents[i] != i:
+            i = parents[i]
+            path.append((i % w, i // w))
+        path.reverse()
+        return path
+
+    def hint(self, x: int, y: int) -> str:
+        """
+        Return the direction of the first step from a cell to the source.
+
+        With a field built from the exit, this is the move that brings a
+        player closer to the exit.
+
+        Args:
+            x: X coordinate of the cell.
+            y: Y coordinate of the cell.
+
+        Returns:
+            'N', 'E', 'S' or 'W', or an empty string at the source and on
+            unreachable cells.
+        """
+        i = self._index(x, y)
+        j = self.parents[i]
+        if j < 0 or j == i:
+            return ""
+        if j == i - self.width:
+            return "N"
+        if j == i + self.width:
+            return "S"
+        return "W" if j == i - 1 else "E"
@@ -1,35 +1,114 @@
-from typing import Any, List, Tuple, Optional, Dict
+from typing import (
+    TYPE_CHECKING, Any, Callable, Dict, FrozenSet, Iterator, List, Tuple,
+    Optional,
+)
+from collections import deque
 import random
 
+from .grid import (
+    CarveEvent, Cell, MazeGrid, MazeLike, as_grid,
+    NORTH, EAST, SOUTH, WEST, WALLS, VISITED, BLOCKED,
+)
+from .codec import HAS_NUMPY, encode_grid
+from .algorithms import kruskal, prim, wilson, eller, binary_tree
+
+# The file formats, solvers and statistics are imported where they are
+# used, so that `import Maze` only loads what generation needs.
+if TYPE_CHECKING:
+    from .solvers import SolveResult
+    from .distance import DistanceField
+    from .profiling import GenerationProfile
+
+__all__ = [
+    "Cell", "MazeGenerator", "ALGORITHMS", "STEPPERS", "register_algorithm",
+]
+
+FORTY_TWO_PATTERN = (
+    (0, 0), (0, 1), (0, 2),
+    (1, 2),
+    (2, 0), (2, 1), (2, 2), (2, 3), (2, 4),
+
+    (4, 0), (5, 0), (6, 0),
+    (6, 1),
+    (4, 2), (5, 2), (6, 2),
+    (4, 3),
+    (4, 4), (5, 4), (6, 4),
+)
+
+
+def forty_two_cells(
+    width: int,
+    height: int
+) -> Tuple[Tuple[int, int], ...]:
+    """
+    Compute the cells of the '42' pattern centered in a maze.
+
+    Args:
+        width: Maze width in cells.
+        height: Maze height in cells.
 
-class Cell:
+    Returns:
+        Pattern coordinates in pattern order, or an empty tuple if the
+        maze is too small (under 11x8) to hold the pattern.
     """
-    Represents a single cell in the maze grid.
+    mheight = 8
+    mwidth = 11
+
+    if height < mheight or width < mwidth:
+        return ()
+
+    start_x = (width - 7) // 2
+    start_y = (height - 5) // 2
+    return tuple((start_x + x, start_y + y) for x, y in FORTY_TWO_PATTERN)
+
+
+_OPEN_EAST_SOUTH = bytes(
+    (not value & EAST) + (not value & SOUTH) for value in range(256))
+
+
+_DIRECTION_SUBSETS = tuple(
+    tuple(d for d in range(4) if free >> d & 1) for free in range(16))
+
+_DIRECTION_WALLS = (NORTH, SOUTH, WEST, EAST)
+
 
-    Each cell has four walls (north, east, south, west) and a visited flag
-    used during maze generation.
+def carved_walls(grid: MazeGrid) -> Iterator[CarveEvent]:
     """
+    List the open interior walls of a maze in cell order.
 
-    def __init__(self) -> None:
-        """Initialize a cell with all walls closed and not visited."""
-        self.north = True
-        self.east = True
-        self.south = True
-        self.west = True
-        self.visited = False
+    Replays a maze carved by an engine without steps, so that it can
+    be watched or streamed like a stepped one.
+
+    Args:
+        grid: Maze grid.
+
+    Yields:
+        (i, EAST) and (i, SOUTH) for every open wall, row by row.
+    """
+    cells = grid.cells
+    width = grid.width
+    last_row = len(cells) - width
+    for i, walls in enumerate(cells):
+        if not walls & EAST and (i + 1) % width:
+            yield i, EAST
+        if not walls & SOUTH and i < last_row:
+            yield i, SOUTH
 
 
 class MazeGenerator:
     """
-    Generate a maze using depth-first search algorithm.
+    Generate a maze using depth-first search or a registered algorithm.
 
     Generates either perfect mazes (single path between entry and exit)
-    or random mazes with multiple loops using recursive backtracking.
+    or random mazes with multiple loops. The carving algorithm is picked
+    by name from ALGORITHMS (DFS by default).
     """
 
     def __init__(
         self,
-        config: dict[str, Any]
+        config: dict[str, Any],
+        maze: Optional[MazeGrid] = None,
+        rng: Optional[random.Random] = None
     ) -> None:
         """
         Initialize the maze generator with configuration parameters.
@@ -42,6 +121,12 @@ class MazeGenerator:
                 EXIT (tuple): Exit point (x, y).
                 PERFECT (bool): Generate perfect maze.
                 SEED (int or None): Random seed.
+                ALGORITHM (str, optional): Name of the carving algorithm.
+            maze: Existing grid to use instead of a fresh, fully walled
+                one.
+            rng: Random number generator to draw from. Defaults to a
+                new random.Random seeded with SEED, owned by this
+                generator, so generators never share random state.
         """
         self.config = config
         self.perfect = config['PERFECT']
@@ -49,14 +134,90 @@ class MazeGenerator:
         self.width = config['WIDTH']
         self.entry_x, self.entry_y = config['ENTRY']
         self.exit_x, self.exit_y = config['EXIT']
-        self.forty_two: List[Tuple[int, int]] = []
-        if config['SEED'] is not None:
-            random.seed(config['SEED'])
+        self.forty_two_pos: FrozenSet[Tuple[int, int]] = frozenset()
+        self._forty_two: Tuple[Tuple[int, int], ...] = ()
+        self.stored_path: Optional[List[Tuple[int, int]]] = None
+        self.profile: Optional["GenerationProfile"] = None
+        self.version = 0
+        self._cache: Dict[Tuple[Any, ...], Any] = {}
+        if rng is None:
+            rng = random.Random(config['SEED'])
+        self.rng = rng
+
+        if maze is None:
+            maze = MazeGrid(self.width, self.height)
+        self.maze = maze
+        self._cache_version = self._version_key()
+
+    @classmethod
+    def from_file(
+        cls,
+        path: str,
+        validate: bool = True
+    ) -> "MazeGenerator":
+        """
+        Load a maze written by export_to.
+
+        Both the hex and the binary format are read (the format is told
+        by the file's first bytes). The file is memory-mapped and decoded
+        in one pass. The stored path is kept in stored_path, so
+        solution() does not solve the maze again. PERFECT, SEED and
+        ALGORITHM come from the binary header; for hex files PERFECT is
+        inferred from the number of passages and SEED is None. The '42'
+        cells are marked blocked when they are fully walled.
 
-        self.maze = [
-            [Cell() for _ in range(self.width)]
-            for _ in range(self.height)
-        ]
+        Args:
+            path: Path of the maze file.
+            validate: Check wall coherence and the stored path.
+
+        Returns:
+            A generator holding the loaded maze, with OUTPUT_FILE set
+            to path and FORMAT set to the format read.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            PermissionError: If permission denied when reading the file.
+            ValueError: If the file is malformed or incoherent.
+        """
+        from .binary import BinaryMazeFile, is_binary_file
+        from .loader import MazeFile
+
+        binary = is_binary_file(path)
+        reader = BinaryMazeFile if binary else MazeFile
+        with reader(path) as maze_file:
+            if validate:
+                maze_file.validate()
+            stored_path = maze_file.path(check=validate)
+            grid = maze_file.to_grid()
+            config: Dict[str, Any] = {
+                'WIDTH': grid.width,
+                'HEIGHT': grid.height,
+                'ENTRY': maze_file.entry,
+                'EXIT': maze_file.exit,
+                'OUTPUT_FILE': path,
+                'PERFECT': maze_file.perfect,
+                'SEED': maze_file.seed,
+                'FORMAT': "BINARY" if binary else "HEX",
+            }
+            if maze_file.algorithm is not None:
+                config['ALGORITHM'] = maze_file.algorithm
+
+        cells = grid.cells
+        if config['PERFECT'] is None:
+            passages = sum(cells.translate(_OPEN_EAST_SOUTH))
+            config['PERFECT'] = (
+                passages == len(cells) - cells.count(WALLS) - 1)
+        gen = cls(config, grid)
+        gen.stored_path = stored_path
+
+        pattern = forty_two_cells(grid.width, grid.height)
+        if all(cells[grid.index(x, y)] == WALLS for x, y in pattern):
+            gen._forty_two = pattern
+            gen.forty_two_pos = frozenset(pattern)
+            for x, y in pattern:
+                cells[grid.index(x, y)] |= VISITED | BLOCKED
+
+        return gen
 
     def neighbors(
         self,
@@ -73,17 +234,20 @@ class MazeGenerator:
         Returns:
             List of tuples (x, y, direction) for each unvisited neighbor.
         """
+        cells = self.maze.cells
+        width = self.width
+        i = y * width + x
         directions = []
-        if y > 0 and not self.maze[y-1][x].visited:
+        if y > 0 and not cells[i - width] & VISITED:
             directions.append((x, y-1, 'north'))
 
-        if y < self.height - 1 and not self.maze[y+1][x].visited:
+        if y < self.height - 1 and not cells[i + width] & VISITED:
             directions.append((x, y+1, 'south'))
 
-        if x > 0 and not self.maze[y][x-1].visited:
+        if x > 0 and not cells[i - 1] & VISITED:
             directions.append((x-1, y, 'west'))
 
-        if x < self.width - 1 and not self.maze[y][x+1].visited:
+        if x < width - 1 and not cells[i + 1] & VISITED:
             directions.append((x+1, y, 'east'))
 
         return directions
@@ -107,21 +271,41 @@ class MazeGenerator:
             y2: Y coordinate of the second cell.
             direction: Wall to remove: 'north', 'south', 'east', 'west'.
         """
+        cells = self.maze.cells
+        i1 = y1 * self.width + x1
+        i2 = y2 * self.width + x2
         if direction == 'north':
-            self.maze[y1][x1].north = False
-            self.maze[y2][x2].south = False
+            cells[i1] &= ~NORTH
+            cells[i2] &= ~SOUTH
 
         elif direction == 'south':
-            self.maze[y1][x1].south = False
-            self.maze[y2][x2].north = False
+            cells[i1] &= ~SOUTH
+            cells[i2] &= ~NORTH
 
         elif direction == 'west':
-            self.maze[y1][x1].west = False
-            self.maze[y2][x2].east = False
+            cells[i1] &= ~WEST
+            cells[i2] &= ~EAST
 
         elif direction == 'east':
-            self.maze[y1][x1].east = False
-            self.maze[y2][x2].west = False
+            cells[i1] &= ~EAST
+            cells[i2] &= ~WEST
+
+        self.mark_changed()
+
+    def mark_changed(self) -> None:
+        """
+        Record that the walls of the maze changed.
+
+        Bumps version, which drops the solutions cached by solve() and
+        the fields cached by distance_field(), and
+        forgets the path stored in a loaded file. remove_wall(),
+        generate(), carve_steps() and add_loops() call it, and wall
+        changes through maze[y][x] or maze.open_wall() count too (see
+        MazeGrid.version); code that edits maze.cells directly must
+        call it.
+        """
+        self.version += 1
+        self.stored_path = None
 
     def place_forty_two(
         self
@@ -135,197 +319,539 @@ class MazeGenerator:
             True if pattern was successfully placed, False if maze
             is too small.
         """
-        mheight = 8
-        mwidth = 11
-
-        if self.height < mheight or self.width < mwidth:
+        self._forty_two = forty_two_cells(self.width, self.height)
+        if not self._forty_two:
             return False
+        self.forty_two_pos = frozenset(self._forty_two)
 
-        pattern = [
-            (0, 0), (0, 1), (0, 2),
-            (1, 2),
-            (2, 0), (2, 1), (2, 2), (2, 3), (2, 4),
+        return True
 
-            (4, 0), (5, 0), (6, 0),
-            (6, 1),
-            (4, 2), (5, 2), (6, 2),
-            (4, 3),
-            (4, 4), (5, 4), (6, 4),
-        ]
+    @property
+    def forty_two(self) -> List[Tuple[int, int]]:
+        """
+        Coordinates of the '42' pattern cells, in pattern order.
 
-        start_x = (self.width - 7) // 2
-        start_y = (self.height - 5) // 2
-        self.forty_two = [(start_x + x, start_y + y) for x, y in pattern]
+        Kept for backward compatibility; use forty_two_pos (frozenset)
+        or the BLOCKED bit of the grid for membership tests.
+        """
+        return list(self._forty_two)
 
-        return True
+    def _carving_tables(self) -> Tuple[
+            Tuple[int, ...], Tuple[int, ...], Tuple[int, ...]]:
+        """
+        Return the per-direction tables used by dfs() and bfs().
+
+        Directions are coded 0=north, 1=south, 2=west, 3=east, the
+        order neighbors() reports them in.
+
+        Returns:
+            Index offset of the neighbour, mask keeping every bit but
+            the wall crossed, and the same mask for the opposite wall
+            of the neighbour.
+        """
+        width = self.width
+        return (
+            (-width, width, -1, 1),
+            (0xFF ^ NORTH, 0xFF ^ SOUTH, 0xFF ^ WEST, 0xFF ^ EAST),
+            (0xFF ^ SOUTH, 0xFF ^ NORTH, 0xFF ^ EAST, 0xFF ^ WEST),
+        )
 
     def dfs(self) -> None:
         """Generate maze using depth-first search algorithm."""
-        stack = []
-        self.maze[self.entry_y][self.entry_x].visited = True
-        stack.append((self.entry_x, self.entry_y))
+        deque(self.dfs_steps(), maxlen=0)
 
-        while stack:
-            x, y = stack[-1]
-            neighbors = self.neighbors(x, y)
+    def dfs_steps(self) -> Iterator[CarveEvent]:
+        """
+        Carve the maze by depth-first search, one wall at a time.
+
+        Runs on cell indices and direction codes: the unvisited
+        neighbours form a 4-bit mask that selects a prebuilt tuple of
+        directions, and walls are cleared through lookup tables, so no
+        per-step objects are built.
+        The random draws are the same as with neighbors() and
+        random.choice, so a SEED gives the same maze as before.
+
+        While generate() runs with a profile, the peak stack size is
+        recorded as its max_stack_depth counter.
 
-            if neighbors:
-                nx, ny, direction = random.choice(neighbors)
-                self.remove_wall(x, y, nx, ny, direction)
+        Yields:
+            (i, wall) after opening that wall (NORTH, EAST, SOUTH or
+            WEST) of cell i.
+        """
+        profile = self.profile
+        measure = profile is not None
+        depth = 1
+        cells = self.maze.cells
+        width = self.width
+        size = len(cells)
+        last_x = width - 1
+        offset, keep, keep_opposite = self._carving_tables()
+        choice = self.rng.choice
+        subsets = _DIRECTION_SUBSETS
+        bits = _DIRECTION_WALLS
+
+        start = self.maze.index(self.entry_x, self.entry_y)
+        cells[start] |= VISITED
+        stack = [start]
+        push = stack.append
+        pop = stack.pop
 
-                self.maze[ny][nx].visited = True
-                stack.append((nx, ny))
+        while stack:
+            i = stack[-1]
+            x = i % width
+            free = 0
+            if i >= width and not cells[i - width] & VISITED:
+                free = 1
+            if i + width < size and not cells[i + width] & VISITED:
+                free |= 2
+            if x > 0 and not cells[i - 1] & VISITED:
+                free |= 4
+            if x < last_x and not cells[i + 1] & VISITED:
+                free |= 8
+
+            if free:
+                d = choice(subsets[free])
+                j = i + offset[d]
+                cells[i] &= keep[d]
+                cells[j] = (cells[j] & keep_opposite[d]) | VISITED
+                push(j)
+                if measure and len(stack) > depth:
+                    depth = len(stack)
+                yield i, bits[d]
             else:
-                stack.pop()
+                pop()
+
+        if profile is not None:
+            profile.counters["max_stack_depth"] = depth
 
     def bfs(self) -> None:
         """Generate maze using breadth-first search algorithm."""
-        queue = [(self.entry_x, self.entry_y)]
-        self.maze[self.entry_y][self.entry_x].visited = True
+        deque(self.bfs_steps(), maxlen=0)
 
-        while queue:
-            x, y = queue.pop(0)
-            neighbors = self.neighbors(x, y)
-            random.shuffle(neighbors)
+    def bfs_steps(self) -> Iterator[CarveEvent]:
+        """
+        Carve the maze by breadth-first search, one wall at a time.
 
-            for nx, ny, direction in neighbors:
-                self.remove_wall(x, y, nx, ny, direction)
-                self.maze[ny][nx].visited = True
-                queue.append((nx, ny))
+        Uses the same index and direction tables as dfs_steps(),
+        shuffling the neighbour buffer in place with the draws
+        random.shuffle would make. While generate() runs with a
+        profile, the peak queue size is recorded as its frontier_peak
+        counter.
+
+        Yields:
+            (i, wall) after opening that wall of cell i.
+        """
+        profile = self.profile
+        measure = profile is not None
+        peak = 1
+        cells = self.maze.cells
+        width = self.width
+        size = len(cells)
+        last_x = width - 1
+        offset, keep, keep_opposite = self._carving_tables()
+        randrange = self.rng.randrange
+        found = [0, 0, 0, 0]
+        bits = _DIRECTION_WALLS
+
+        start = self.maze.index(self.entry_x, self.entry_y)
+        cells[start] |= VISITED
+        queue = deque((start,))
+        push = queue.append
+        pop = queue.popleft
+
+        while queue:
+            i = pop()
+            x = i % width
+            n = 0
+            if i >= width and not cells[i - width] & VISITED:
+                found[0] = 0
+                n = 1
+            if i + width < size and not cells[i + width] & VISITED:
+                found[n] = 1
+                n += 1
+            if x > 0 and not cells[i - 1] & VISITED:
+                found[n] = 2
+                n += 1
+            if x < last_x and not cells[i + 1] & VISITED:
+                found[n] = 3
+                n += 1
+
+            for k in range(n - 1, 0, -1):
+                r = randrange(k + 1)
+                found[k], found[r] = found[r], found[k]
+
+            for k in range(n):
+                d = found[k]
+                j = i + offset[d]
+                cells[i] &= keep[d]
+                cells[j] = (cells[j] & keep_opposite[d]) | VISITED
+                push(j)
+                yield i, bits[d]
+            if measure and len(queue) > peak:
+                peak = len(queue)
+
+        if profile is not None:
+            profile.counters["frontier_peak"] = peak
 
     def generate(
         self,
         other_algorithm: Optional[bool] = False,
+        algorithm: Optional[str] = None,
+        export: bool = True,
+        profile: Optional["GenerationProfile"] = None,
     ) -> None:
         """
-        Generate the maze using DFS or BFS algorithm.
+        Generate the maze with the selected algorithm.
 
         Args:
             other_algorithm: If True, use BFS; if False, use DFS.
+            algorithm: Name of a registered algorithm (see ALGORITHMS).
+                Takes precedence over other_algorithm. Defaults to the
+                ALGORITHM config key, then to DFS.
+            export: Write the maze to OUTPUT_FILE when done.
+            profile: Collects phase timings and counters when given
+                (see Maze.profiling.GenerationProfile). It is also set
+                as self.profile while the engine runs, so engines can
+                record their own counters. Profiling is off, and costs
+                nothing, when None.
 
         For perfect mazes: generates a spanning tree with single path
         between entry and exit.
-        For random mazes: adds random loops respecting the 2-cell max
-        corridor width.
+        For random mazes: adds LOOPS random loops (see add_loops)
+        respecting the 2-cell max corridor width.
+
+        Raises:
+            Exception: If maze is too small to place '42' pattern.
+            ValueError: If the algorithm name is unknown.
+        """
+        engine = ALGORITHMS[self._prepare(other_algorithm, algorithm, profile)]
+
+        if profile is None:
+            engine(self)
+            if not self.perfect:
+                self.add_loops()
+            if export:
+                self.export()
+            return
+
+        self.profile = profile
+        try:
+            with profile.phase("carve"):
+                engine(self)
+        finally:
+            self.profile = None
+        profile.count_carving(self.maze, (self.entry_x, self.entry_y))
+        if not self.perfect:
+            with profile.phase("loops"):
+                opened = self.add_loops()
+            profile.counters["loops_opened"] = opened
+            profile.counters["walls_removed"] += opened
+        if export:
+            with profile.phase("solve"):
+                path = self.solution()
+                expanded = self.solve()[1]
+            profile.counters["solver_expanded"] = expanded
+            stats = None
+            if self.config.get('STATS'):
+                with profile.phase("stats"):
+                    stats = self.stats()
+            with profile.phase("export"):
+                MazeGenerator.export_to(self.maze, self.config, path, stats)
+
+    def carve_steps(
+        self,
+        algorithm: Optional[str] = None,
+        other_algorithm: Optional[bool] = False,
+    ) -> Iterator[CarveEvent]:
+        """
+        Generate the maze step by step, yielding each wall opened.
+
+        Places the '42' pattern right away, so errors are raised by the
+        call itself, then returns an iterator that carves as it is
+        consumed. Algorithms registered with steps (see STEPPERS) run
+        live; the others carve on the first step and then replay their
+        walls in cell order (see carved_walls). Loops follow for
+        imperfect mazes. Once exhausted, the maze is the one generate()
+        builds with the same SEED and cached solutions are dropped;
+        nothing is exported (see export()).
+
+        Events are (i, wall) tuples of ints: the index y * WIDTH + x of
+        a cell and the NORTH, EAST, SOUTH or WEST bit opened on it; the
+        neighbour behind that wall loses the opposite wall. Consuming
+        them in bulk, e.g. with collections.deque(steps, maxlen=0),
+        costs about as much as generate().
+
+        Args:
+            algorithm: Name of a registered algorithm (see ALGORITHMS),
+                as for generate().
+            other_algorithm: If True and no algorithm is given, use BFS.
+
+        Returns:
+            Iterator of carve events.
 
         Raises:
             Exception: If maze is too small to place '42' pattern.
+            ValueError: If the algorithm name is unknown.
+        """
+        name = self._prepare(other_algorithm, algorithm)
+        return self._carve(ALGORITHMS[name], STEPPERS.get(name))
+
+    def _carve(
+        self,
+        engine: Callable[["MazeGenerator"], None],
+        stepper: Optional[Callable[["MazeGenerator"], Iterator[CarveEvent]]]
+    ) -> Iterator[CarveEvent]:
+        """Run the carving and loop stages of carve_steps()."""
+        from .loops import free_cells, loop_count, loop_steps
+
+        if stepper is not None:
+            yield from stepper(self)
+        else:
+            engine(self)
+            yield from carved_walls(self.maze)
+        if not self.perfect:
+            self.mark_changed()
+            count = loop_count(self.config, free_cells(self.maze))
+            yield from loop_steps(self.maze, count, self.rng)
+        self.mark_changed()
+
+    def _prepare(
+        self,
+        other_algorithm: Optional[bool],
+        algorithm: Optional[str],
+        profile: Optional["GenerationProfile"] = None
+    ) -> str:
+        """
+        Pick the carving algorithm and lay out the '42' cells.
+
+        Shared by generate() and carve_steps(); see generate() for the
+        arguments and errors.
+
+        Returns:
+            The upper-case name of the algorithm, a key of ALGORITHMS.
         """
+        if algorithm is None:
+            if other_algorithm:
+                algorithm = "BFS"
+            else:
+                algorithm = self.config.get("ALGORITHM", "DFS")
+        name = str(algorithm).upper()
+        if name not in ALGORITHMS:
+            raise ValueError(f"Unknown algorithm: {algorithm}")
 
-        if not self.place_forty_two():
-            self.forty_two = []
+        if profile is None:
+            placed = self.place_forty_two()
+        else:
+            with profile.phase("forty_two"):
+                placed = self.place_forty_two()
+        if not placed:
+            self._forty_two = ()
+            self.forty_two_pos = frozenset()
             raise Exception(
                 "Error: Maze too small to place the '42' pattern.")
 
-        if (self.entry_x, self.entry_y) in self.forty_two:
+        if (self.entry_x, self.entry_y) in self.forty_two_pos:
             raise ValueError("Entry on 42")
 
-        if (self.exit_x, self.exit_y) in self.forty_two:
+        if (self.exit_x, self.exit_y) in self.forty_two_pos:
             raise ValueError("Exit on 42")
 
-        for x, y in self.forty_two:
-            self.maze[y][x].visited = True
+        self.mark_changed()
+        cells = self.maze.cells
+        for x, y in self.forty_two_pos:
+            cells[self.maze.index(x, y)] |= VISITED | BLOCKED
+        return name
 
-        if other_algorithm:
-            self.bfs()
-        else:
-            self.dfs()
+    def export(self) -> None:
+        """
+        Write the maze to OUTPUT_FILE with its solution.
 
-        if not self.perfect:
-            for row in self.maze:
-                for cell in row:
-                    cell.visited = False
+        Also writes the statistics sidecar when STATS is set.
+
+        Raises:
+            ValueError: If FORMAT, COMPRESSION or SOLVER is unknown.
+            FileNotFoundError: If output file path is invalid.
+            PermissionError: If permission denied when writing file.
+        """
+        MazeGenerator.export_to(
+            self.maze, self.config, self.solution(),
+            self.stats() if self.config.get('STATS') else None)
+
+    def solution(self) -> List[Tuple[int, int]]:
+        """
+        Return the path from entry to exit of the current maze.
+
+        Returns:
+            The path stored in the file for a loaded maze, otherwise the
+            path found by the SOLVER config key (see solve).
+        """
+        self._current_cache()
+        if self.stored_path is not None:
+            return self.stored_path
+        return self.solve()[0]
+
+    def solve(self, solver: Optional[str] = None) -> "SolveResult":
+        """
+        Solve the current maze with one of the registered solvers.
+
+        Results are cached per solver, entry and exit until the maze
+        changes (see mark_changed), so display, export and animation
+        share one solve. The returned path is shared: copy it before
+        modifying it.
+
+        Args:
+            solver: Name of a solver in Maze.solvers.SOLVERS. Defaults
+                to the SOLVER config key, then to BFS.
+
+        Returns:
+            The path from entry to exit as (x, y) tuples and the number
+            of cells the solver expanded.
+
+        Raises:
+            ValueError: If the solver is unknown.
+        """
+        from .solvers import SOLVERS
+
+        name = (solver or self.config.get('SOLVER', "BFS")).upper()
+        if name not in SOLVERS:
+            raise ValueError(f"Unknown solver: {name}")
+        cache = self._current_cache()
+        entry = (self.entry_x, self.entry_y)
+        exit = (self.exit_x, self.exit_y)
+        key = (name, entry, exit)
+        result: Optional["SolveResult"] = cache.get(key)
+        if result is None:
+            result = SOLVERS[name](self.maze, entry, exit)
+            cache[key] = result
+        return result
+
+    def distance_field(
+        self,
+        source: Optional[Tuple[int, int]] = None
+    ) -> "DistanceField":
+        """
+        Return the BFS distances and parents from a source cell.
+
+        The field is computed once per source and cached until the maze
+        changes, so any number of distance, path and hint queries cost
+        one BFS in total.
+
+        Args:
+            source: Source cell as (x, y). Defaults to the entry; use
+                the exit to get hint directions towards it.
+
+        Returns:
+            The DistanceField of the current maze from source.
+
+        Raises:
+            ValueError: If source is outside the maze.
+        """
+        from .distance import DistanceField
+
+        if source is None:
+            source = (self.entry_x, self.entry_y)
+        cache = self._current_cache()
+        key = ("FIELD", source)
+        field: Optional[DistanceField] = cache.get(key)
+        if field is None:
+            field = DistanceField(self.maze, source)
+            cache[key] = field
+        return field
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return difficulty statistics of the current maze.
+
+        Cached until the maze changes, and built on the cached distance
+        field from the entry (see Maze.analytics.maze_stats).
 
-            loop = (self.height + self.width) - 1
+        Returns:
+            Dict of statistics: dead ends, junction histogram, solution
+            length and ratio, diameter, cyclomatic number and corridor
+            lengths.
+        """
+        from .analytics import maze_stats
+
+        entry = (self.entry_x, self.entry_y)
+        exit = (self.exit_x, self.exit_y)
+        cache = self._current_cache()
+        key = ("STATS", entry, exit)
+        stats: Optional[Dict[str, Any]] = cache.get(key)
+        if stats is None:
+            stats = maze_stats(
+                self.maze, entry, exit, self.distance_field(entry))
+            cache[key] = stats
+        return stats
+
+    def _version_key(self) -> Tuple[int, int, int]:
+        """Identify the current state of the walls for the cache."""
+        return self.version, id(self.maze), self.maze.version
+
+    def _current_cache(self) -> Dict[Tuple[Any, ...], Any]:
+        """Return the result cache, emptied if the maze changed."""
+        key = self._version_key()
+        if self._cache_version != key:
+            self.stored_path = None
+            self._cache = {}
+            self._cache_version = key
+        return self._cache
+
+    def add_loops(
+        self,
+        count: Optional[int] = None
+    ) -> int:
+        """
+        Open extra walls at random to add loops to the maze.
 
-            while loop:
-                x = random.randint(0, self.width - 1)
-                y = random.randint(0, self.height - 1)
-                if (x, y) not in self.forty_two:
-                    neighbors = self.neighbors(x, y)
+        Walls next to '42' cells stay closed and no corridor becomes
+        wider than two cells (see Maze.loops.add_loops).
 
-                    if neighbors:
-                        nx, ny, direction = random.choice(neighbors)
-                        if (nx, ny) not in self.forty_two:
-                            self.remove_wall(x, y, nx, ny, direction)
+        Args:
+            count: Number of walls to open. Defaults to the LOOPS
+                config key (a count, or a density per free cell), then
+                to WIDTH + HEIGHT - 1.
 
-                    loop -= 1
+        Returns:
+            Number of walls actually opened.
+        """
+        from .loops import add_loops, free_cells, loop_count
 
-        MazeGenerator.export_to(self.maze, self.config)
+        if count is None:
+            count = loop_count(self.config, free_cells(self.maze))
+        self.mark_changed()
+        return add_loops(self.maze, count, self.rng)
 
     @staticmethod
     def solve_maze(
-        maze: List[List[Cell]],
+        maze: MazeLike,
         w: int,
         h: int,
         entry: Tuple[int, int],
-        exit: Tuple[int, int]
+        exit: Tuple[int, int],
+        solver: str = "BFS"
     ) -> List[Tuple[int, int]]:
         """
-        Find the shortest path through the maze using BFS algorithm.
+        Find the path through the maze, by default using BFS algorithm.
 
         Args:
-            maze: 2D list of Cell objects representing the maze.
+            maze: MazeGrid (or 2D list of Cell objects) of the maze.
             w: Maze width in cells.
             h: Maze height in cells.
             entry: Starting point as (x, y) coordinates.
             exit: Destination point as (x, y) coordinates.
+            solver: Name of a solver in Maze.solvers.SOLVERS.
 
         Returns:
             List of (x, y) tuples representing the path from entry to exit.
-        """
-        entry_x, entry_y = entry
-        exit_x, exit_y = exit
-
-        visited = [
-            [False for _ in range(w)]
-            for _ in range(h)
-        ]
-
-        parents: Dict[Tuple[int, int], Tuple[int, int]] = {}
-        queue: List[Tuple[int, int]] = []
-
-        queue.append((entry_x, entry_y))
-        visited[entry_y][entry_x] = True
-
-        while queue:
-            x, y = queue.pop(0)
-
-            if (x, y) == (exit_x, exit_y):
-                break
-            cell = maze[y][x]
-
-            if (not cell.north and y > 0 and not visited[y - 1][x]):
-                visited[y-1][x] = True
-                parents[(x, y-1)] = (x, y)
-                queue.append((x, y-1))
-
-            if (not cell.south and y < h - 1 and not visited[y + 1][x]):
-                visited[y+1][x] = True
-                parents[(x, y+1)] = (x, y)
-                queue.append((x, y+1))
-
-            if (not cell.west and x > 0 and not visited[y][x-1]):
-                visited[y][x-1] = True
-                parents[(x-1, y)] = (x, y)
-                queue.append((x-1, y))
 
-            if (not cell.east and x < w-1 and not visited[y][x+1]):
-                visited[y][x+1] = True
-                parents[(x+1, y)] = (x, y)
-                queue.append((x+1, y))
-
-        path = []
-        current = exit_x, exit_y
-
-        while current in parents:
-            path.append(current)
-            current = parents[current]
-
-        path.append((entry_x, entry_y))
-        path.reverse()
+        Raises:
+            ValueError: If the solver is unknown.
+        """
+        from .solvers import SOLVERS
 
-        return path
+        if solver.upper() not in SOLVERS:
+            raise ValueError(f"Unknown solver: {solver}")
+        return SOLVERS[solver.upper()](as_grid(maze), entry, exit)[0]
 
     @staticmethod
     def solve_directions(
@@ -357,8 +883,10 @@ class MazeGenerator:
 
     @staticmethod
     def export_to(
-        maze: list[list[Cell]],
-        config: dict[str, Any]
+        maze: MazeLike,
+        config: dict[str, Any],
+        solution: Optional[List[Tuple[int, int]]] = None,
+        stats: Optional[Dict[str, Any]] = None
     ) -> None:
         """
         Export maze to a file in hexadecimal format with solution path.
@@ -368,53 +896,138 @@ class MazeGenerator:
         (1=wall closed, 0=wall open).
         Followed by entry coords, exit coords, and path as direction string.
 
+        With FORMAT=BINARY, or an OUTPUT_FILE ending in .mzb, the packed
+        binary format of write_binary is written instead. With
+        FORMAT=PNG or PPM, or an OUTPUT_FILE ending in .png or .ppm, a
+        picture of the maze and its path is written row by row (see
+        Maze.image.write_image). With STATS=True the statistics of
+        maze_stats are also written as JSON next to it (see
+        Maze.analytics.stats_path).
+
         Args:
-            maze: 2D list of Cell objects representing the maze.
+            maze: MazeGrid (or 2D list of Cell objects) of the maze.
             config: Dictionary containing OUTPUT_FILE, WIDTH, HEIGHT,
-                ENTRY, EXIT.
+                ENTRY, EXIT, optionally SOLVER, for the binary format
+                PERFECT, SEED, optionally ALGORITHM and COMPRESSION, and
+                for images optionally THEME and SCALE.
+            solution: Path to write, e.g. MazeGenerator.solution(), so
+                the maze is not solved again. Solved from config when
+                None.
+            stats: Statistics to write with STATS=True, e.g.
+                MazeGenerator.stats(). Computed when None.
 
         Raises:
+            ValueError: If FORMAT, COMPRESSION or SOLVER is unknown, or
+                SCALE is not a positive integer.
             FileNotFoundError: If output file path is invalid.
             PermissionError: If permission denied when writing file.
         """
+        from .binary import output_format, write_binary
+        from .image import IMAGE_FORMATS, write_image
+
         path = config['OUTPUT_FILE']
-        content = ""
-
-        for row in maze:
-            for cell in row:
-                cell_binary = (
-                    ("1" if cell.west else "0") +
-                    ("1" if cell.south else "0") +
-                    ("1" if cell.east else "0") +
-                    ("1" if cell.north else "0")
-                )
-                value = int(cell_binary, 2)
-                content += format(value, "X")
-            content += "\n"
-
-        content += "\n"
+        grid = as_grid(maze)
         entry_x, entry_y = config['ENTRY']
         exit_x, exit_y = config['EXIT']
-
-        content += f"{entry_x},{entry_y}\n"
-        content += f"{exit_x},{exit_y}\n"
-        path_directions = MazeGenerator.solve_directions(
-            MazeGenerator.solve_maze(
-                maze,
+        if solution is None:
+            solution = MazeGenerator.solve_maze(
+                grid,
                 config["WIDTH"],
                 config["HEIGHT"],
                 config["ENTRY"],
-                config["EXIT"]
+                config["EXIT"],
+                config.get("SOLVER", "BFS")
+            )
+        file_format = output_format(config)
+        path_directions = ""
+        if file_format not in IMAGE_FORMATS:
+            path_directions = MazeGenerator.solve_directions(solution)
+        if file_format == "BINARY":
+            write_binary(grid, config, path_directions)
+        elif file_format in IMAGE_FORMATS:
+            write_image(grid, config, solution, file_format)
+        elif file_format != "HEX":
+            raise ValueError(f"Unknown output format: {file_format}")
+        else:
+            trailer = (
+                f"\n{entry_x},{entry_y}\n"
+                f"{exit_x},{exit_y}\n"
+                f"{path_directions}\n"
             )
-        )
-        content += f"{path_directions}\n"
 
-        try:
-            with open(path, "w") as f:
-                f.write(content)
+            try:
+                with open(path, "wb") as f:
+                    f.write(encode_grid(grid))
+                    f.write(trailer.encode())
+
+            except FileNotFoundError:
+                raise FileNotFoundError(f"Error: {path} not found")
+
+            except PermissionError:
+                raise PermissionError("Error: Permission denied")
+
+        if config.get('STATS'):
+            from .analytics import maze_stats, stats_path, write_stats
+
+            if stats is None:
+                stats = maze_stats(grid, config['ENTRY'], config['EXIT'])
+            write_stats(stats_path(path), stats)
+
+
+def binary_tree_np(gen: MazeGenerator) -> None:
+    """Run Maze.vectorized.binary_tree_np, imported on first use."""
+    from .vectorized import binary_tree_np
+
+    binary_tree_np(gen)
+
 
-        except FileNotFoundError:
-            raise FileNotFoundError(f"Error: {path} not found")
+def sidewinder(gen: MazeGenerator) -> None:
+    """Run Maze.vectorized.sidewinder, imported on first use."""
+    from .vectorized import sidewinder
 
-        except PermissionError:
-            raise PermissionError("Error: Permission denied")
+    sidewinder(gen)
+
+
+ALGORITHMS: Dict[str, Callable[[MazeGenerator], None]] = {
+    "DFS": MazeGenerator.dfs,
+    "BFS": MazeGenerator.bfs,
+    "KRUSKAL": kruskal,
+    "PRIM": prim,
+    "WILSON": wilson,
+    "ELLER": eller,
+    "BINARY_TREE": binary_tree,
+}
+
+STEPPERS: Dict[str, Callable[[MazeGenerator], Iterator[CarveEvent]]] = {
+    "DFS": MazeGenerator.dfs_steps,
+    "BFS": MazeGenerator.bfs_steps,
+}
+
+if HAS_NUMPY:
+    ALGORITHMS["BINARY_TREE_NP"] = binary_tree_np
+    ALGORITHMS["SIDEWINDER"] = sidewinder
+
+
+def register_algorithm(
+    name: str,
+    engine: Callable[[MazeGenerator], None],
+    steps: Optional[Callable[[MazeGenerator], Iterator[CarveEvent]]] = None
+) -> None:
+    """
+    Register a carving algorithm under a name usable by generate().
+
+    The engine receives the generator after the '42' cells have been
+    marked visited and blocked, and must open walls in gen.maze so that
+    every other cell is connected (a spanning tree for perfect mazes).
+
+    Args:
+        name: Algorithm name (case-insensitive), e.g. for ALGORITHM=.
+        engine: Callable taking the MazeGenerator to carve.
+        steps: Optional generator function carving the same maze one
+            wall at a time, used by carve_steps() (see STEPPERS).
+    """
+    ALGORITHMS[name.upper()] = engine
+    if steps is not None:
+        STEPPERS[name.upper()] = steps
+    else:
+        STEPPERS.pop(name.upper(), None)
@@ -0,0 +1,362 @@
+from typing import Iterator, List, Optional, Sequence, Tuple, Union
+
+NORTH = 1
+EAST = 2
+SOUTH = 4
+WEST = 8
+WALLS = NORTH | EAST | SOUTH | WEST
+VISITED = 16
+BLOCKED = 32
+
+CarveEvent = Tuple[int, int]
+
+DEGREE = bytes(4 - bin(value & WALLS).count("1") for value in range(256))
+
+
+def open_neighbors(cells: bytearray, width: int, i: int) -> List[int]:
+    """
+    Return the cells reachable from cell i of a packed grid.
+
+    Border walls are always closed, so no bounds check is needed.
+
+    Args:
+        cells: Packed grid storage.
+        width: Maze width in cells.
+        i: Storage offset of the cell.
+
+    Returns:
+        Indices of the open neighbours, in north, south, west, east
+        order.
+    """
+    walls = cells[i]
+    found = []
+    if not walls & NORTH:
+        found.append(i - width)
+    if not walls & SOUTH:
+        found.append(i + width)
+    if not walls & WEST:
+        found.append(i - 1)
+    if not walls & EAST:
+        found.append(i + 1)
+    return found
+
+
+def bit_table(bit: int, value: int = 1) -> bytes:
+    """Translate table: value for a cell byte with bit set, else 0."""
+    return bytes(value if cell & bit else 0 for cell in range(256))
+
+
+def and_bytes(a: bytes, b: bytes) -> bytes:
+    """Bytewise AND of two byte strings of the same length."""
+    value = int.from_bytes(a, "little") & int.from_bytes(b, "little")
+    return value.to_bytes(len(a), "little")
+
+
+def add_bytes(a: bytes, b: bytes) -> bytes:
+    """Bytewise sum of two byte strings whose sums stay below 256."""
+    value = int.from_bytes(a, "little") + int.from_bytes(b, "little")
+    return value.to_bytes(len(a), "little")
+
+
+class Cell:
+    """
+    Represents a single cell in the maze grid.
+
+    A cell is a lightweight view over one byte of a MazeGrid: the four
+    low bits hold the walls (north, east, south, west) using the same
+    layout as the exported hexadecimal format, the fifth bit holds the
+    visited flag used during maze generation and the sixth bit marks
+    cells of the '42' pattern. Setting a wall of a cell taken from a
+    MazeGrid bumps the grid's version.
+    """
+
+    __slots__ = ("_cells", "_index", "_grid")
+
+    def __init__(
+        self,
+        cells: Optional[bytearray] = None,
+        index: int = 0,
+        grid: Optional["MazeGrid"] = None
+    ) -> None:
+        """
+        Initialize a cell view.
+
+        Without arguments the cell owns its own storage, with all walls
+        closed and not visited.
+
+        Args:
+            cells: Packed grid storage the cell belongs to.
+            index: Offset of the cell inside the storage.
+            grid: Grid owning the storage, whose version wall changes
+                bump.
+        """
+        if cells is None:
+            cells = bytearray((WALLS,))
+            index = 0
+        self._cells = cells
+        self._index = index
+        self._grid = grid
+
+    def _get(self, bit: int) -> bool:
+        return bool(self._cells[self._index] & bit)
+
+    def _set(self, bit: int, value: bool) -> None:
+        if value:
+            self._cells[self._index] |= bit
+        else:
+            self._cells[self._index] &= ~bit
+        if bit & WALLS and self._grid is not None:
+            self._grid.version += 1
+
+    @property
+    def north(self) -> bool:
+        return self._get(NORTH)
+
+    @north.setter
+    def north(self, value: bool) -> None:
+        self._set(NORTH, value)
+
+    @property
+    def east(self) -> bool:
+        return self._get(EAST)
+
+    @east.setter
+    def east(self, value: bool) -> None:
+        self._set(EAST, value)
+
+    @property
+    def south(self) -> bool:
+        return self._get(SOUTH)
+
+    @south.setter
+    def south(self, value: bool) -> None:
+        self._set(SOUTH, value)
+
+    @property
+    def west(self) -> bool:
+        return self._get(WEST)
+
+    @west.setter
+    def west(self, value: bool) -> None:
+        self._set(WEST, value)
+
+    @property
+    def visited(self) -> bool:
+        return self._get(VISITED)
+
+    @visited.setter
+    def visited(self, value: bool) -> None:
+        self._set(VISITED, value)
+
+    @property
+    def blocked(self) -> bool:
+        return self._get(BLOCKED)
+
+    @blocked.setter
+    def blocked(self, value: bool) -> None:
+        self._set(BLOCKED, value)
+
+    @property
+    def walls(self) -> int:
+        """Wall bits of the cell (N=1, E=2, S=4, W=8)."""
+        return self._cells[self._index] & WALLS
+
+
+class MazeRow:
+    """Read/write view over one row of a MazeGrid."""
+
+    __slots__ = ("_grid", "_offset")
+
+    def __init__(self, grid: "MazeGrid", y: int) -> None:
+        """
+        Initialize a row view.
+
+        Args:
+            grid: Grid the row belongs to.
+            y: Row index.
+        """
+        self._grid = grid
+        self._offset = y * grid.width
+
+    def __len__(self) -> int:
+        return self._grid.width
+
+    def __getitem__(self, x: int) -> Cell:
+        width = self._grid.width
+        if x < 0:
+            x += width
+        if not 0 <= x < width:
+            raise IndexError("cell index out of range")
+        return Cell(self._grid.cells, self._offset + x, self._grid)
+
+    def __iter__(self) -> Iterator[Cell]:
+        grid = self._grid
+        cells = grid.cells
+        for index in range(self._offset, self._offset + grid.width):
+            yield Cell(cells, index, grid)
+
+
+class MazeGrid:
+    """
+    Packed maze storage: one byte per cell in a single bytearray.
+
+    Cells are stored row-major, so the cell (x, y) lives at index
+    y * width + x. Indexing a grid with maze[y][x] returns a Cell view,
+    which keeps the grid usable as the list of lists it replaces.
+
+    version counts the wall changes made through Cell views and
+    open_wall, so cached results can tell the maze changed. Writes to
+    cells itself are not counted.
+    """
+
+    __slots__ = ("width", "height", "cells", "version")
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        cells: Optional[bytearray] = None
+    ) -> None:
+        """
+        Initialize a grid with all walls closed and no cell visited.
+
+        Args:
+            width: Maze width in cells.
+            height: Maze height in cells.
+            cells: Existing packed storage to wrap instead of allocating.
+
+        Raises:
+            ValueError: If the storage does not match the dimensions.
+        """
+        if cells is None:
+            cells = bytearray((WALLS,)) * (width * height)
+        elif len(cells) != width * height:
+            raise ValueError(
+                f"Grid storage holds {len(cells)} cells, "
+                f"expected {width * height}")
+        self.width = width
+        self.height = height
+        self.cells = cells
+        self.version = 0
+
+    @classmethod
+    def from_rows(
+        cls,
+        rows: Sequence[Sequence[Cell]]
+    ) -> "MazeGrid":
+        """
+        Build a packed grid from a list of lists of Cell objects.
+
+        Args:
+            rows: 2D list of Cell objects representing the maze.
+
+        Returns:
+            A new MazeGrid holding a copy of the cells.
+        """
+        height = len(rows)
+        width = len(rows[0]) if height else 0
+        grid = cls(width, height)
+        cells = grid.cells
+        index = 0
+        for row in rows:
+            for cell in row:
+                value = (
+                    (NORTH if cell.north else 0) |
+                    (EAST if cell.east else 0) |
+                    (SOUTH if cell.south else 0) |
+                    (WEST if cell.west else 0) |
+                    (VISITED if cell.visited else 0) |
+                    (BLOCKED if cell.blocked else 0)
+                )
+                cells[index] = value
+                index += 1
+        return grid
+
+    def __len__(self) -> int:
+        return self.height
+
+    def __getitem__(self, y: int) -> MazeRow:
+        if y < 0:
+            y += self.height
+        if not 0 <= y < self.height:
+            raise IndexError("row index out of range")
+        return MazeRow(self, y)
+
+    def __iter__(self) -> Iterator[MazeRow]:
+        for y in range(self.height):
+            yield MazeRow(self, y)
+
+    def index(self, x: int, y: int) -> int:
+        """Return the storage offset of the cell (x, y)."""
+        return y * self.width + x
+
+    def adjacent(self, i: int) -> List[int]:
+        """
+        Return the indices of the cells next to cell i.
+
+        Args:
+            i: Storage offset of the cell.
+
+        Returns:
+            Neighbour indices in north, south, west, east order.
+        """
+        width = self.width
+        x = i % width
+        found = []
+        if i >= width:
+            found.append(i - width)
+        if i + width < len(self.cells):
+            found.append(i + width)
+        if x > 0:
+            found.append(i - 1)
+        if x < width - 1:
+            found.append(i + 1)
+        return found
+
+    def open_wall(self, i: int, j: int) -> None:
+        """
+        Remove the wall between two adjacent cells given by index.
+
+        Args:
+            i: Storage offset of the first cell.
+            j: Storage offset of the second cell.
+        """
+        cells = self.cells
+        step = j - i
+        if step == -self.width:
+            cells[i] &= ~NORTH
+            cells[j] &= ~SOUTH
+        elif step == self.width:
+            cells[i] &= ~SOUTH
+            cells[j] &= ~NORTH
+        elif step == -1:
+            cells[i] &= ~WEST
+            cells[j] &= ~EAST
+        elif step == 1:
+            cells[i] &= ~EAST
+            cells[j] &= ~WEST
+        self.version += 1
+
+    def reset_visited(self) -> None:
+        """Clear the visited flag of every cell."""
+        self.cells[:] = self.cells.translate(_CLEAR_VISITED)
+
+
+_CLEAR_VISITED = bytes(value & ~VISITED for value in range(256))
+
+MazeLike = Union[MazeGrid, Sequence[Sequence[Cell]]]
+
+
+def as_grid(maze: MazeLike) -> MazeGrid:
+    """
+    Return maze as a MazeGrid, converting a list of Cell rows if needed.
+
+    Args:
+        maze: MazeGrid or 2D list of Cell objects.
+
+    Returns:
+        The grid itself, or a packed copy of the Cell rows.
+    """
+    if isinstance(maze, MazeGrid):
+        return maze
+    return MazeGrid.from_rows(maze)
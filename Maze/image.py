@@ -0,0 +1,268 @@
+from typing import Any, BinaryIO, Dict, Iterator, List, Tuple
+import struct
+import zlib
+
+from .grid import (
+    MazeGrid, NORTH, EAST, SOUTH, WEST, BLOCKED, add_bytes, and_bytes,
+    bit_table
+)
+from .palette import Palette, theme_palette
+
+Point = Tuple[int, int]
+
+IMAGE_FORMATS = ("PNG", "PPM")
+IMAGE_EXTENSIONS = {".png": "PNG", ".ppm": "PPM"}
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+IDAT_SIZE = 1 << 16
+
+SPACE, PATH, FORTY_TWO, ENTRY, EXIT, WALL = range(6)
+
+_NORTH_WALL = bit_table(NORTH, 2)
+_WEST_WALL = bit_table(WEST, 2)
+_SOUTH_WALL = bit_table(SOUTH, WALL)
+_BLOCKED = bit_table(BLOCKED, FORTY_TWO)
+
+_GAP = bytes((SPACE, PATH, WALL, WALL)) + bytes(252)
+
+
+def pixel_rows(
+    grid: MazeGrid,
+    entry: Point,
+    exit: Point,
+    solution: List[Point]
+) -> Iterator[bytearray]:
+    """
+    Draw the maze one pixel row at a time.
+
+    The picture has (2 * WIDTH + 1) x (2 * HEIGHT + 1) pixels, the
+    layout of the terminal display: odd rows and columns are cells,
+    the others walls and corners. Each row is built from one row of
+    cells with translate tables and slice assignments, so only O(WIDTH)
+    memory is used per row, plus a one-byte-per-cell path mask.
+
+    Args:
+        grid: Maze grid, '42' cells marked BLOCKED.
+        entry: Entry point as (x, y) coordinates.
+        exit: Exit point as (x, y) coordinates.
+        solution: Path to draw, as (x, y) tuples.
+
+    Yields:
+        Rows of pixel kinds: SPACE, PATH, FORTY_TWO, ENTRY, EXIT or
+        WALL, indices into a Palette.
+    """
+    width = grid.width
+    cells = grid.cells
+    size = 2 * width + 1
+    on_path = bytearray(len(cells))
+    for x, y in solution:
+        on_path[y * width + x] = 1
+    ends: Dict[int, List[Tuple[int, int]]] = {}
+    for (x, y), kind in ((entry, ENTRY), (exit, EXIT)):
+        ends.setdefault(y, []).append((x, kind))
+
+    above = bytes(width)
+    for start in range(0, len(cells), width):
+        row = bytes(cells[start:start + width])
+        path = bytes(on_path[start:start + width])
+
+        top = bytearray((WALL,)) * size
+        top[1::2] = add_bytes(row.translate(_NORTH_WALL),
+                              and_bytes(path, above)).translate(_GAP)
+        yield top
+
+        middle = bytearray(size)
+        middle[0:size - 1:2] = add_bytes(
+            row.translate(_WEST_WALL),
+            and_bytes(path, b"\x00" + path[:-1])).translate(_GAP)
+        middle[1::2] = add_bytes(path, row.translate(_BLOCKED))
+        middle[size - 1] = WALL if row[-1] & EAST else SPACE
+        for x, kind in ends.get(start // width, ()):
+            middle[2 * x + 1] = kind
+        yield middle
+        above = path
+
+    bottom = bytearray((WALL,)) * size
+    bottom[1::2] = bytes(cells[len(cells) - width:]).translate(_SOUTH_WALL)
+    yield bottom
+
+
+def image_rows(
+    grid: MazeGrid,
+    entry: Point,
+    exit: Point,
+    solution: List[Point],
+    scale: int = 1
+) -> Iterator[bytearray]:
+    """
+    Yield the scanlines of the maze picture, scaled up.
+
+    Args:
+        grid: Maze grid, '42' cells marked BLOCKED.
+        entry: Entry point as (x, y) coordinates.
+        exit: Exit point as (x, y) coordinates.
+        solution: Path to draw, as (x, y) tuples.
+        scale: Size in image pixels of one maze pixel.
+
+    Yields:
+        (2 * WIDTH + 1) * scale pixel kinds per scanline, each maze
+        pixel row repeated scale times (the same object).
+    """
+    for row in pixel_rows(grid, entry, exit, solution):
+        if scale > 1:
+            wide = bytearray(len(row) * scale)
+            for k in range(scale):
+                wide[k::scale] = row
+            row = wide
+        for _ in range(scale):
+            yield row
+
+
+def image_size(grid: MazeGrid, scale: int = 1) -> Tuple[int, int]:
+    """Return the (width, height) in pixels of the maze picture."""
+    return (2 * grid.width + 1) * scale, (2 * grid.height + 1) * scale
+
+
+def _chunk(f: BinaryIO, kind: bytes, data: bytes) -> None:
+    """Write one PNG chunk: length, type, data and CRC."""
+    f.write(struct.pack(">I", len(data)) + kind)
+    f.write(data)
+    f.write(struct.pack(">I", zlib.crc32(data, zlib.crc32(kind))))
+
+
+def write_png(
+    f: BinaryIO,
+    grid: MazeGrid,
+    entry: Point,
+    exit: Point,
+    solution: List[Point],
+    palette: Palette,
+    scale: int = 1,
+    level: int = 6
+) -> None:
+    """
+    Write the maze picture as an indexed-color PNG, row by row.
+
+    The six colors go in a PLTE chunk and each scanline is one byte per
+    pixel, fed to one zlib stream and written out in IDAT chunks of
+    about IDAT_SIZE bytes, so the image is never held in memory. A
+    scanline repeated by scale uses the Up filter, which turns it into
+    zeros that zlib compresses several times faster and smaller.
+
+    Args:
+        f: Binary file open for writing.
+        grid: Maze grid, '42' cells marked BLOCKED.
+        entry: Entry point as (x, y) coordinates.
+        exit: Exit point as (x, y) coordinates.
+        solution: Path to draw, as (x, y) tuples.
+        palette: Colors of the pixel kinds (see theme_palette).
+        scale: Size in image pixels of one maze pixel.
+        level: zlib compression level, 1 (fastest) to 9 (smallest).
+    """
+    width, height = image_size(grid, scale)
+    f.write(PNG_SIGNATURE)
+    _chunk(f, b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 3, 0, 0, 0))
+    _chunk(f, b"PLTE", b"".join(bytes(color) for color in palette))
+
+    compressor = zlib.compressobj(level)
+    repeat = b"\x02" + bytes(width)
+    pending: List[bytes] = []
+    size = 0
+    last = None
+    for row in image_rows(grid, entry, exit, solution, scale):
+        if row is last:
+            data = compressor.compress(repeat)
+        else:
+            data = compressor.compress(b"\x00" + row)
+            last = row
+        if data:
+            pending.append(data)
+            size += len(data)
+            if size >= IDAT_SIZE:
+                _chunk(f, b"IDAT", b"".join(pending))
+                pending = []
+                size = 0
+    pending.append(compressor.flush())
+    _chunk(f, b"IDAT", b"".join(pending))
+    _chunk(f, b"IEND", b"")
+
+
+def write_ppm(
+    f: BinaryIO,
+    grid: MazeGrid,
+    entry: Point,
+    exit: Point,
+    solution: List[Point],
+    palette: Palette,
+    scale: int = 1
+) -> None:
+    """
+    Write the maze picture as a binary PPM (P6), row by row.
+
+    Args:
+        f: Binary file open for writing.
+        grid: Maze grid, '42' cells marked BLOCKED.
+        entry: Entry point as (x, y) coordinates.
+        exit: Exit point as (x, y) coordinates.
+        solution: Path to draw, as (x, y) tuples.
+        palette: Colors of the pixel kinds (see theme_palette).
+        scale: Size in image pixels of one maze pixel.
+    """
+    width, height = image_size(grid, scale)
+    f.write(f"P6\n{width} {height}\n255\n".encode())
+    channels = [
+        bytes(color[c] for color in palette) + bytes(256 - len(palette))
+        for c in range(3)
+    ]
+    rgb = bytearray(3 * width)
+    last = None
+    for row in image_rows(grid, entry, exit, solution, scale):
+        if row is not last:
+            for c in range(3):
+                rgb[c::3] = row.translate(channels[c])
+            last = row
+        f.write(rgb)
+
+
+def write_image(
+    grid: MazeGrid,
+    config: Dict[str, Any],
+    solution: List[Point],
+    file_format: str
+) -> None:
+    """
+    Write the maze picture to OUTPUT_FILE.
+
+    Args:
+        grid: Maze grid, '42' cells marked BLOCKED.
+        config: Dict with OUTPUT_FILE, ENTRY, EXIT and optionally THEME
+            (colors, DEFAULT when unset) and SCALE (image pixels per
+            maze pixel, 1 when unset).
+        solution: Path to draw, as (x, y) tuples.
+        file_format: PNG or PPM.
+
+    Raises:
+        ValueError: If the format is not an image format or SCALE is
+            not a positive integer.
+        FileNotFoundError: If output file path is invalid.
+        PermissionError: If permission denied when writing file.
+    """
+    if file_format not in IMAGE_FORMATS:
+        raise ValueError(f"Unknown image format: {file_format}")
+    scale = config.get('SCALE', 1)
+    if not isinstance(scale, int) or scale < 1:
+        raise ValueError(f"SCALE must be a positive integer, got {scale}")
+    palette = theme_palette(str(config.get('THEME', "DEFAULT")))
+    writer = write_png if file_format == "PNG" else write_ppm
+    path = config['OUTPUT_FILE']
+
+    try:
+        with open(path, "wb") as f:
+            writer(f, grid, config['ENTRY'], config['EXIT'], solution,
+                   palette, scale)
+
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Error: {path} not found")
+
+    except PermissionError:
+        raise PermissionError("Error: Permission denied")
@@ -0,0 +1,245 @@
+from abc import ABC, abstractmethod
+from typing import Any, Iterator, List, Optional, Tuple
+import mmap
+
+from .codec import HEX_DECODE, decode_grid, decode_row
+from .grid import MazeGrid, NORTH, EAST, SOUTH, WEST, bit_table
+
+_MOVES = {"N": (0, -1, NORTH), "E": (1, 0, EAST),
+          "S": (0, 1, SOUTH), "W": (-1, 0, WEST)}
+
+
+_HAS_NORTH = bit_table(NORTH)
+_HAS_EAST = bit_table(EAST)
+_HAS_SOUTH = bit_table(SOUTH)
+_HAS_WEST = bit_table(WEST)
+
+
+class MazeReader(ABC):
+    """
+    Common interface of the maze file readers.
+
+    Subclasses parse a file format and set width, height, entry, exit
+    and directions; the metadata perfect, seed and algorithm are None
+    when the format does not record them. Rows, wall checks and the
+    stored path are then shared by every format.
+    """
+
+    width: int
+    height: int
+    entry: Tuple[int, int]
+    exit: Tuple[int, int]
+    directions: str
+    perfect: Optional[bool] = None
+    seed: Optional[int] = None
+    algorithm: Optional[str] = None
+
+    def __enter__(self) -> "MazeReader":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    @abstractmethod
+    def close(self) -> None:
+        """Release the file."""
+
+    @abstractmethod
+    def walls(self, x: int, y: int) -> int:
+        """Return the wall bits of the cell (x, y)."""
+
+    @abstractmethod
+    def row(self, y: int) -> bytearray:
+        """Decode row y into one byte of wall bits per cell."""
+
+    @abstractmethod
+    def to_grid(self) -> MazeGrid:
+        """Decode every row into a MazeGrid."""
+
+    def rows(self, start: int = 0, stop: Optional[int] = None) -> Iterator[
+            bytearray]:
+        """Decode rows start to stop (excluded) one at a time."""
+        if stop is None:
+            stop = self.height
+        for y in range(start, stop):
+            yield self.row(y)
+
+    def validate(self) -> None:
+        """
+        Check that walls are coherent between neighbouring cells.
+
+        Rows are decoded two at a time, so memory stays O(width).
+
+        Raises:
+            ValueError: If a border wall is open or two neighbours
+                disagree on the wall they share.
+        """
+        width = self.width
+        closed = b"\x01" * width
+        above: Optional[bytearray] = None
+
+        for y, row in enumerate(self.rows()):
+            east = row.translate(_HAS_EAST)
+            west = row.translate(_HAS_WEST)
+            north = row.translate(_HAS_NORTH)
+
+            if not west[0] or not east[-1]:
+                raise ValueError(f"Open border wall on row {y}")
+            if east[:-1] != west[1:]:
+                x = next(x for x in range(width - 1)
+                         if east[x] != west[x + 1])
+                raise ValueError(
+                    f"Incoherent wall between {x},{y} and {x + 1},{y}")
+            if above is None:
+                if north != closed:
+                    raise ValueError("Open border wall on the first row")
+            elif above.translate(_HAS_SOUTH) != north:
+                south = above.translate(_HAS_SOUTH)
+                x = next(x for x in range(width) if south[x] != north[x])
+                raise ValueError(
+                    f"Incoherent wall between {x},{y - 1} and {x},{y}")
+            above = row
+
+        if above is not None and above.translate(_HAS_SOUTH) != closed:
+            raise ValueError("Open border wall on the last row")
+
+    def path(self, check: bool = True) -> List[Tuple[int, int]]:
+        """
+        Rebuild the stored solution as a list of coordinates.
+
+        Args:
+            check: Verify that every step goes through an open wall and
+                that the path ends on the exit.
+
+        Returns:
+            List of (x, y) tuples from entry to exit.
+
+        Raises:
+            ValueError: If check is set and the stored path is invalid.
+        """
+        x, y = self.entry
+        path = [(x, y)]
+        for step in self.directions:
+            if step not in _MOVES:
+                raise ValueError(f"Invalid direction '{step}' in path")
+            dx, dy, bit = _MOVES[step]
+            if check and self.walls(x, y) & bit:
+                raise ValueError(f"Stored path crosses a wall at {x},{y}")
+            x += dx
+            y += dy
+            path.append((x, y))
+        if check and (x, y) != self.exit:
+            raise ValueError("Stored path does not lead to the exit")
+        return path
+
+
+class MazeFile(MazeReader):
+    """
+    Read-only, memory-mapped view of a maze file written by export_to.
+
+    Opening a file only locates the hex section and parses the short
+    trailer (entry, exit, directions); rows are decoded on demand, and
+    any row can be reached directly because all rows share one length.
+    """
+
+    def __init__(
+        self,
+        path: str
+    ) -> None:
+        """
+        Open and map a maze file.
+
+        Args:
+            path: Path of a file in the export_to format.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            PermissionError: If permission denied when reading the file.
+            ValueError: If the file layout is invalid.
+        """
+        try:
+            self._file = open(path, "rb")
+
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Error: {path} not found")
+
+        except PermissionError:
+            raise PermissionError("Error: Permission denied")
+
+        try:
+            self._view = mmap.mmap(
+                self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"Error: {path} is empty")
+
+        try:
+            self._parse_layout()
+        except ValueError:
+            self.close()
+            raise
+
+    def _parse_layout(self) -> None:
+        """Locate the hex rows and parse the trailer."""
+        view = self._view
+        self.hex_size = view.find(b"\n\n") + 1
+        if self.hex_size <= 0:
+            raise ValueError("Maze file has no blank line before trailer")
+
+        self.width = view.find(b"\n")
+        self.stride = self.width + 1
+        self.height, extra = divmod(self.hex_size, self.stride)
+        if extra or self.width == 0:
+            raise ValueError("Maze rows have different lengths")
+
+        lines = view[self.hex_size + 1:].decode().split("\n")
+        if len(lines) < 3:
+            raise ValueError("Maze trailer needs entry, exit and path")
+        self.entry = self._parse_point("ENTRY", lines[0])
+        self.exit = self._parse_point("EXIT", lines[1])
+        self.directions = lines[2].strip()
+
+    def _parse_point(self, key: str, text: str) -> Tuple[int, int]:
+        """Parse an 'x,y' trailer line and check it lies in the maze."""
+        try:
+            x, y = map(int, text.split(","))
+        except ValueError:
+            raise ValueError(
+                f"Invalid format for {key}: expected x,y got '{text}'")
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            raise ValueError(f"{key} {x},{y} is outside the maze")
+        return x, y
+
+    def close(self) -> None:
+        """Release the memory map and the file."""
+        self._view.close()
+        self._file.close()
+
+    def walls(self, x: int, y: int) -> int:
+        """Return the wall bits of the cell (x, y)."""
+        return HEX_DECODE[self._view[y * self.stride + x]]
+
+    def row(self, y: int) -> bytearray:
+        """
+        Decode one row of the maze.
+
+        Args:
+            y: Row index.
+
+        Returns:
+            One byte of wall bits per cell.
+
+        Raises:
+            IndexError: If y is outside the maze.
+            ValueError: If the row is malformed.
+        """
+        if not 0 <= y < self.height:
+            raise IndexError("row index out of range")
+        start = y * self.stride
+        if self._view[start + self.width] != ord("\n"):
+            raise ValueError(f"Maze row {y} has the wrong length")
+        return decode_row(self._view[start:start + self.width])
+
+    def to_grid(self) -> MazeGrid:
+        """Decode every row into a MazeGrid."""
+        return decode_grid(self._view[:self.hex_size])
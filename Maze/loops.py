@@ -0,0 +1,237 @@
+from typing import Any, Dict, Iterator, Optional, Union
+from array import array
+from itertools import compress
+import random
+
+from .grid import (
+    CarveEvent, MazeGrid, NORTH, EAST, SOUTH, WEST, BLOCKED, and_bytes
+)
+
+
+def _mask_table(bit: int) -> bytes:
+    """Translate table: 1 for a free cell whose given wall is closed."""
+    return bytes(
+        1 if value & bit and not value & BLOCKED else 0
+        for value in range(256)
+    )
+
+
+_CLOSED_EAST = _mask_table(EAST)
+_CLOSED_SOUTH = _mask_table(SOUTH)
+_FREE = bytes(0 if value & BLOCKED else 1 for value in range(256))
+
+
+def closed_walls(
+    grid: MazeGrid,
+    start: int = 0,
+    stop: Optional[int] = None
+) -> array:
+    """
+    List the closed interior walls between two free cells.
+
+    Built with translate tables and itertools.compress, so the cells
+    are scanned in C rather than one Python step per cell.
+
+    Args:
+        grid: Maze grid, '42' cells marked BLOCKED.
+        start: First row whose east and south walls are listed.
+        stop: Row after the last one listed; the last row when None.
+
+    Returns:
+        Wall ids: i for the east wall of cell i, size + i for its south
+        wall.
+    """
+    cells = bytes(grid.cells)
+    width = grid.width
+    size = len(cells)
+    if stop is None:
+        stop = grid.height
+    low = start * width
+    high = stop * width
+    free = cells.translate(_FREE) + bytes(width)
+    columns = (b"\x01" * (width - 1) + b"\x00") * (stop - start)
+
+    east = and_bytes(and_bytes(cells[low:high].translate(_CLOSED_EAST),
+                               free[low + 1:high + 1]), columns)
+    south = and_bytes(cells[low:high].translate(_CLOSED_SOUTH),
+                      free[low + width:high + width])
+
+    walls = array('i' if 2 * size < 2 ** 31 else 'q',
+                  compress(range(low, high), east))
+    walls.extend(compress(range(size + low, size + high), south))
+    return walls
+
+
+def opens_wide_area(grid: MazeGrid, i: int, j: int) -> bool:
+    """
+    Tell whether opening the wall between cells i and j would leave a
+    3x3 block of cells with no inner wall (a corridor wider than two).
+
+    Such a block holds an open 2x2 square around the wall, and only two
+    squares hold it, so most walls are settled by reading a few cells.
+    Otherwise only the blocks holding both cells are checked, at most
+    six, each stopping at its first closed wall, so this is O(1).
+
+    Args:
+        grid: Maze grid.
+        i: Index of the west or north cell.
+        j: Index of the east or south cell (i + 1 or i + width).
+
+    Returns:
+        True if the wall must stay closed.
+    """
+    cells = grid.cells
+    width = grid.width
+    height = grid.height
+    x, y = i % width, i // width
+
+    if j == i + 1:
+        square = (
+            y > 0 and not cells[i - width] & (EAST | SOUTH)
+            and not cells[i - width + 1] & SOUTH
+        ) or (
+            y < height - 1 and not (cells[i] | cells[j]) & SOUTH
+            and not cells[i + width] & EAST
+        )
+    else:
+        square = (
+            x > 0 and not cells[i - 1] & (EAST | SOUTH)
+            and not cells[i - 1 + width] & EAST
+        ) or (
+            x < width - 1 and not (cells[i] | cells[j]) & EAST
+            and not cells[i + 1] & SOUTH
+        )
+    if not square:
+        return False
+
+    if j == i + 1:
+        xs = range(max(x - 1, 0), min(x, width - 3) + 1)
+        ys = range(max(y - 2, 0), min(y, height - 3) + 1)
+    else:
+        xs = range(max(x - 2, 0), min(x, width - 3) + 1)
+        ys = range(max(y - 1, 0), min(y, height - 3) + 1)
+
+    for by in ys:
+        for bx in xs:
+            top = by * width + bx
+            wide = True
+            for k in (top, top + width, top + 2 * width):
+                for c in (k, k + 1):
+                    if cells[c] & EAST and not (c == i and j == i + 1):
+                        wide = False
+                        break
+                if not wide:
+                    break
+            if not wide:
+                continue
+            for k in (top, top + width):
+                for c in (k, k + 1, k + 2):
+                    if cells[c] & SOUTH and not (c == i and j != i + 1):
+                        wide = False
+                        break
+                if not wide:
+                    break
+            if wide:
+                return True
+    return False
+
+
+def add_loops(grid: MazeGrid, count: int, rng: random.Random) -> int:
+    """
+    Open up to count closed interior walls at random to create loops.
+
+    Args:
+        grid: Maze grid, '42' cells marked BLOCKED.
+        count: Number of walls to open.
+        rng: Random number generator to draw from.
+
+    Returns:
+        Number of walls opened; less than count only when no eligible
+        wall is left.
+    """
+    opened = 0
+    for _ in loop_steps(grid, count, rng):
+        opened += 1
+    return opened
+
+
+def loop_steps(
+    grid: MazeGrid,
+    count: int,
+    rng: random.Random,
+    start: int = 0,
+    stop: Optional[int] = None
+) -> Iterator[CarveEvent]:
+    """
+    Open up to count closed interior walls at random, one at a time.
+
+    The closed walls between free cells are listed once, then drawn
+    without replacement (a partial Fisher-Yates shuffle), so every draw
+    is a new wall. A wall is skipped when opening it would make a
+    corridor wider than two cells (see opens_wide_area).
+
+    Args:
+        grid: Maze grid, '42' cells marked BLOCKED.
+        count: Number of walls to open.
+        rng: Random number generator to draw from.
+        start: First row whose east and south walls may be opened.
+        stop: Row after the last one; the last row when None.
+
+    Yields:
+        (i, EAST) or (i, SOUTH) after opening that wall of cell i.
+    """
+    walls = closed_walls(grid, start, stop)
+    cells = grid.cells
+    size = len(cells)
+    width = grid.width
+    remaining = len(walls)
+    randrange = rng.randrange
+    opened = 0
+    k = 0
+
+    while opened < count and k < remaining:
+        r = randrange(k, remaining)
+        wall = walls[r]
+        walls[r] = walls[k]
+        k += 1
+
+        if wall < size:
+            if not opens_wide_area(grid, wall, wall + 1):
+                cells[wall] &= ~EAST
+                cells[wall + 1] &= ~WEST
+                opened += 1
+                yield wall, EAST
+        else:
+            i = wall - size
+            if not opens_wide_area(grid, i, i + width):
+                cells[i] &= ~SOUTH
+                cells[i + width] &= ~NORTH
+                opened += 1
+                yield i, SOUTH
+
+
+def free_cells(grid: MazeGrid) -> int:
+    """Count the cells of a grid that are not '42' cells."""
+    return grid.cells.translate(_FREE).count(1)
+
+
+def loop_count(config: Dict[str, Any], free: int) -> int:
+    """
+    Resolve the number of loops asked for by a configuration.
+
+    Args:
+        config: Dict with WIDTH, HEIGHT and optionally LOOPS, either a
+            number of walls (int) or a density per free cell (float
+            from 0 up to, not including, 1).
+        free: Number of free cells (see free_cells).
+
+    Returns:
+        LOOPS if it is an int, LOOPS times the number of free cells if
+        it is a float, and WIDTH + HEIGHT - 1 when LOOPS is not set.
+    """
+    loops: Union[int, float, None] = config.get('LOOPS')
+    if loops is None:
+        return int(config['WIDTH'] + config['HEIGHT'] - 1)
+    if isinstance(loops, float):
+        return round(loops * free)
+    return loops
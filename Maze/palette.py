@@ -0,0 +1,64 @@
+from typing import Dict, Tuple
+
+RGB = Tuple[int, int, int]
+Palette = Tuple[RGB, RGB, RGB, RGB, RGB, RGB]
+
+THEMES = {
+    "BLUE": ("94;1", "36;1", "34", "96;1", "41;1"),
+    "YELLOW": ("93;1", "91;1", "33", "97;1", "93;1"),
+    "PURPLE": ("94", "94;1", "35", "96;1", "106;1"),
+    "DEFAULT": ("31;1", "37;1", "97", "32;1", "31;1"),
+}
+
+ANSI_RGB: Dict[int, RGB] = {
+    30: (0, 0, 0), 31: (205, 0, 0), 32: (0, 205, 0), 33: (205, 205, 0),
+    34: (0, 0, 238), 35: (205, 0, 205), 36: (0, 205, 205),
+    37: (229, 229, 229),
+    90: (127, 127, 127), 91: (255, 0, 0), 92: (0, 255, 0),
+    93: (255, 255, 0), 94: (92, 92, 255), 95: (255, 0, 255),
+    96: (0, 255, 255), 97: (255, 255, 255),
+}
+
+BACKGROUND: RGB = (0, 0, 0)
+
+
+def code_rgb(code: str) -> RGB:
+    """
+    Convert the color of an ANSI SGR code to RGB (xterm colors).
+
+    Args:
+        code: SGR parameters such as '94;1'. A background color
+            (40-47, 100-107) counts as the same foreground color and
+            other attributes such as bold are skipped.
+
+    Returns:
+        (red, green, blue) of the first color found.
+
+    Raises:
+        ValueError: If the code holds no 16-color ANSI color.
+    """
+    for part in code.split(";"):
+        value = int(part)
+        if 40 <= value <= 47 or 100 <= value <= 107:
+            value -= 10
+        if value in ANSI_RGB:
+            return ANSI_RGB[value]
+    raise ValueError(f"No color in ANSI code: {code}")
+
+
+def theme_palette(theme: str, background: RGB = BACKGROUND) -> Palette:
+    """
+    Return the RGB colors of a display theme, e.g. for images.
+
+    Args:
+        theme: Theme name (see THEMES); unknown names get DEFAULT.
+        background: Color of open space, black like a terminal.
+
+    Returns:
+        Colors of space, path, forty_two, entry, exit and wall, the
+        order of the KIND_* values of MazeUtils.display.
+    """
+    entry, exit, wall, path, forty_two = THEMES.get(
+        theme.upper(), THEMES["DEFAULT"])
+    return (background, code_rgb(path), code_rgb(forty_two),
+            code_rgb(entry), code_rgb(exit), code_rgb(wall))
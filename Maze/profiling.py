@@ -0,0 +1,101 @@
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+from contextlib import contextmanager
+import time
+
+from .grid import MazeGrid, DEGREE
+from .distance import DistanceField
+
+PhaseCallback = Callable[[str, float], None]
+
+
+class GenerationProfile:
+    """
+    Phase timings and counters of one MazeGenerator.generate() call.
+
+    Pass one to generate(profile=...). Without it generate() does not
+    time anything and the carving loops count nothing. With it, most
+    counters are read off the grid after each phase, in O(cells)
+    passes, and the DFS and BFS engines also track the size of their
+    stack or queue.
+
+    Attributes:
+        phases: Seconds per phase, in the order run ('forty_two',
+            'carve', 'loops', 'solve', 'stats', 'export').
+        counters: Hot-path counters:
+            cells_visited: Cells joined to the entry by the carving
+                engine.
+            walls_removed: Walls opened by carving and loops.
+            loops_opened: Walls opened by the loop stage.
+            max_stack_depth: Peak size of the DFS stack (DFS engine
+                only).
+            frontier_peak: Peak size of the BFS queue (BFS engine
+                only).
+            solver_expanded: Cells expanded by the solver (only when
+                generate() exports, as the maze is not solved
+                otherwise).
+        callback: Called with (phase, seconds) as each phase ends.
+    """
+
+    def __init__(self, callback: Optional[PhaseCallback] = None) -> None:
+        """
+        Create an empty profile.
+
+        Args:
+            callback: Optional function called with (phase, seconds)
+                as each phase ends, e.g. to feed a metrics system.
+        """
+        self.phases: Dict[str, float] = {}
+        self.counters: Dict[str, int] = {}
+        self.callback = callback
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """
+        Time the enclosed block as a phase.
+
+        Args:
+            name: Phase name; time adds up if the phase runs again.
+        """
+        begin = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - begin
+            self.phases[name] = self.phases.get(name, 0.0) + elapsed
+            if self.callback is not None:
+                self.callback(name, elapsed)
+
+    def count_carving(self, grid: MazeGrid, entry: Tuple[int, int]) -> None:
+        """
+        Read the carving counters off a freshly carved grid.
+
+        Args:
+            grid: Maze grid right after the carving engine.
+            entry: Entry point as (x, y) coordinates.
+        """
+        field = DistanceField(grid, entry)
+        unreached = field.distance.count(-1)
+        self.counters["cells_visited"] = len(grid.cells) - unreached
+        self.counters["walls_removed"] = (
+            sum(grid.cells.translate(DEGREE)) // 2)
+
+    def total(self) -> float:
+        """Return the time of all phases, in seconds."""
+        return sum(self.phases.values())
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        Return the profile as plain data, e.g. for JSON.
+
+        Returns:
+            Dict with phases (seconds, rounded to the microsecond),
+            total and counters.
+        """
+        return {
+            "phases": {
+                name: round(seconds, 6)
+                for name, seconds in self.phases.items()
+            },
+            "total": round(self.total(), 6),
+            "counters": dict(self.counters),
+        }
@@ -0,0 +1,305 @@
+from typing import Callable, Dict, List, Optional, Tuple
+from collections import deque
+from array import array
+from itertools import compress
+import heapq
+
+from .grid import (
+    MazeGrid, NORTH, EAST, SOUTH, WEST, DEGREE, open_neighbors,
+)
+
+Point = Tuple[int, int]
+SolveResult = Tuple[List[Point], int]
+Solver = Callable[[MazeGrid, Point, Point], SolveResult]
+
+
+def _to_points(indices: List[int], width: int) -> List[Point]:
+    """Convert cell indices to (x, y) coordinates."""
+    return [(i % width, i // width) for i in indices]
+
+
+def _bfs(
+    grid: MazeGrid,
+    entry: Point,
+    exit: Point,
+    skip: Optional[bytearray] = None
+) -> SolveResult:
+    """
+    Breadth-first search over cell indices.
+
+    Args:
+        grid: Maze grid.
+        entry: Starting point as (x, y) coordinates.
+        exit: Destination point as (x, y) coordinates.
+        skip: Optional per-cell mask of cells never to enter.
+
+    Returns:
+        The path from entry to exit ([entry] if unreachable) and the
+        number of cells expanded.
+    """
+    cells = grid.cells
+    w = grid.width
+    h = grid.height
+    entry_x, entry_y = entry
+    exit_x, exit_y = exit
+    start = entry_y * w + entry_x
+    goal = exit_y * w + exit_x
+    last_row = (h - 1) * w
+
+    parents = array('i', [-1]) * (w * h)
+    if skip is not None:
+        for i in compress(range(len(skip)), skip):
+            parents[i] = i
+    parents[start] = start
+    queue = deque((start,))
+    pop = queue.popleft
+    push = queue.append
+    expanded = 0
+
+    while queue:
+        i = pop()
+        expanded += 1
+
+        if i == goal:
+            break
+        walls = cells[i]
+        x = i % w
+
+        if not walls & NORTH and i >= w and parents[i - w] < 0:
+            parents[i - w] = i
+            push(i - w)
+
+        if not walls & SOUTH and i < last_row and parents[i + w] < 0:
+            parents[i + w] = i
+            push(i + w)
+
+        if not walls & WEST and x > 0 and parents[i - 1] < 0:
+            parents[i - 1] = i
+            push(i - 1)
+
+        if not walls & EAST and x < w - 1 and parents[i + 1] < 0:
+            parents[i + 1] = i
+            push(i + 1)
+
+    path = []
+    current = goal
+
+    if parents[goal] >= 0:
+        while current != start:
+            path.append((current % w, current // w))
+            current = parents[current]
+
+    path.append((entry_x, entry_y))
+    path.reverse()
+
+    return path, expanded
+
+
+def bfs(grid: MazeGrid, entry: Point, exit: Point) -> SolveResult:
+    """
+    Shortest path by breadth-first search from the entry.
+
+    Args:
+        grid: Maze grid.
+        entry: Starting point as (x, y) coordinates.
+        exit: Destination point as (x, y) coordinates.
+
+    Returns:
+        The path from entry to exit ([entry] if unreachable) and the
+        number of cells expanded.
+    """
+    return _bfs(grid, entry, exit)
+
+
+def bidirectional_bfs(
+    grid: MazeGrid,
+    entry: Point,
+    exit: Point
+) -> SolveResult:
+    """
+    Shortest path by breadth-first search from both ends at once.
+
+    Each round expands a whole level of the smaller frontier and stops
+    at the level where the two searches meet, keeping the shortest
+    junction. Visited cells live in dicts, so the cost follows the
+    explored area rather than the grid size, which pays off in mazes
+    with loops where the two frontiers meet early.
+
+    Args:
+        grid: Maze grid.
+        entry: Starting point as (x, y) coordinates.
+        exit: Destination point as (x, y) coordinates.
+
+    Returns:
+        The path from entry to exit ([entry] if unreachable) and the
+        number of cells expanded.
+    """
+    cells = grid.cells
+    width = grid.width
+    start = entry[1] * width + entry[0]
+    goal = exit[1] * width + exit[0]
+    if start == goal:
+        return [entry], 0
+
+    parents: Tuple[Dict[int, int], Dict[int, int]] = (
+        {start: start}, {goal: goal})
+    depth: Tuple[Dict[int, int], Dict[int, int]] = ({start: 0}, {goal: 0})
+    frontiers = [[start], [goal]]
+    expanded = 0
+
+    while frontiers[0] and frontiers[1]:
+        side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+        mine, theirs = parents[side], parents[1 - side]
+        my_depth, their_depth = depth[side], depth[1 - side]
+        level: List[int] = []
+        meet = -1
+        best = 0
+
+        for i in frontiers[side]:
+            expanded += 1
+            step = my_depth[i] + 1
+            for j in open_neighbors(cells, width, i):
+                if j in mine:
+                    continue
+                mine[j] = i
+                my_depth[j] = step
+                level.append(j)
+                if j in theirs and (meet < 0
+                                    or step + their_depth[j] < best):
+                    meet = j
+                    best = step + their_depth[j]
+
+        if meet >= 0:
+            forward = [meet]
+            while forward[-1] != start:
+                forward.append(parents[0][forward[-1]])
+            forward.reverse()
+            while forward[-1] != goal:
+                forward.append(parents[1][forward[-1]])
+            return _to_points(forward, width), expanded
+
+        frontiers[side] = level
+
+    return [entry], expanded
+
+
+def astar(grid: MazeGrid, entry: Point, exit: Point) -> SolveResult:
+    """
+    Shortest path by A* search with the Manhattan distance heuristic.
+
+    The heuristic never overestimates on a grid with unit moves, so the
+    path is a shortest one. Ties on f prefer cells closer to the exit.
+
+    Args:
+        grid: Maze grid.
+        entry: Starting point as (x, y) coordinates.
+        exit: Destination point as (x, y) coordinates.
+
+    Returns:
+        The path from entry to exit ([entry] if unreachable) and the
+        number of cells expanded.
+    """
+    cells = grid.cells
+    width = grid.width
+    start = entry[1] * width + entry[0]
+    goal = exit[1] * width + exit[0]
+    exit_x, exit_y = exit
+
+    cost = {start: 0}
+    parents = {start: start}
+    closed = set()
+    estimate = abs(entry[0] - exit_x) + abs(entry[1] - exit_y)
+    heap = [(estimate, estimate, start)]
+    expanded = 0
+
+    while heap:
+        _, _, i = heapq.heappop(heap)
+        if i in closed:
+            continue
+        closed.add(i)
+        expanded += 1
+        if i == goal:
+            path = [goal]
+            while path[-1] != start:
+                path.append(parents[path[-1]])
+            path.reverse()
+            return _to_points(path, width), expanded
+
+        step = cost[i] + 1
+        for j in open_neighbors(cells, width, i):
+            if j not in closed and step < cost.get(j, step + 1):
+                cost[j] = step
+                parents[j] = i
+                remaining = abs(j % width - exit_x) + abs(j // width - exit_y)
+                heapq.heappush(heap, (step + remaining, remaining, j))
+
+    return [entry], expanded
+
+
+def dead_end_filling(
+    grid: MazeGrid,
+    entry: Point,
+    exit: Point
+) -> SolveResult:
+    """
+    Solve by filling dead ends, then searching what is left.
+
+    Every cell with a single opening (other than entry and exit) is
+    filled, which may turn its neighbour into a new dead end. In a
+    perfect maze only the solution remains; with loops, a BFS over the
+    remaining cells finds the shortest path, since a shortest path never
+    enters a dead end.
+
+    Args:
+        grid: Maze grid.
+        entry: Starting point as (x, y) coordinates.
+        exit: Destination point as (x, y) coordinates.
+
+    Returns:
+        The path from entry to exit ([entry] if unreachable) and the
+        number of cells filled plus the cells expanded by the search.
+    """
+    cells = grid.cells
+    width = grid.width
+    start = entry[1] * width + entry[0]
+    goal = exit[1] * width + exit[0]
+
+    degree = bytearray(cells.translate(DEGREE))
+    filled = bytearray(len(cells))
+    queue = deque(
+        i for i in range(len(cells))
+        if degree[i] == 1 and i != start and i != goal)
+    count = 0
+
+    while queue:
+        i = queue.popleft()
+        filled[i] = 1
+        count += 1
+        for j in open_neighbors(cells, width, i):
+            if not filled[j]:
+                degree[j] -= 1
+                if degree[j] == 1 and j != start and j != goal:
+                    queue.append(j)
+
+    path, expanded = _bfs(grid, entry, exit, filled)
+    return path, count + expanded
+
+
+SOLVERS: Dict[str, Solver] = {
+    "BFS": bfs,
+    "BIDIRECTIONAL": bidirectional_bfs,
+    "ASTAR": astar,
+    "DEAD_END": dead_end_filling,
+}
+
+
+def register_solver(name: str, solver: Solver) -> None:
+    """
+    Register a solver under a name usable by SOLVER= and solve().
+
+    Args:
+        name: Solver name (case-insensitive).
+        solver: Callable taking (grid, entry, exit) and returning the
+            path as (x, y) tuples and the number of cells expanded.
+    """
+    SOLVERS[name.upper()] = solver
@@ -0,0 +1,345 @@
+from typing import (
+    Any, Collection, Deque, Dict, Iterable, Iterator, List, Optional, Tuple,
+)
+from array import array
+from collections import deque
+from itertools import islice
+import mmap
+import random
+import sys
+import tempfile
+
+from .algorithms import ROW_ALGORITHMS
+from .binary import output_format
+from .codec import HEX_DECODE, HexData, encode_row
+from .generator import forty_two_cells
+from .grid import CarveEvent, MazeGrid, NORTH, EAST, SOUTH, WEST, BLOCKED
+from .loops import loop_count, loop_steps
+
+_DIRECTION_NAMES = b"NESW" + bytes(252)
+_BITS = (NORTH, EAST, SOUTH, WEST)
+_DX = (0, 1, 0, -1)
+_DY = (-1, 0, 1, 0)
+
+
+def stream_to(
+    config: Dict[str, Any],
+    algorithm: Optional[str] = None
+) -> None:
+    """
+    Generate a maze row by row and write it straight to OUTPUT_FILE.
+
+    Rows come from a row-local algorithm (see ROW_ALGORITHMS) and each
+    hex row is written as soon as it is final, so memory stays O(WIDTH)
+    whatever HEIGHT is. The entry/exit/path trailer is then computed
+    from the emitted file through a read-only memory map: a wall
+    follower for perfect mazes, and a BFS whose parent links live in a
+    temporary file for mazes with loops. The output is in the same
+    format as MazeGenerator.export_to.
+
+    Args:
+        config: Dict with WIDTH, HEIGHT, ENTRY, EXIT, PERFECT, SEED,
+            OUTPUT_FILE and optionally ALGORITHM and LOOPS (see
+            loop_count).
+        algorithm: Row algorithm name, overriding config ALGORITHM.
+
+    Raises:
+        Exception: If maze is too small to place '42' pattern.
+        ValueError: If the algorithm is not row-local, the output format
+            is not HEX, or ENTRY or EXIT lies on the '42' pattern.
+        FileNotFoundError: If output file path is invalid.
+        PermissionError: If permission denied when writing file.
+    """
+    name = str(algorithm or config.get("ALGORITHM", "ELLER")).upper()
+    rows_of = ROW_ALGORITHMS.get(name)
+    if rows_of is None:
+        raise ValueError(
+            f"Streaming needs a row-by-row algorithm "
+            f"({', '.join(ROW_ALGORITHMS)}), got {name}")
+    if output_format(config) != "HEX":
+        raise ValueError("Streaming only writes the hex format")
+
+    width = config['WIDTH']
+    height = config['HEIGHT']
+    entry = config['ENTRY']
+    exit = config['EXIT']
+    rng = random.Random(config['SEED'])
+
+    blocked = frozenset(forty_two_cells(width, height))
+    if not blocked:
+        raise Exception(
+            "Error: Maze too small to place the '42' pattern.")
+    if entry in blocked:
+        raise ValueError("Entry on 42")
+    if exit in blocked:
+        raise ValueError("Exit on 42")
+
+    rows = rows_of(width, height, blocked, rng)
+    if not config['PERFECT']:
+        count = loop_count(config, width * height - len(blocked))
+        rows = _add_loops(rows, width, height, blocked, count, rng)
+
+    path = config['OUTPUT_FILE']
+    try:
+        with open(path, "w+b") as f:
+            for row in rows:
+                f.write(encode_row(row) + b"\n")
+            f.flush()
+
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as view:
+                if config['PERFECT']:
+                    directions = follow_wall(view, width, entry, exit)
+                else:
+                    directions = solve_file(
+                        view, width, height, entry, exit)
+
+            f.write(
+                f"\n{entry[0]},{entry[1]}\n"
+                f"{exit[0]},{exit[1]}\n"
+                f"{directions}\n".encode()
+            )
+
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Error: {path} not found")
+
+    except PermissionError:
+        raise PermissionError("Error: Permission denied")
+
+
+def _add_loops(
+    rows: Iterator[bytearray],
+    width: int,
+    height: int,
+    blocked: Collection[Tuple[int, int]],
+    count: int,
+    rng: random.Random
+) -> Iterator[bytearray]:
+    """
+    Open random extra walls in a row stream to create loops.
+
+    The east and south walls of row y are drawn, as by loop_steps, once
+    rows y - 2 to y + 2 are known: every 3x3 block holding one of them
+    is then final, so opens_wide_area keeps corridors at most two cells
+    wide just as for a maze held in memory. Rows are held back two
+    steps and the two before them kept for the checks, so memory stays
+    O(WIDTH). The count is spread evenly over the rows, a row with too
+    few closed walls leaving its share to the next ones.
+
+    Args:
+        rows: Rows of wall bits, from top to bottom.
+        width: Maze width in cells.
+        height: Maze height in cells.
+        blocked: Coordinates of cells to leave closed.
+        count: Total number of walls to open (see loop_count).
+        rng: Random number generator to draw from.
+
+    Yields:
+        The same rows with the extra walls opened.
+    """
+    by_row: Dict[int, List[int]] = {}
+    for x, y in blocked:
+        by_row.setdefault(y, []).append(x)
+    window: Deque[bytearray] = deque()
+    first = 0
+    opened = 0
+
+    def open_row(y: int) -> bytearray:
+        nonlocal opened
+        cells = bytearray().join(window)
+        for k in range(len(window)):
+            for x in by_row.get(first + k, ()):
+                cells[k * width + x] |= BLOCKED
+        grid = MazeGrid(width, len(window), cells)
+        target = min(count * (y + 1) // max(height - 1, 1), count)
+        for i, wall in loop_steps(grid, target - opened, rng, y - first,
+                                  y - first + 1):
+            k, x = divmod(i, width)
+            if wall == EAST:
+                window[k][x] &= ~EAST
+                window[k][x + 1] &= ~WEST
+            else:
+                window[k][x] &= ~SOUTH
+                window[k + 1][x] &= ~NORTH
+            opened += 1
+        return window[y - first]
+
+    for y, row in enumerate(rows):
+        window.append(row)
+        if len(window) > 5:
+            window.popleft()
+            first += 1
+        if y >= 2:
+            yield open_row(y - 2)
+
+    for y in range(max(height - 2, 0), height):
+        yield open_row(y)
+
+
+def follow_wall(
+    view: HexData,
+    width: int,
+    entry: Tuple[int, int],
+    exit: Tuple[int, int]
+) -> str:
+    """
+    Solve a perfect maze stored as hex rows by following the left wall.
+
+    Only the current cell, heading and the path so far are kept; moves
+    that step straight back are cancelled, which leaves the unique
+    path of the spanning tree.
+
+    Args:
+        view: Hex rows of the maze, one byte per cell plus a newline.
+        width: Maze width in cells.
+        entry: Starting point as (x, y) coordinates.
+        exit: Destination point as (x, y) coordinates.
+
+    Returns:
+        String of direction characters (N, E, S, W).
+
+    Raises:
+        ValueError: If the entry cell is closed on all sides.
+    """
+    stride = width + 1
+    x, y = entry
+    heading = 1
+    path = bytearray()
+
+    while (x, y) != exit:
+        walls = HEX_DECODE[view[y * stride + x]]
+        for turn in (3, 0, 1, 2):
+            direction = (heading + turn) % 4
+            if not walls & _BITS[direction]:
+                break
+        else:
+            raise ValueError(f"Cell {x},{y} is closed on all sides")
+
+        if path and path[-1] == (direction + 2) % 4:
+            path.pop()
+        else:
+            path.append(direction)
+        x += _DX[direction]
+        y += _DY[direction]
+        heading = direction
+
+    return path.translate(_DIRECTION_NAMES).decode()
+
+
+def solve_file(
+    view: HexData,
+    width: int,
+    height: int,
+    entry: Tuple[int, int],
+    exit: Tuple[int, int]
+) -> str:
+    """
+    Find the shortest path through a maze stored as hex rows.
+
+    BFS identical to MazeGenerator.solve_maze, except that the move
+    into each reached cell is recorded in a memory-mapped temporary
+    file, so the solver does not hold a per-cell array in RAM.
+
+    Args:
+        view: Hex rows of the maze, one byte per cell plus a newline.
+        width: Maze width in cells.
+        height: Maze height in cells.
+        entry: Starting point as (x, y) coordinates.
+        exit: Destination point as (x, y) coordinates.
+
+    Returns:
+        String of direction characters (N, E, S, W), empty if the exit
+        cannot be reached.
+    """
+    stride = width + 1
+    size = width * height
+    start = entry[1] * width + entry[0]
+    goal = exit[1] * width + exit[0]
+    last_row = size - width
+    offsets = (-width, 1, width, -1)
+
+    with tempfile.TemporaryFile() as scratch:
+        scratch.truncate(size)
+        with mmap.mmap(scratch.fileno(), size) as came:
+            came[start] = 5
+            queue = deque((start,))
+
+            while queue:
+                i = queue.popleft()
+                if i == goal:
+                    break
+                y, x = divmod(i, width)
+                walls = HEX_DECODE[view[y * stride + x]]
+
+                if not walls & NORTH and i >= width and not came[i - width]:
+                    came[i - width] = 1
+                    queue.append(i - width)
+                if (not walls & SOUTH and i < last_row
+                        and not came[i + width]):
+                    came[i + width] = 3
+                    queue.append(i + width)
+                if not walls & WEST and x > 0 and not came[i - 1]:
+                    came[i - 1] = 4
+                    queue.append(i - 1)
+                if not walls & EAST and x < width - 1 and not came[i + 1]:
+                    came[i + 1] = 2
+                    queue.append(i + 1)
+
+            path = bytearray()
+            if came[goal]:
+                i = goal
+                while i != start:
+                    direction = came[i] - 1
+                    path.append(direction)
+                    i -= offsets[direction]
+            path.reverse()
+
+    return path.translate(_DIRECTION_NAMES).decode()
+
+
+def pack_steps(
+    steps: Iterable[CarveEvent],
+    batch: int = 4096
+) -> Iterator[bytes]:
+    """
+    Pack carve events into byte chunks for a file or a socket.
+
+    Each event (i, wall) becomes one little-endian uint32, i * 16 + wall,
+    and events are packed batch at a time, so a consumer of
+    MazeGenerator.carve_steps() can stream the build as it happens
+    without a Python write per event. The maze must have under 2 ** 28
+    cells.
+
+    Args:
+        steps: Carve events, e.g. from MazeGenerator.carve_steps().
+        batch: Number of events per chunk.
+
+    Yields:
+        Chunks of 4 * batch bytes, the last one shorter.
+    """
+    events = iter(steps)
+    while True:
+        words = array('I', (i << 4 | wall for i, wall in
+                            islice(events, batch)))
+        if not words:
+            return
+        if sys.byteorder == "big":
+            words.byteswap()
+        yield words.tobytes()
+
+
+def unpack_steps(data: bytes) -> Iterator[CarveEvent]:
+    """
+    Decode carve events written by pack_steps.
+
+    Args:
+        data: Whole chunks of packed events (a multiple of 4 bytes).
+
+    Yields:
+        (i, wall) carve events.
+    """
+    words = array('I')
+    words.frombytes(data)
+    if sys.byteorder == "big":
+        words.byteswap()
+    for word in words:
+        yield word >> 4, word & 15
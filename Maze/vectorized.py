@@ -0,0 +1,150 @@
+from typing import TYPE_CHECKING, Any, Tuple
+
+from .codec import wall_array
+from .grid import NORTH, EAST, SOUTH, WEST, WALLS, VISITED, BLOCKED
+
+if TYPE_CHECKING:
+    from .generator import MazeGenerator
+
+
+def _setup(gen: "MazeGenerator") -> Tuple[Any, Any, Any, Any, Any]:
+    """
+    Prepare the arrays shared by the vectorized engines.
+
+    Args:
+        gen: Generator whose '42' cells are already marked BLOCKED.
+
+    Returns:
+        NumPy random generator seeded from gen.rng, the free cell mask,
+        the cells whose north neighbour is free, the cells whose east
+        neighbour is free, and a random priority per cell (a
+        permutation, -1 where north is closed) used to pick one cell per
+        run.
+    """
+    import numpy
+
+    np_rng = numpy.random.default_rng(gen.rng.getrandbits(64))
+    free = (wall_array(gen.maze) & BLOCKED) == 0
+
+    north_ok = numpy.zeros_like(free)
+    north_ok[1:] = free[1:] & free[:-1]
+    east_ok = numpy.zeros_like(free)
+    east_ok[:, :-1] = free[:, :-1] & free[:, 1:]
+
+    priority = np_rng.permutation(free.size).reshape(free.shape)
+    priority[~north_ok] = -1
+    return np_rng, free, north_ok, east_ok, priority
+
+
+def _runs(east: Any, priority: Any) -> Tuple[Any, Any, Any]:
+    """
+    Split the grid into runs of cells joined by east links.
+
+    Runs never wrap, because the last column has no east link.
+
+    Args:
+        east: Boolean (height, width) array of open east walls.
+        priority: Per-cell priority from _setup.
+
+    Returns:
+        Flat index of the first cell of each run, run label of every
+        cell (flat), and the highest priority in each run (-1 when no
+        cell of the run can open north).
+    """
+    import numpy
+
+    flat_east = east.ravel()
+    head = numpy.ones(flat_east.size, dtype=bool)
+    head[1:] = ~flat_east[:-1]
+    starts = numpy.flatnonzero(head)
+    labels = numpy.cumsum(head) - 1
+    best = numpy.maximum.reduceat(priority.ravel(), starts)
+    return starts, labels, best
+
+
+def _write_walls(gen: "MazeGenerator", north: Any, east: Any,
+                 free: Any) -> None:
+    """
+    Turn north/east link arrays into wall bits in the grid.
+
+    Each wall bit is cleared by exactly one link, so the bits can be
+    subtracted instead of masked. Blocked cells keep every wall and get
+    the VISITED and BLOCKED flags back.
+    """
+    import numpy
+
+    uint8 = numpy.uint8
+    walls = numpy.full(north.shape, WALLS, dtype=uint8)
+    walls -= north.astype(uint8) * uint8(NORTH)
+    walls[:-1] -= north[1:].astype(uint8) * uint8(SOUTH)
+    walls -= east.astype(uint8) * uint8(EAST)
+    walls[:, 1:] -= east[:, :-1].astype(uint8) * uint8(WEST)
+    walls |= (~free).astype(uint8) * uint8(VISITED | BLOCKED)
+    wall_array(gen.maze)[:] = walls
+
+
+def binary_tree_np(gen: "MazeGenerator") -> None:
+    """
+    Generate maze using the binary tree algorithm on NumPy arrays.
+
+    Same rules as binary_tree, drawn for every cell at once: each free
+    cell opens north or east at random, runs that end against blocked
+    cells open north from a random cell of the run, or failing that
+    join the cell west of the run. Needs NumPy.
+    """
+    import numpy
+
+    np_rng, free, north_ok, east_ok, priority = _setup(gen)
+    width = gen.width
+
+    heads = np_rng.random(free.shape) < 0.5
+    north = north_ok & (~east_ok | heads)
+    east = east_ok & ~north
+    stuck = free & ~north & ~east
+    stuck[0, -1] = False
+
+    starts, labels, best = _runs(east, priority)
+    ends = numpy.append(starts[1:], free.size) - 1
+    stuck_runs = stuck.ravel()[ends]
+
+    flat_priority = priority.ravel()
+    lift = stuck_runs & (best >= 0)
+    north.ravel()[
+        lift[labels] & (flat_priority == best[labels])] = True
+
+    join = stuck_runs & (best < 0) & (starts % width > 0)
+    join[join] &= free.ravel()[starts[join] - 1]
+    east.ravel()[starts[join] - 1] = True
+
+    _write_walls(gen, north, east, free)
+
+
+def sidewinder(gen: "MazeGenerator") -> None:
+    """
+    Generate maze using the sidewinder algorithm on NumPy arrays.
+
+    The first row is one corridor. Below it, each free cell randomly
+    continues its run east or closes it, and every run opens north from
+    one random cell. A run is only closed on a cell that can open north,
+    and a last run with no such cell is joined to the run west of it,
+    so blocked cells never cut a run off. Needs NumPy.
+    """
+    np_rng, free, north_ok, east_ok, priority = _setup(gen)
+    width = gen.width
+
+    heads = np_rng.random(free.shape) < 0.5
+    east = east_ok & (heads | ~north_ok)
+    east[0] = east_ok[0]
+
+    starts, labels, best = _runs(east, priority)
+    stuck = (best < 0) & (starts >= width) & (starts % width > 0)
+    stuck[stuck] &= east_ok.ravel()[starts[stuck] - 1]
+    if stuck.any():
+        east.ravel()[starts[stuck] - 1] = True
+        starts, labels, best = _runs(east, priority)
+
+    flat_priority = priority.ravel()
+    north = ((flat_priority >= 0)
+             & (flat_priority == best[labels])).reshape(free.shape)
+
+    _write_walls(gen, north, east, free)
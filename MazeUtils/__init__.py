@@ -1,4 +1,6 @@
 from .display import Display
 from .parser import Parser
+from .sound import Sound
+from .viewport import Viewport
 
-__all__ = ["Parser", "Display"]
+__all__ = ["Parser", "Display", "Sound", "Viewport"]
@@ -0,0 +1,220 @@
+"""
+Non-interactive batch generation of many mazes from one config file.
+
+Usage:
+    python3 -m MazeUtils.batch config.txt --count 1000
+    python3 -m MazeUtils.batch config.txt --seeds 100:200 \
+        --output "mazes/maze_{seed}.txt" --workers 8
+
+Each maze uses the config with its own SEED and an OUTPUT_FILE built
+from the template, and a JSON manifest lists every maze written.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Any, Dict, List, Optional, Sequence
+import argparse
+import json
+import os
+import sys
+import time
+
+from Maze.generator import MazeGenerator
+from MazeUtils.parser import Parser
+
+
+class Batch:
+    """Generate and export mazes for a range of seeds in parallel."""
+
+    @staticmethod
+    def default_template(
+        output_file: str
+    ) -> str:
+        """
+        Derive an output template from OUTPUT_FILE.
+
+        Args:
+            output_file: OUTPUT_FILE of the config, e.g. maze.txt.
+
+        Returns:
+            The same path with _{seed} before the extension.
+        """
+        root, ext = os.path.splitext(output_file)
+        return f"{root}_{{seed}}{ext}"
+
+    @staticmethod
+    def generate_one(
+        config: Dict[str, Any],
+        template: str,
+        job: Sequence[int]
+    ) -> Dict[str, Any]:
+        """
+        Generate and export one maze; runs in a worker process.
+
+        Missing directories of the output path are created.
+
+        Args:
+            config: Parsed configuration shared by the batch.
+            template: Output path template with {seed} and {index}.
+            job: (index, seed) of the maze.
+
+        Returns:
+            Manifest entry: index, seed, output_file, path_length,
+            stats with STATS=True, and seconds, or error instead of
+            path_length on failure.
+        """
+        index, seed = job
+        output_file = template.format(index=index, seed=seed)
+        entry: Dict[str, Any] = {
+            "index": index,
+            "seed": seed,
+            "output_file": output_file,
+        }
+        start = time.perf_counter()
+        try:
+            os.makedirs(os.path.dirname(output_file) or ".", exist_ok=True)
+            maze_config = dict(config, SEED=seed, OUTPUT_FILE=output_file)
+            maze = MazeGenerator(maze_config)
+            maze.generate()
+            entry["path_length"] = len(maze.solution()) - 1
+            if maze_config.get("STATS"):
+                entry["stats"] = maze.stats()
+        except Exception as e:
+            entry["error"] = str(e)
+        entry["seconds"] = round(time.perf_counter() - start, 6)
+        return entry
+
+    @staticmethod
+    def run(
+        config: Dict[str, Any],
+        seeds: Sequence[int],
+        template: Optional[str] = None,
+        workers: Optional[int] = None,
+        manifest: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Generate one maze per seed on a process pool.
+
+        Every worker seeds its generator from the job, so a given seed
+        gives the same maze whatever the number of workers.
+
+        Args:
+            config: Parsed configuration shared by all mazes.
+            seeds: Seeds to generate, one maze each.
+            template: Output path template with {seed} and {index}
+                fields. Defaults to OUTPUT_FILE with _{seed} added.
+            workers: Number of processes. Defaults to the CPU count.
+            manifest: Path of the JSON manifest. Defaults to
+                manifest.json next to the first output file.
+
+        Returns:
+            The manifest: config, counts, total seconds and one entry
+            per maze in seed order.
+
+        Raises:
+            FileNotFoundError: If the manifest path is invalid.
+            PermissionError: If permission denied when writing manifest.
+        """
+        if template is None:
+            template = Batch.default_template(config['OUTPUT_FILE'])
+        if manifest is None:
+            first = template.format(index=0, seed=seeds[0] if seeds else 0)
+            manifest = os.path.join(
+                os.path.dirname(first), "manifest.json")
+        workers = workers or os.cpu_count() or 1
+        chunksize = max(1, len(seeds) // (workers * 4))
+
+        start = time.perf_counter()
+        worker = partial(Batch.generate_one, config, template)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            mazes: List[Dict[str, Any]] = list(
+                pool.map(worker, enumerate(seeds), chunksize=chunksize))
+
+        summary = {
+            "config": {
+                key: value for key, value in config.items()
+                if key not in ("SEED", "OUTPUT_FILE")
+            },
+            "template": template,
+            "count": len(mazes),
+            "failed": sum(1 for maze in mazes if "error" in maze),
+            "workers": workers,
+            "seconds": round(time.perf_counter() - start, 6),
+            "mazes": mazes,
+        }
+
+        try:
+            with open(manifest, "w") as f:
+                json.dump(summary, f, indent=1)
+                f.write("\n")
+
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Error: {manifest} not found")
+
+        except PermissionError:
+            raise PermissionError("Error: Permission denied")
+
+        return summary
+
+    @staticmethod
+    def parse_seeds(
+        text: str
+    ) -> range:
+        """
+        Parse a seed range written start:stop (stop excluded).
+
+        Args:
+            text: Range such as 100:200.
+
+        Returns:
+            The range of seeds.
+
+        Raises:
+            ValueError: If the range is malformed or empty.
+        """
+        try:
+            first, last = map(int, text.split(":"))
+        except ValueError:
+            raise ValueError(
+                f"Invalid seed range: expected start:stop got '{text}'")
+        if last <= first:
+            raise ValueError(f"Empty seed range: '{text}'")
+        return range(first, last)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the batch command line; returns the process exit status."""
+    parser = argparse.ArgumentParser(
+        prog="python3 -m MazeUtils.batch",
+        description="Generate many mazes from one config file.")
+    parser.add_argument("config", help="config file (see config.txt)")
+    group = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument("--count", type=int,
+                       help="number of mazes, seeds from SEED (or 0) up")
+    group.add_argument("--seeds", help="seed range start:stop")
+    parser.add_argument("--output",
+                        help="output template with {seed} and {index}")
+    parser.add_argument("--workers", type=int, help="worker processes")
+    parser.add_argument("--manifest", help="manifest path")
+    args = parser.parse_args(argv)
+
+    try:
+        config = Parser.parse_config(args.config)
+        if args.seeds is not None:
+            seeds = Batch.parse_seeds(args.seeds)
+        else:
+            first = config['SEED'] or 0
+            seeds = range(first, first + max(args.count, 0))
+        summary = Batch.run(
+            config, seeds, args.output, args.workers, args.manifest)
+
+    except Exception as e:
+        print(f"{e}", file=sys.stderr)
+        return 1
+
+    print(f"{summary['count'] - summary['failed']}/{summary['count']} "
+          f"mazes in {summary['seconds']:.2f}s")
+    return 1 if summary['failed'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,11 +1,48 @@
-from Maze.generator import Cell, MazeGenerator
-from typing import Any, Tuple, List, Optional
+from Maze.generator import MazeGenerator
+from Maze.distance import DistanceField
+from Maze.grid import MazeLike, as_grid, NORTH, EAST, SOUTH, WEST
+from Maze.palette import THEMES
+from typing import Any, Collection, Tuple, List, Optional
+import shutil
+import sys
 import time
 
+KIND_SPACE = 0
+KIND_PATH = 1
+KIND_FORTY_TWO = 2
+KIND_ENTRY = 3
+KIND_EXIT = 4
+KIND_WALL = 5
+
+MAX_FRAMES = 600
+GENERATION_FPS = 60
+
+HEAT_COLORS = (
+    21, 27, 33, 39, 45, 51, 50, 49, 48, 47, 46,
+    82, 118, 154, 190, 226, 220, 214, 208, 202, 196,
+)
+
 
 class Display:
     """Display maze in terminal with ASCII art and ANSI color support."""
 
+    @staticmethod
+    def theme_codes(
+        theme: str
+    ) -> Tuple[str, str, str, str, str]:
+        """
+        Look up the ANSI color codes of a theme.
+
+        Args:
+            theme: Theme name ('BLUE', 'YELLOW', 'PURPLE', 'DEFAULT');
+                unknown names get DEFAULT.
+
+        Returns:
+            SGR parameters (e.g. '94;1') of entry, exit, wall, path and
+            forty_two.
+        """
+        return THEMES.get(theme.upper(), THEMES["DEFAULT"])
+
     @staticmethod
     def theme_maze(
         theme: str
@@ -20,186 +57,495 @@ class Display:
             Tuple of formatted strings: entry, exit, wall, space, path,
             forty_two.
         """
-        entry = "██"
-        exit = "██"
-        wall = "██"
-        path = "██"
-        forty_two = "██"
+        entry, exit, wall, path, forty_two = (
+            f"\033[{code}m██\033[0m" for code in Display.theme_codes(theme)
+        )
         space = "  "
 
-        if theme.upper() == "BLUE":
-            entry = "\033[94;1m" + entry + "\033[0m"
-            exit = "\033[36;1m" + exit + "\033[0m"
-            wall = "\033[34m" + wall + "\033[0m"
-            path = "\033[96;1m" + path + "\033[0m"
-            forty_two = "\033[41;1m" + forty_two + "\033[0m"
-        elif theme.upper() == "YELLOW":
-            entry = "\033[93;1m" + entry + "\033[0m"
-            exit = "\033[91;1m" + exit + "\033[0m"
-            wall = "\033[33m" + wall + "\033[0m"
-            path = "\033[97;1m" + path + "\033[0m"
-            forty_two = "\033[93;1m" + forty_two + "\033[0m"
-        elif theme.upper() == "PURPLE":
-            entry = "\033[94m" + entry + "\033[0m"
-            exit = "\033[94;1m" + exit + "\033[0m"
-            wall = "\033[35m" + wall + "\033[0m"
-            path = "\033[96;1m" + path + "\033[0m"
-            forty_two = "\033[106;1m" + forty_two + "\033[0m"
-        else:
-            entry = "\033[31;1m" + entry + "\033[0m"
-            exit = "\033[37;1m" + exit + "\033[0m"
-            wall = "\033[97m" + wall + "\033[0m"
-            path = "\033[32;1m" + path + "\033[0m"
-            forty_two = "\033[31;1m" + forty_two + "\033[0m"
-
         return entry, exit, wall, space, path, forty_two
 
     @staticmethod
     def display_maze(
-        maze: list[list[Cell]],
+        maze: MazeLike,
         config: dict[str, Any],
         show_path: bool,
         theme: str,
-        forty_two_pos: List[Tuple[int, int]],
+        forty_two_pos: Collection[Tuple[int, int]],
         path_override: Optional[List[Tuple[int, int]]] = None,
+        solution: Optional[List[Tuple[int, int]]] = None,
     ) -> None:
         """
         Render maze with optional solution path and colors.
 
         Args:
-            maze: 2D list of Cell objects representing the maze.
-            config: Dict containing WIDTH, HEIGHT, ENTRY, EXIT.
+            maze: MazeGrid (or 2D list of Cell objects) of the maze.
+            config: Dict containing WIDTH, HEIGHT, ENTRY, EXIT,
+                optionally SOLVER.
             show_path: Whether to display the solution path.
             theme: Color theme name.
             forty_two_pos: Coordinates where the '42' pattern is located.
+            path_override: Path to draw instead of the solution.
+            solution: Solution path, e.g. MazeGenerator.solution(), so
+                the maze is not solved again. Solved from config when
+                None.
         """
         entry, exit, wall, space, path, forthy_two = (
             Display.theme_maze(theme)
         )
         if path_override is not None:
             path_to_exit = path_override
+        elif show_path and solution is not None:
+            path_to_exit = solution
         elif show_path:
             path_to_exit = MazeGenerator.solve_maze(
                 maze,
                 config['WIDTH'],
                 config['HEIGHT'],
                 config['ENTRY'],
-                config['EXIT']
+                config['EXIT'],
+                config.get('SOLVER', "BFS")
             )
         else:
             path_to_exit = []
 
-        for y in range(len(maze)):
-            top_line = ""
-            for x in range(len(maze[y])):
-                cell = maze[y][x]
-
-                top_line += wall
-                if cell.north:
-                    top_line += wall
-                elif ((x, y) in path_to_exit and (x, y-1) in path_to_exit
-                      and (show_path or path_override is not None)):
-                    top_line += path
-                else:
-                    top_line += space
-
-            top_line += wall
-
-            mid_line = ""
-            for x in range(len(maze[y])):
-                cell = maze[y][x]
-                if cell.west:
-                    mid_line += wall
-                elif ((x, y) in path_to_exit and (x-1, y) in path_to_exit
-                      and (show_path or path_override is not None)):
-                    mid_line += path
+        grid = as_grid(maze)
+        cells = grid.cells
+        width = grid.width
+        on_path = Display.path_mask(path_to_exit, width, grid.height)
+        kind = Display.cell_kinds(
+            on_path, width, config, forty_two_pos)
+        glyphs = (space, path, forthy_two, entry, exit)
+
+        lines = []
+        for row in range(0, len(cells), width):
+            top_line = []
+            mid_line = []
+            for i in range(row, row + width):
+                walls = cells[i]
+
+                top_line.append(wall)
+                if walls & NORTH:
+                    top_line.append(wall)
+                elif i >= width and on_path[i] and on_path[i - width]:
+                    top_line.append(path)
                 else:
-                    mid_line += space
-
-                if (x, y) == config["ENTRY"]:
-                    mid_line += entry
-                elif (x, y) == config["EXIT"]:
-                    mid_line += exit
-                elif (x, y) in forty_two_pos:
-                    mid_line += forthy_two
-                elif ((x, y) in path_to_exit and
-                      (show_path or path_override is not None)):
-                    mid_line += path
+                    top_line.append(space)
+
+                if walls & WEST:
+                    mid_line.append(wall)
+                elif i > row and on_path[i] and on_path[i - 1]:
+                    mid_line.append(path)
                 else:
-                    mid_line += space
+                    mid_line.append(space)
+                mid_line.append(glyphs[kind[i]])
 
-            if maze[y][-1].east:
-                mid_line += wall
-            else:
-                mid_line += space
-            print(top_line, flush=True)
-            print(mid_line, flush=True)
-
-        bot_line = ""
-        for x in range(len(maze[-1])):
-            cell = maze[-1][x]
-            bot_line += wall
-            if cell.south:
-                bot_line += wall
-            else:
-                bot_line += space
+            top_line.append(wall)
+            mid_line.append(
+                wall if cells[row + width - 1] & EAST else space)
+            lines.append("".join(top_line))
+            lines.append("".join(mid_line))
+
+        bot_line = []
+        for walls in cells[len(cells) - width:]:
+            bot_line.append(wall)
+            bot_line.append(wall if walls & SOUTH else space)
+        bot_line.append(wall)
+        lines.append("".join(bot_line))
+
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+
+    @staticmethod
+    def display_heatmap(
+        maze: MazeLike,
+        config: dict[str, Any],
+        field: DistanceField,
+        theme: str,
+        forty_two_pos: Collection[Tuple[int, int]],
+    ) -> None:
+        """
+        Render the distance field of a maze as a heatmap.
+
+        Each reachable cell is drawn in a 256-color ramp from blue (at
+        the source of the field) to red (farthest cell); unreachable
+        cells stay blank.
+
+        Args:
+            maze: MazeGrid (or 2D list of Cell objects) of the maze.
+            config: Dict containing ENTRY, EXIT.
+            field: Distance field of the maze, e.g. from
+                MazeGenerator.distance_field().
+            theme: Color theme name.
+            forty_two_pos: Coordinates where the '42' pattern is located.
+        """
+        entry, exit, wall, space, _, forty_two = Display.theme_maze(theme)
+        grid = as_grid(maze)
+        cells = grid.cells
+        width = grid.width
+        distance = field.distance
+        scale = len(HEAT_COLORS) - 1
+        longest = max(field.max_distance, 1)
+        heat = [f"\033[38;5;{color}m██\033[0m" for color in HEAT_COLORS]
+
+        shade = [
+            heat[steps * scale // longest] if steps >= 0 else space
+            for steps in distance
+        ]
+        glyph = list(shade)
+        for x, y in forty_two_pos:
+            glyph[y * width + x] = forty_two
+        entry_x, entry_y = config["ENTRY"]
+        exit_x, exit_y = config["EXIT"]
+        glyph[entry_y * width + entry_x] = entry
+        glyph[exit_y * width + exit_x] = exit
+
+        lines = []
+        for row in range(0, len(cells), width):
+            top_line = []
+            mid_line = []
+            for i in range(row, row + width):
+                walls = cells[i]
+
+                top_line.append(wall)
+                top_line.append(wall if walls & NORTH else shade[i])
+                mid_line.append(wall if walls & WEST else shade[i])
+                mid_line.append(glyph[i])
+
+            top_line.append(wall)
+            mid_line.append(
+                wall if cells[row + width - 1] & EAST else space)
+            lines.append("".join(top_line))
+            lines.append("".join(mid_line))
+
+        bot_line = []
+        for walls in cells[len(cells) - width:]:
+            bot_line.append(wall)
+            bot_line.append(wall if walls & SOUTH else space)
+        bot_line.append(wall)
+        lines.append("".join(bot_line))
+
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+
+    @staticmethod
+    def path_mask(
+        path: List[Tuple[int, int]],
+        width: int,
+        height: int
+    ) -> bytearray:
+        """
+        Turn a path into a per-cell mask.
+
+        Args:
+            path: List of (x, y) tuples on the path.
+            width: Maze width in cells.
+            height: Maze height in cells.
+
+        Returns:
+            Bytearray of width * height entries, 1 for cells on the path.
+        """
+        mask = bytearray(width * height)
+        for x, y in path:
+            mask[y * width + x] = 1
+        return mask
+
+    @staticmethod
+    def cell_kinds(
+        on_path: bytearray,
+        width: int,
+        config: dict[str, Any],
+        forty_two_pos: Collection[Tuple[int, int]]
+    ) -> bytearray:
+        """
+        Classify every cell for rendering.
+
+        Kinds: 0=space, 1=path, 2=forty_two, 3=entry, 4=exit, following
+        the order of the tuple returned by theme_maze.
+
+        Args:
+            on_path: Path mask as returned by path_mask.
+            width: Maze width in cells.
+            config: Dict containing ENTRY, EXIT.
+            forty_two_pos: Coordinates where the '42' pattern is located.
+
+        Returns:
+            Bytearray with one kind per cell.
+        """
+        kind = bytearray(on_path)
+        for x, y in forty_two_pos:
+            kind[y * width + x] = KIND_FORTY_TWO
+        entry_x, entry_y = config["ENTRY"]
+        exit_x, exit_y = config["EXIT"]
+        kind[entry_y * width + entry_x] = KIND_ENTRY
+        kind[exit_y * width + exit_x] = KIND_EXIT
+        return kind
+
+    @staticmethod
+    def fits_terminal(
+        width: int,
+        height: int
+    ) -> bool:
+        """
+        Tell whether a rendered maze fits in the current terminal.
+
+        Args:
+            width: Maze width in cells.
+            height: Maze height in cells.
+
+        Returns:
+            True if the frame is no wider and no taller than the terminal.
+        """
+        columns, lines = shutil.get_terminal_size()
+        return 4 * width + 2 <= columns and 2 * height + 1 <= lines
+
+    @staticmethod
+    def fits_width(
+        width: int
+    ) -> bool:
+        """
+        Tell whether a rendered maze is no wider than the terminal.
+
+        Taller mazes still read fine through the scrollback.
+
+        Args:
+            width: Maze width in cells.
 
-        bot_line += wall
-        print(bot_line, flush=True)
+        Returns:
+            True if the rows of display_maze fit in the terminal.
+        """
+        return 4 * width + 2 <= shutil.get_terminal_size().columns
 
     @staticmethod
     def animate_path(
-        maze: List[list[Cell]],
+        maze: MazeLike,
         config: dict[str, Any],
         theme: str,
-        forty_two_pos: List[Tuple[int, int]],
+        forty_two_pos: Collection[Tuple[int, int]],
         state: bool,
+        solution: Optional[List[Tuple[int, int]]] = None,
     ) -> None:
         """
         Animate the solution path revealing or hiding it step by step.
 
+        The maze is drawn once from the top-left corner of the terminal,
+        then each step only repaints the toggled cell and the wall gaps
+        around it using ANSI cursor positioning, so a frame costs the
+        same whatever the maze size. A maze larger than the terminal is
+        animated in a Viewport window that follows the head of the path
+        instead, each frame redrawing only the window. Long paths
+        advance several steps per frame to keep the animation under
+        MAX_FRAMES frames.
+
         Args:
-            maze: 2D list of Cell objects representing the maze.
-            config: Dict containing WIDTH, HEIGHT, ENTRY, EXIT.
+            maze: MazeGrid (or 2D list of Cell objects) of the maze.
+            config: Dict containing WIDTH, HEIGHT, ENTRY, EXIT,
+                optionally SOLVER.
             theme: Color theme name.
             forty_two_pos: Coordinates where the '42' pattern is located.
             state: True to reveal path, False to hide it.
+            solution: Solution path, e.g. MazeGenerator.solution(), so
+                the maze is not solved again. Solved from config when
+                None.
         """
-        path = MazeGenerator.solve_maze(
-            maze, config['WIDTH'], config['HEIGHT'],
-            config['ENTRY'], config['EXIT']
-        )
+        path = solution
+        if path is None:
+            path = MazeGenerator.solve_maze(
+                maze, config['WIDTH'], config['HEIGHT'],
+                config['ENTRY'], config['EXIT'], config.get('SOLVER', "BFS")
+            )
         if config['HEIGHT'] > 25:
             delay = 0.015
         else:
             delay = 0.025
+
+        grid = as_grid(maze)
+        cells = grid.cells
+        width = grid.width
+        height = grid.height
+        space = Display.theme_maze(theme)[3]
+        path_glyph = Display.theme_maze(theme)[4]
+        per_frame = max(1, -(-len(path) // MAX_FRAMES))
+
+        if not Display.fits_terminal(width, height):
+            Display.animate_window(
+                grid, config, theme, forty_two_pos, path, state,
+                per_frame, delay)
+            return
+
         if state:
-            revealed = []
-            for cell in path:
-                revealed.append(cell)
-
-                print("\033[H", end="")
-                Display.display_maze(
-                    maze,
-                    config,
-                    show_path=False,
-                    theme=theme,
-                    forty_two_pos=forty_two_pos,
-                    path_override=revealed
-                )
-                time.sleep(delay)
+            steps = path
+            on_path = Display.path_mask([], width, height)
         else:
-            revealed = [cell for cell in path]
-            while revealed:
-                revealed.pop()
-
-                print("\033[H", end="")
-                Display.display_maze(
-                    maze,
-                    config,
-                    show_path=False,
-                    theme=theme,
-                    forty_two_pos=forty_two_pos,
-                    path_override=revealed
-                )
-                time.sleep(delay)
+            steps = path[::-1]
+            on_path = Display.path_mask(path, width, height)
+        special = Display.cell_kinds(
+            bytearray(width * height), width, config, forty_two_pos)
+
+        sys.stdout.write("\033[H")
+        Display.display_maze(
+            maze,
+            config,
+            show_path=False,
+            theme=theme,
+            forty_two_pos=forty_two_pos,
+            path_override=[] if state else path
+        )
+
+        def gap(i: int, j: int) -> str:
+            return path_glyph if on_path[i] and on_path[j] else space
+
+        for first in range(0, len(steps), per_frame):
+            frame = []
+            for x, y in steps[first:first + per_frame]:
+                i = y * width + x
+                on_path[i] = state
+                walls = cells[i]
+                line = 2 * y + 1
+                column = 4 * x + 1
+
+                if not special[i]:
+                    frame.append(f"\033[{line + 1};{column + 2}H")
+                    frame.append(path_glyph if state else space)
+                if y > 0 and not walls & NORTH and on_path[i - width]:
+                    frame.append(f"\033[{line};{column + 2}H")
+                    frame.append(gap(i, i - width))
+                if (y < height - 1 and not walls & SOUTH
+                        and on_path[i + width]):
+                    frame.append(f"\033[{line + 2};{column + 2}H")
+                    frame.append(gap(i, i + width))
+                if x > 0 and not walls & WEST and on_path[i - 1]:
+                    frame.append(f"\033[{line + 1};{column}H")
+                    frame.append(gap(i, i - 1))
+                if x < width - 1 and not walls & EAST and on_path[i + 1]:
+                    frame.append(f"\033[{line + 1};{column + 4}H")
+                    frame.append(gap(i, i + 1))
+
+            sys.stdout.write("".join(frame))
+            sys.stdout.flush()
+            time.sleep(delay)
+
+        sys.stdout.write(f"\033[{2 * height + 2};1H")
+        sys.stdout.flush()
+
+    @staticmethod
+    def animate_window(
+        maze: MazeLike,
+        config: dict[str, Any],
+        theme: str,
+        forty_two_pos: Collection[Tuple[int, int]],
+        path: List[Tuple[int, int]],
+        state: bool,
+        per_frame: int,
+        delay: float,
+    ) -> None:
+        """
+        Animate a path in a Viewport window, for mazes too large to draw.
+
+        The window uses the BLOCK mode of display_maze when the maze is
+        narrow enough, QUAD otherwise, and is centered on the last cell
+        of each frame. A frame costs the size of the terminal, not of
+        the maze.
+
+        Args:
+            maze: MazeGrid (or 2D list of Cell objects) of the maze.
+            config: Dict containing ENTRY, EXIT.
+            theme: Color theme name.
+            forty_two_pos: Coordinates where the '42' pattern is located.
+            path: Solution path as (x, y) tuples.
+            state: True to reveal path, False to hide it.
+            per_frame: Path steps drawn per frame.
+            delay: Pause in seconds between frames.
+        """
+        from .viewport import Viewport
+
+        grid = as_grid(maze)
+        columns, lines = shutil.get_terminal_size()
+        lines -= 1
+        mode = "BLOCK" if 4 * grid.width + 2 <= columns else "QUAD"
+        view = Viewport(grid, config, theme, forty_two_pos,
+                        [] if state else path, mode)
+        steps = path if state else path[::-1]
+
+        sys.stdout.write("\033[H\033[2J")
+        for first in range(0, len(steps), per_frame):
+            for x, y in steps[first:first + per_frame]:
+                view.mark_path(x, y, state)
+            view.center(x, y, columns, lines)
+            rows = view.render(columns, lines)
+            sys.stdout.write("\033[H" + "\033[K\n".join(rows) + "\033[K")
+            sys.stdout.flush()
+            time.sleep(delay)
+
+        sys.stdout.write("\n")
+        sys.stdout.flush()
+
+    @staticmethod
+    def animate_generation(
+        maze: MazeGenerator,
+        theme: str,
+        algorithm: Optional[str] = None,
+        fps: int = GENERATION_FPS,
+    ) -> None:
+        """
+        Generate a maze while drawing each wall as it is carved.
+
+        The fully walled maze is drawn once from the top-left corner of
+        the terminal, then the carve events of
+        MazeGenerator.carve_steps() are drawn as they come, each one
+        repainting a single wall gap with ANSI cursor positioning. The
+        events are batched so the build takes at most MAX_FRAMES frames,
+        and frames are flushed at fps. Nothing is exported; call
+        maze.export() afterwards.
+
+        Args:
+            maze: Generator to carve, not generated yet.
+            theme: Color theme name.
+            algorithm: Name of a registered algorithm, as for
+                MazeGenerator.generate().
+            fps: Target frames per second.
+
+        Raises:
+            Exception: If maze is too small to place '42' pattern.
+            ValueError: If the algorithm name is unknown.
+        """
+        steps = maze.carve_steps(algorithm)
+        grid = maze.maze
+        width = grid.width
+        height = grid.height
+        space = Display.theme_maze(theme)[3]
+
+        sys.stdout.write("\033[H")
+        Display.display_maze(
+            grid, maze.config, False, theme, maze.forty_two_pos)
+
+        carved = width * height - len(maze.forty_two_pos) - 1
+        per_frame = max(1, -(-carved // MAX_FRAMES))
+        interval = 1.0 / fps
+        deadline = time.perf_counter()
+        frame = []
+
+        for i, wall in steps:
+            line = 2 * (i // width) + 2
+            column = 4 * (i % width) + 3
+            if wall == NORTH:
+                line -= 1
+            elif wall == SOUTH:
+                line += 1
+            elif wall == WEST:
+                column -= 2
+            else:
+                column += 2
+            frame.append(f"\033[{line};{column}H{space}")
+
+            if len(frame) >= per_frame:
+                sys.stdout.write("".join(frame))
+                sys.stdout.flush()
+                frame = []
+                deadline += interval
+                pause = deadline - time.perf_counter()
+                if pause > 0:
+                    time.sleep(pause)
+
+        frame.append(f"\033[{2 * height + 2};1H")
+        sys.stdout.write("".join(frame))
+        sys.stdout.flush()
@@ -1,3 +1,8 @@
+from Maze.generator import ALGORITHMS
+from Maze.binary import COMPRESSIONS
+from Maze.solvers import SOLVERS
+from Maze.image import IMAGE_FORMATS
+from Maze.palette import THEMES
 from typing import Any
 
 
@@ -14,11 +19,12 @@ class Parser:
 
         Args:
             key: Configuration key (WIDTH, HEIGHT, ENTRY, EXIT,
-                PERFECT, SEED, OUTPUT_FILE).
+                PERFECT, SEED, OUTPUT_FILE, ALGORITHM, STREAM, FORMAT,
+                COMPRESSION, LOOPS, SOLVER, STATS, THEME, SCALE).
             str_value: String value to parse.
 
         Returns:
-            Parsed value with appropriate type (int, bool, tuple,
+            Parsed value with appropriate type (int, float, bool, tuple,
             str, or None).
 
         Raises:
@@ -39,6 +45,12 @@ class Parser:
                 raise ValueError(f"{key} has negative values.")
             return return_value
 
+        if key == "SCALE":
+            return_value = int(str_value)
+            if return_value < 1:
+                raise ValueError("SCALE must be a positive integer.")
+            return return_value
+
         if key in ("ENTRY", "EXIT"):
             value = tuple(map(int, str_value.split(",")))
             if len(value) != 2:
@@ -51,7 +63,7 @@ class Parser:
                 raise ValueError(f"{key} has negative values.")
             return value
 
-        if key == "PERFECT":
+        if key in ("PERFECT", "STREAM", "STATS"):
             if str_value.lower() == "true":
                 return True
             if str_value.lower() == "false":
@@ -61,6 +73,70 @@ class Parser:
                 f"expected true or false got '{str_value}'"
             )
 
+        if key == "ALGORITHM":
+            name = str_value.upper()
+            if name not in ALGORITHMS:
+                raise ValueError(
+                    f"Invalid format for {key}: expected one of "
+                    f"{', '.join(ALGORITHMS)} got '{str_value}'"
+                )
+            return name
+
+        if key == "LOOPS":
+            try:
+                loops = (float(str_value) if "." in str_value
+                         else int(str_value))
+            except ValueError:
+                raise ValueError(
+                    "LOOPS must be a wall count or a ratio below 1.")
+            if loops < 0:
+                raise ValueError(
+                    "LOOPS must be a wall count or a ratio below 1.")
+            if isinstance(loops, float) and loops >= 1:
+                raise ValueError(
+                    f"Invalid ratio for {key}: expected a value below 1, "
+                    f"got '{str_value}' (write a wall count without a "
+                    "decimal point)"
+                )
+            return loops
+
+        if key == "FORMAT":
+            name = str_value.upper()
+            formats = ("HEX", "BINARY") + IMAGE_FORMATS
+            if name not in formats:
+                raise ValueError(
+                    f"Invalid format for {key}: expected one of "
+                    f"{', '.join(formats)} got '{str_value}'"
+                )
+            return name
+
+        if key == "THEME":
+            name = str_value.upper()
+            if name not in THEMES:
+                raise ValueError(
+                    f"Invalid format for {key}: expected one of "
+                    f"{', '.join(THEMES)} got '{str_value}'"
+                )
+            return name
+
+        if key == "COMPRESSION":
+            name = str_value.upper()
+            if name not in COMPRESSIONS:
+                raise ValueError(
+                    f"Invalid format for {key}: expected one of "
+                    f"{', '.join(COMPRESSIONS)} got '{str_value}'"
+                )
+            return name
+
+        if key == "SOLVER":
+            name = str_value.upper()
+            if name not in SOLVERS:
+                raise ValueError(
+                    f"Invalid format for {key}: expected one of "
+                    f"{', '.join(SOLVERS)} got '{str_value}'"
+                )
+            return name
+
         return str_value
 
     @staticmethod
@@ -117,6 +193,12 @@ class Parser:
         if "SEED" not in config:
             config['SEED'] = None
 
+        if "ALGORITHM" not in config:
+            config['ALGORITHM'] = "DFS"
+
+        if "STREAM" not in config:
+            config['STREAM'] = False
+
         for key in key_required:
             if key not in config:
                 raise KeyError(f"{key} not found in {path}.")
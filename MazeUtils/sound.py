@@ -0,0 +1,69 @@
+from typing import Any, Dict, Optional
+import os
+import sys
+import time
+
+ASSETS_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "assets")
+
+
+class Sound:
+    """Play sound effects through a mixer opened once, on first use."""
+
+    _mixer: Any = None
+    _error: Optional[Exception] = None
+    _sounds: Dict[str, Any] = {}
+
+    @staticmethod
+    def mixer() -> Any:
+        """
+        Import pygame and initialize its mixer the first time only.
+
+        Returns:
+            The pygame.mixer module, ready to play.
+
+        Raises:
+            Exception: The import or initialization error, kept from the
+                first attempt so a missing pygame is not retried.
+        """
+        if Sound._error is not None:
+            raise Sound._error
+        if Sound._mixer is None:
+            try:
+                os.environ["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
+                import pygame
+                pygame.mixer.init()
+                Sound._mixer = pygame.mixer
+            except Exception as e:
+                Sound._error = e
+                raise
+        return Sound._mixer
+
+    @staticmethod
+    def play(name: str, wait: bool = True) -> None:
+        """
+        Play an asset, ignore if not available.
+
+        The asset is loaded on its first play and kept for later ones.
+
+        Args:
+            name: Asset name without extension ('error', 'bye', 'win').
+            wait: Block until the sound has finished.
+        """
+        try:
+            sound = Sound._sounds.get(name)
+            if sound is None:
+                sound = Sound.mixer().Sound(
+                    os.path.join(ASSETS_DIR, f"{name}.mp3"))
+                Sound._sounds[name] = sound
+            channel = sound.play()
+
+            while wait and channel is not None and channel.get_busy():
+                time.sleep(0.01)
+
+        except Exception as e:
+            print(f"\033[41;1m {e} \033[0m")
+
+        except KeyboardInterrupt:
+            print("Exit program")
+            sys.exit(1)
@@ -0,0 +1,364 @@
+from Maze.grid import MazeLike, as_grid, NORTH, EAST, SOUTH, WEST
+from .display import (
+    Display, KIND_SPACE, KIND_PATH, KIND_FORTY_TWO, KIND_ENTRY, KIND_EXIT,
+    KIND_WALL,
+)
+from typing import Any, Collection, Dict, List, Optional, Tuple
+import os
+import shutil
+import sys
+
+MODES = ("BLOCK", "HALF", "QUAD")
+
+_MODE_SCALE = {
+    "BLOCK": (1, 1, 2),
+    "HALF": (1, 2, 1),
+    "QUAD": (2, 2, 1),
+}
+
+_QUADRANTS = " ▘▝▀▖▌▞▛▗▚▐▜▄▙▟█"
+
+_PRIORITY = {
+    KIND_SPACE: 0, KIND_WALL: 1, KIND_PATH: 2, KIND_FORTY_TWO: 3,
+    KIND_ENTRY: 4, KIND_EXIT: 4,
+}
+
+_KEYS = {
+    "\033[A": (0, -1), "k": (0, -1), "w": (0, -1),
+    "\033[B": (0, 1), "j": (0, 1), "s": (0, 1),
+    "\033[D": (-1, 0), "h": (-1, 0), "a": (-1, 0),
+    "\033[C": (1, 0), "l": (1, 0), "d": (1, 0),
+}
+
+STATUS_KEYS = "arrows/hjkl: pan  +/-: zoom  g: home  q: quit"
+
+
+class Viewport:
+    """
+    Render a window of a maze too large for the terminal.
+
+    The maze is seen as a picture of (2 * WIDTH + 1) x (2 * HEIGHT + 1)
+    pixels, the same layout as Display.display_maze: odd rows and
+    columns are cells, the others walls and corners. Only the pixels
+    inside the window are computed, so a frame costs the same whatever
+    the maze size. Three modes pack more of the maze on screen:
+
+        BLOCK  one pixel per two columns, as display_maze
+        HALF   one pixel per column, two pixel rows per line (▀ ▄ █)
+        QUAD   2x2 pixels per character with quadrant glyphs
+
+    HALF and QUAD draw every non-space pixel of a character in one
+    color, the one of its most important kind (entry and exit, then
+    '42', path, walls).
+
+    Attributes:
+        x: Left pixel column of the window.
+        y: Top pixel row of the window.
+        mode: One of MODES.
+    """
+
+    def __init__(
+        self,
+        maze: MazeLike,
+        config: Dict[str, Any],
+        theme: str,
+        forty_two_pos: Collection[Tuple[int, int]],
+        solution: Optional[List[Tuple[int, int]]] = None,
+        mode: str = "QUAD",
+    ) -> None:
+        """
+        Prepare the maze for rendering.
+
+        Args:
+            maze: MazeGrid (or 2D list of Cell objects) of the maze.
+            config: Dict containing ENTRY, EXIT.
+            theme: Color theme name.
+            forty_two_pos: Coordinates where the '42' pattern is located.
+            solution: Path to draw, e.g. MazeGenerator.solution(); no
+                path is drawn when None.
+            mode: One of MODES.
+
+        Raises:
+            ValueError: If the mode is unknown.
+        """
+        if mode.upper() not in MODES:
+            raise ValueError(f"Unknown viewport mode: {mode}")
+        self.grid = as_grid(maze)
+        self.on_path = Display.path_mask(
+            solution or [], self.grid.width, self.grid.height)
+        self.kind = Display.cell_kinds(
+            self.on_path, self.grid.width, config, forty_two_pos)
+        self.pixel_width = 2 * self.grid.width + 1
+        self.pixel_height = 2 * self.grid.height + 1
+        self.mode = mode.upper()
+        self.x = 0
+        self.y = 0
+        self.theme = theme
+        self._glyphs: Dict[Tuple[int, ...], Tuple[str, str]] = {}
+
+        entry, exit, wall, path, forty_two = Display.theme_codes(theme)
+        self._codes = ("", path, forty_two, entry, exit, wall)
+        self._blocks = tuple(
+            f"\033[{code}m██\033[0m" if code else "  "
+            for code in self._codes)
+
+    def pixel_row(self, py: int, x0: int, x1: int) -> bytearray:
+        """
+        Compute the kinds of a range of pixels in one pixel row.
+
+        Args:
+            py: Pixel row, 0 to 2 * HEIGHT.
+            x0: First pixel column.
+            x1: Pixel column after the last one; clipped to the maze.
+
+        Returns:
+            One KIND_* value per pixel from x0 to min(x1, 2 * WIDTH + 1).
+        """
+        cells = self.grid.cells
+        width = self.grid.width
+        on_path = self.on_path
+        row = bytearray()
+        push = row.append
+        x1 = min(x1, self.pixel_width)
+
+        if py % 2:
+            base = (py // 2) * width
+            kind = self.kind
+            for px in range(x0, x1):
+                i = base + px // 2
+                if px % 2:
+                    push(kind[i])
+                elif px == 2 * width:
+                    push(KIND_WALL if cells[i - 1] & EAST else KIND_SPACE)
+                elif cells[i] & WEST:
+                    push(KIND_WALL)
+                elif px and on_path[i] and on_path[i - 1]:
+                    push(KIND_PATH)
+                else:
+                    push(KIND_SPACE)
+            return row
+
+        y = py // 2
+        bottom = y == self.grid.height
+        base = (y - 1 if bottom else y) * width
+        for px in range(x0, x1):
+            i = base + px // 2
+            if not px % 2:
+                push(KIND_WALL)
+            elif bottom:
+                push(KIND_WALL if cells[i] & SOUTH else KIND_SPACE)
+            elif cells[i] & NORTH:
+                push(KIND_WALL)
+            elif y and on_path[i] and on_path[i - width]:
+                push(KIND_PATH)
+            else:
+                push(KIND_SPACE)
+        return row
+
+    def window(self, columns: int, lines: int) -> Tuple[int, int]:
+        """
+        Return the size in pixels of a window of the terminal.
+
+        Args:
+            columns: Terminal columns available.
+            lines: Terminal lines available.
+
+        Returns:
+            (pixel columns, pixel rows) shown in the current mode.
+        """
+        across, down, glyph_columns = _MODE_SCALE[self.mode]
+        return (max(columns // glyph_columns, 1) * across,
+                max(lines, 1) * down)
+
+    def _glyph(self, key: Tuple[int, ...]) -> Tuple[str, str]:
+        """Return the color code and quadrant glyph of four pixel kinds."""
+        glyph = self._glyphs.get(key)
+        if glyph is None:
+            shape = 0
+            kind = KIND_SPACE
+            for bit, k in enumerate(key):
+                if k != KIND_SPACE:
+                    shape |= 1 << bit
+                    if _PRIORITY[k] > _PRIORITY[kind]:
+                        kind = k
+            glyph = (self._codes[kind], _QUADRANTS[shape])
+            self._glyphs[key] = glyph
+        return glyph
+
+    def render(self, columns: int, lines: int) -> List[str]:
+        """
+        Render the window at the current position.
+
+        Args:
+            columns: Terminal columns available.
+            lines: Terminal lines available.
+
+        Returns:
+            At most lines strings, each at most columns wide once the
+            color codes are left out.
+        """
+        self.clamp(columns, lines)
+        across, down, _ = _MODE_SCALE[self.mode]
+        view_w, view_h = self.window(columns, lines)
+        x0, x1 = self.x, self.x + view_w
+        out = []
+
+        for top in range(self.y, min(self.y + view_h, self.pixel_height),
+                         down):
+            upper = self.pixel_row(top, x0, x1)
+            if self.mode == "BLOCK":
+                blocks = self._blocks
+                out.append("".join(blocks[k] for k in upper))
+                continue
+            if top + 1 < self.pixel_height:
+                lower = self.pixel_row(top + 1, x0, x1)
+            else:
+                lower = bytearray(len(upper))
+            if across == 1:
+                keys = zip(upper, upper, lower, lower)
+            else:
+                upper.append(KIND_SPACE)
+                lower.append(KIND_SPACE)
+                keys = zip(upper[::2], upper[1::2], lower[::2], lower[1::2])
+            line = []
+            current = ""
+            for key in keys:
+                code, char = self._glyph(key)
+                if code != current:
+                    line.append(f"\033[{code}m" if code else "\033[0m")
+                    current = code
+                line.append(char)
+            if current:
+                line.append("\033[0m")
+            out.append("".join(line))
+        return out
+
+    def clamp(self, columns: int, lines: int) -> None:
+        """Keep the window inside the maze for a terminal size."""
+        view_w, view_h = self.window(columns, lines)
+        self.x = max(0, min(self.x, self.pixel_width - view_w))
+        self.y = max(0, min(self.y, self.pixel_height - view_h))
+
+    def mark_path(self, x: int, y: int, state: bool) -> None:
+        """
+        Add a cell to the drawn path or remove it, e.g. to animate it.
+
+        Args:
+            x: Cell column.
+            y: Cell row.
+            state: True to draw the cell on the path, False to clear it.
+                Entry, exit and '42' cells keep their own color.
+        """
+        i = y * self.grid.width + x
+        self.on_path[i] = state
+        if self.kind[i] <= KIND_PATH:
+            self.kind[i] = KIND_PATH if state else KIND_SPACE
+
+    def center(self, x: int, y: int, columns: int, lines: int) -> None:
+        """
+        Move the window so a cell is at its center.
+
+        Args:
+            x: Cell column.
+            y: Cell row.
+            columns: Terminal columns available.
+            lines: Terminal lines available.
+        """
+        view_w, view_h = self.window(columns, lines)
+        self.x = 2 * x + 1 - view_w // 2
+        self.y = 2 * y + 1 - view_h // 2
+        self.clamp(columns, lines)
+
+    def pan(self, dx: int, dy: int, columns: int, lines: int) -> None:
+        """
+        Move the window by a quarter of its size per step.
+
+        Args:
+            dx: Steps right (negative for left).
+            dy: Steps down (negative for up).
+            columns: Terminal columns available.
+            lines: Terminal lines available.
+        """
+        view_w, view_h = self.window(columns, lines)
+        self.x += dx * max(view_w // 4, 1)
+        self.y += dy * max(view_h // 4, 1)
+        self.clamp(columns, lines)
+
+    def zoom(self, step: int, columns: int, lines: int) -> None:
+        """
+        Switch to a denser (step > 0) or larger (step < 0) mode.
+
+        The pixel at the center of the window stays at the center.
+
+        Args:
+            step: Number of modes to move along MODES.
+            columns: Terminal columns available.
+            lines: Terminal lines available.
+        """
+        index = min(max(MODES.index(self.mode) + step, 0), len(MODES) - 1)
+        view_w, view_h = self.window(columns, lines)
+        center_x = self.x + view_w // 2
+        center_y = self.y + view_h // 2
+        self.mode = MODES[index]
+        view_w, view_h = self.window(columns, lines)
+        self.x = center_x - view_w // 2
+        self.y = center_y - view_h // 2
+        self.clamp(columns, lines)
+
+    def status(
+        self, columns: int, lines: int, keys: str = STATUS_KEYS
+    ) -> str:
+        """Describe the cells in view and the keys, for the last line."""
+        view_w, view_h = self.window(columns, lines)
+        right = min(self.x + view_w, self.pixel_width) // 2
+        bottom = min(self.y + view_h, self.pixel_height) // 2
+        return (f" {self.mode} x {self.x // 2}-{right} "
+                f"y {self.y // 2}-{bottom} of "
+                f"{self.grid.width}x{self.grid.height} | {keys}"
+                )[:columns]
+
+    def draw(self) -> None:
+        """Draw the window and the status line over the whole terminal."""
+        columns, lines = shutil.get_terminal_size()
+        rows = self.render(columns, lines - 1)
+        rows += [""] * (lines - 1 - len(rows))
+        sys.stdout.write(
+            "\033[H" + "\033[K\n".join(rows) + "\033[K\n"
+            + "\033[7m" + self.status(columns, lines - 1) + "\033[0m\033[K")
+        sys.stdout.flush()
+
+    def explore(self) -> None:
+        """
+        Show the maze full screen and pan or zoom with the keyboard.
+
+        Arrows, hjkl or wasd pan by a quarter of the window, + and -
+        zoom in and out through MODES, g goes back to the top-left
+        corner and q or Escape leaves. Needs a POSIX terminal.
+        """
+        import termios
+        import tty
+
+        fd = sys.stdin.fileno()
+        saved = termios.tcgetattr(fd)
+        try:
+            tty.setcbreak(fd)
+            sys.stdout.write("\033[?25l\033[2J")
+            while True:
+                self.draw()
+                key = os.read(fd, 8).decode(errors="ignore")
+                columns, lines = shutil.get_terminal_size()
+                lines -= 1
+                if key in ("q", "Q", "\033"):
+                    break
+                if key in _KEYS:
+                    self.pan(*_KEYS[key], columns, lines)
+                elif key in ("+", "="):
+                    self.zoom(-1, columns, lines)
+                elif key in ("-", "_"):
+                    self.zoom(1, columns, lines)
+                elif key in ("g", "G"):
+                    self.x = self.y = 0
+        finally:
+            termios.tcsetattr(fd, termios.TCSADRAIN, saved)
+            sys.stdout.write("\033[0m\033[?25h\033[2J\033[H")
+            sys.stdout.flush()
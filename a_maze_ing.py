@@ -9,76 +9,74 @@ Usage:
 
 Where config.txt contains maze configuration parameters.
 """
-from Maze.generator import MazeGenerator
+from Maze.generator import MazeGenerator, ALGORITHMS, STEPPERS
+from Maze.stream import stream_to
 from MazeUtils.parser import Parser
 from MazeUtils.display import Display
+from MazeUtils.sound import Sound
+from MazeUtils.viewport import Viewport
+import shutil
 import sys
-import os
 
+ALGORITHM_LABELS = {
+    "DFS": "Depth-First Search",
+    "BFS": "Breadth-First Search",
+}
 
-def clear() -> None:
-    """Clear the terminal screen."""
-    os.system("cls" if os.name == "nt" else "clear")
+MENU_LINES = 14
+MENU_VIEW_KEYS = "6: pan/zoom"
 
 
-def sound_error() -> None:
-    """Play error sound effect, ignore if not available."""
-    try:
-        os.environ["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
-        import pygame
-        pygame.mixer.init()
-        pygame.mixer.music.load("assets/error.mp3")
-        pygame.mixer.music.play()
-
-        while pygame.mixer.music.get_busy():
-            continue
+def clear() -> None:
+    """Clear the terminal screen with ANSI sequences (no subprocess)."""
+    sys.stdout.write("\033[H\033[2J\033[3J")
+    sys.stdout.flush()
 
-    except Exception as e:
-        print(f"\033[41;1m {e} \033[0m")
 
-    except KeyboardInterrupt:
-        print("Exit program")
-        sys.exit(1)
+def algorithm_prompt(names: list[str]) -> str:
+    """
+    Build the algorithm menu from the registered algorithms.
 
+    Args:
+        names: Algorithm names (keys of ALGORITHMS) in menu order.
 
-def exit_sound() -> None:
-    """Play exit sound effect, ignore if not available."""
-    try:
-        os.environ["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
-        import pygame
-        pygame.mixer.init()
-        pygame.mixer.music.load("assets/bye.mp3")
-        pygame.mixer.music.play()
-
-        while pygame.mixer.music.get_busy():
-            continue
+    Returns:
+        The menu box and its prompt; algorithms that carve live
+        (see STEPPERS) are marked so.
+    """
+    entries = []
+    for number, name in enumerate(names, 1):
+        label = ALGORITHM_LABELS.get(
+            name, name.replace("_", " ").capitalize())
+        if name in STEPPERS:
+            label += " (live)"
+        entries.append(f"{number}. {label}")
+    inner = max([31] + [len(entry) + 2 for entry in entries])
+    left = (inner - 31) // 2
+    right = inner - 31 - left
+    return (
+        f"╔{'═' * inner}╗\n"
+        f"║{' ' * left} ☝🤓 Choose your algorithm ☝🤓 {' ' * right}║\n"
+        f"╠{'═' * inner}╣\n"
+        + "".join(f"║ {entry:<{inner - 2}} ║\n" for entry in entries)
+        + f"╚══╦{'═' * (inner - 3)}╝\n"
+        f"   ╚◎ Choice? (1-{len(names)}): "
+    )
 
-    except Exception as e:
-        print(f"\033[41;1m {e} \033[0m")
 
-    except KeyboardInterrupt:
-        print("Exit program")
-        sys.exit(1)
+def sound_error() -> None:
+    """Play error sound effect, ignore if not available."""
+    Sound.play("error")
 
 
-def win_sound() -> None:
+def exit_sound() -> None:
     """Play exit sound effect, ignore if not available."""
-    try:
-        os.environ["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
-        import pygame
-        pygame.mixer.init()
-        pygame.mixer.music.load("assets/win.mp3")
-        pygame.mixer.music.play()
-
-        while pygame.mixer.music.get_busy():
-            continue
+    Sound.play("bye")
 
-    except Exception as e:
-        print(f"\033[41;1m {e} \033[0m")
 
-    except KeyboardInterrupt:
-        print("Exit program")
-        sys.exit(1)
+def win_sound() -> None:
+    """Play win sound effect, ignore if not available."""
+    Sound.play("win")
 
 
 def settings_manager(fconfig: str) -> None:
@@ -87,7 +85,7 @@ def settings_manager(fconfig: str) -> None:
 
     This function provides a terminal interface to view and modify
     individual keys in a configuration file. It supports:
-    - WIDTH, HEIGHT, ENTRY, EXIT, OUTPUT_FILE, PERFECT, SEED
+    - WIDTH, HEIGHT, ENTRY, EXIT, OUTPUT_FILE, PERFECT, SEED, ALGORITHM
     - backing up the file if errors occur
     - retrying on invalid inputs
     - handling Ctrl+C to exit gracefully
@@ -108,6 +106,7 @@ def settings_manager(fconfig: str) -> None:
         "5": "OUTPUT_FILE",
         "6": "PERFECT",
         "7": "SEED",
+        "8": "ALGORITHM",
     }
 
     error = ""
@@ -130,14 +129,15 @@ def settings_manager(fconfig: str) -> None:
                 "║  5. OUTPUT_FILE          ║\n"
                 "║  6. PERFECT              ║\n"
                 "║  7. SEED                 ║\n"
-                "║  8. Exit to Menu         ║\n"
+                "║  8. ALGORITHM            ║\n"
+                "║  9. Exit to Menu         ║\n"
                 "╚══╦═══════════════════════╝\n"
-                "   ╚◎ Choice? (1-8): "
+                "   ╚◎ Choice? (1-9): "
             ))
 
-            if 1 <= answer <= 8:
+            if 1 <= answer <= 9:
 
-                if answer == 8:
+                if answer == 9:
                     return
 
                 key = settings[str(answer)]
@@ -194,11 +194,15 @@ def settings_manager(fconfig: str) -> None:
                         )
 
                         with open(fconfig, "w") as f:
+                            found = False
                             for line in lines:
                                 if line.strip().startswith(key + "="):
                                     f.write(f"{key}={answer_option}\n")
+                                    found = True
                                 else:
                                     f.write(line)
+                            if not found:
+                                f.write(f"{key}={answer_option}\n")
 
                         try:
                             config = Parser.parse_config(fconfig)
@@ -226,10 +230,10 @@ def settings_manager(fconfig: str) -> None:
                         return
 
             else:
-                error = "Please choose between 1 and 8."
+                error = "Please choose between 1 and 9."
 
         except ValueError:
-            error = "Please choose between 1 and 8."
+            error = "Please choose between 1 and 9."
             continue
 
         except Exception as e:
@@ -254,6 +258,11 @@ if __name__ == "__main__":
 
             try:
                 config = Parser.parse_config(config_path)
+                if config['STREAM']:
+                    stream_to(config)
+                    print(f"Maze streamed to {config['OUTPUT_FILE']}")
+                    sys.exit(0)
+
                 maze = MazeGenerator(config)
                 maze.generate()
 
@@ -278,11 +287,23 @@ if __name__ == "__main__":
                 clear()
 
                 try:
-                    if not error:
+                    if not error and Display.fits_width(config['WIDTH']):
                         Display.display_maze(
                             (maze.maze), config,
-                            show_path, theme[theme_index], maze.forty_two
+                            show_path, theme[theme_index], maze.forty_two_pos,
+                            solution=maze.solution() if show_path else None
+                        )
+                    elif not error:
+                        columns, lines = shutil.get_terminal_size()
+                        view = Viewport(
+                            maze.maze, config, theme[theme_index],
+                            maze.forty_two_pos,
+                            maze.solution() if show_path else None
                         )
+                        height = lines - MENU_LINES - 1
+                        print("\n".join(view.render(columns, height)))
+                        print("\033[7m" + view.status(
+                            columns, height, MENU_VIEW_KEYS) + "\033[0m")
 
                 except KeyboardInterrupt:
                     clear()
@@ -310,17 +331,19 @@ if __name__ == "__main__":
                         "║  3. Rotate colors        ║\n"
                         "║  4. Export maze          ║\n"
                         "║  5. Change config        ║\n"
-                        "║  6. Quit                 ║\n"
+                        "║  6. Explore maze         ║\n"
+                        "║  7. Quit                 ║\n"
                         "╚══╦═══════════════════════╝\n"
-                        "   ╚◎ Choice? (1-6): "
+                        "   ╚◎ Choice? (1-7): "
                     ))
 
-                    if 1 <= answer <= 6:
+                    if 1 <= answer <= 7:
 
                         if answer == 1:
 
                             wErr = ""
                             maze = MazeGenerator(config)
+                            names = list(ALGORITHMS)
                             while True:
                                 try:
                                     clear()
@@ -328,29 +351,30 @@ if __name__ == "__main__":
                                         print(f"\033[41;1m {wErr} \033[0m\n")
                                         sound_error()
                                     algo_input = int(input(
-                                        "╔═══════════════════════════════╗\n"
-                                        "║ ☝🤓 Choose your algorithm ☝🤓 ║\n"
-                                        "╠═══════════════════════════════╣\n"
-                                        "║ 1. Depth-First Search (DFS)   ║\n"
-                                        "║ 2. Breadth-First Search (BFS) ║\n"
-                                        "╚══╦════════════════════════════╝\n"
-                                        "   ╚◎ Choice? (1-2): "
-                                    ))
-
-                                    if algo_input == 1:
-                                        maze.generate(other_algorithm=False)
-                                        break
-
-                                    elif algo_input == 2:
-                                        maze.generate(other_algorithm=True)
+                                        algorithm_prompt(names)))
+
+                                    if 1 <= algo_input <= len(names):
+                                        algorithm = names[algo_input - 1]
+                                        if Display.fits_terminal(
+                                                config['WIDTH'],
+                                                config['HEIGHT']):
+                                            clear()
+                                            Display.animate_generation(
+                                                maze, theme[theme_index],
+                                                algorithm)
+                                            maze.export()
+                                        else:
+                                            maze.generate(
+                                                algorithm=algorithm)
                                         break
 
                                     else:
-                                        wErr = "Please choose "
-                                        wErr += "between 1 and 2."
+                                        wErr = "Please choose between "
+                                        wErr += f"1 and {len(names)}."
 
                                 except ValueError:
-                                    wErr = "Please choose between 1 and 2."
+                                    wErr = "Please choose between "
+                                    wErr += f"1 and {len(names)}."
                                     wErr += "\n(ENTRY or EXIT possibly "
                                     wErr += "on the forty-two.)"
                                     continue
@@ -374,36 +398,34 @@ if __name__ == "__main__":
                             continue
 
                         elif answer == 2:
-                            if config['HEIGHT'] > 95:
-                                show_path = not show_path
-                                continue
+                            if show_path:
+                                show_path = False
+                                print("\033[H", end="", flush=True)
+                                try:
+                                    Display.animate_path(
+                                        maze=maze.maze, config=config,
+                                        theme=theme[theme_index],
+                                        forty_two_pos=maze.forty_two_pos,
+                                        state=show_path,
+                                        solution=maze.solution()
+                                    )
+                                except Exception as e:
+                                    error = e
                             else:
-                                if show_path:
-                                    show_path = False
-                                    print("\033[H", end="", flush=True)
-                                    try:
-                                        Display.animate_path(
-                                            maze=maze.maze, config=config,
-                                            theme=theme[theme_index],
-                                            forty_two_pos=maze.forty_two,
-                                            state=show_path
-                                        )
-                                    except Exception as e:
-                                        error = e
-                                else:
-                                    show_path = True
-                                    print("\033[H", end="", flush=True)
-                                    try:
-                                        Display.animate_path(
-                                            maze=maze.maze, config=config,
-                                            theme=theme[theme_index],
-                                            forty_two_pos=maze.forty_two,
-                                            state=show_path
-                                        )
-                                        win_sound()
-                                    except Exception as e:
-                                        error = e
-                                continue
+                                show_path = True
+                                print("\033[H", end="", flush=True)
+                                try:
+                                    Display.animate_path(
+                                        maze=maze.maze, config=config,
+                                        theme=theme[theme_index],
+                                        forty_two_pos=maze.forty_two_pos,
+                                        state=show_path,
+                                        solution=maze.solution()
+                                    )
+                                    win_sound()
+                                except Exception as e:
+                                    error = e
+                            continue
 
                         elif answer == 3:
                             theme_index = (theme_index + 1) % len(theme)
@@ -413,7 +435,8 @@ if __name__ == "__main__":
                             try:
                                 MazeGenerator.export_to(
                                     maze.maze,
-                                    config
+                                    dict(config, THEME=theme[theme_index]),
+                                    maze.solution()
                                 )
                             except Exception as e:
                                 error = e
@@ -449,14 +472,25 @@ if __name__ == "__main__":
                             continue
 
                         elif answer == 6:
+                            try:
+                                Viewport(
+                                    maze.maze, config, theme[theme_index],
+                                    maze.forty_two_pos,
+                                    maze.solution() if show_path else None
+                                ).explore()
+                            except Exception as e:
+                                error = e
+                            continue
+
+                        elif answer == 7:
                             exit_sound()
                             sys.exit(0)
                     else:
-                        input_error = "Please choose between 1 and 6."
+                        input_error = "Please choose between 1 and 7."
                         continue
 
                 except ValueError:
-                    input_error = "Please choose a DIGIT between 1 and 6."
+                    input_error = "Please choose a DIGIT between 1 and 7."
                     continue
 
                 except KeyboardInterrupt:
@@ -0,0 +1,82 @@
+"""
+Benchmark MazeGenerator.solve_maze on growing maze sizes.
+
+The benchmark builds a comb maze (open rows hanging off an open first
+column) so that the BFS has to expand every cell before reaching the
+exit in the opposite corner. Time per cell should stay flat as the
+maze grows, which shows the solver runs in linear time.
+
+Usage:
+    python3 -m benchmarks.bench_solve [SIZE ...]
+"""
+from Maze.generator import MazeGenerator
+from Maze.grid import MazeGrid, NORTH, EAST, SOUTH, WEST
+import sys
+import time
+
+DEFAULT_SIZES = [100, 250, 500, 1000, 2000, 5000]
+
+
+def comb_maze(width: int, height: int) -> MazeGrid:
+    """
+    Build a comb maze where every cell is reachable from (0, 0).
+
+    Args:
+        width: Maze width in cells.
+        height: Maze height in cells.
+
+    Returns:
+        The packed grid of the maze.
+    """
+    grid = MazeGrid(width, height)
+    row = bytearray([NORTH | SOUTH]) * width
+    row[0] = NORTH | SOUTH | WEST
+    row[-1] = NORTH | SOUTH | EAST
+    if width == 1:
+        row[0] = NORTH | SOUTH | EAST | WEST
+    for y in range(height):
+        start = y * width
+        grid.cells[start:start + width] = row
+        spine = WEST
+        if y == 0:
+            spine |= NORTH
+        if y == height - 1:
+            spine |= SOUTH
+        if width == 1:
+            spine |= EAST
+        grid.cells[start] = spine
+    return grid
+
+
+def bench(size: int) -> float:
+    """
+    Solve a size x size comb maze and return the elapsed seconds.
+
+    Args:
+        size: Width and height of the maze.
+
+    Returns:
+        Wall time of the solve_maze call.
+    """
+    grid = comb_maze(size, size)
+    begin = time.perf_counter()
+    path = MazeGenerator.solve_maze(
+        grid, size, size, (0, 0), (size - 1, size - 1))
+    elapsed = time.perf_counter() - begin
+    if len(path) != 2 * size - 1:
+        raise RuntimeError(f"Unexpected path length {len(path)}")
+    return elapsed
+
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES
+    reference = None
+    print(f"{'size':>11} {'cells':>12} {'seconds':>9} {'ns/cell':>9} "
+          f"{'ratio':>6}")
+    for size in sizes:
+        elapsed = bench(size)
+        per_cell = elapsed / (size * size) * 1e9
+        if reference is None:
+            reference = per_cell
+        print(f"{size:>5}x{size:<5} {size * size:>12} {elapsed:>9.3f} "
+              f"{per_cell:>9.1f} {per_cell / reference:>6.2f}")
@@ -0,0 +1,83 @@
+"""
+Benchmark the time taken by `import Maze` in a fresh interpreter.
+
+Each run starts a new Python process with -X importtime and adds up the
+time reported for the package and everything it pulls in, so the
+interpreter's own startup is left out. The run also checks that the
+headless package imports nothing from the terminal front end: no
+pygame, no NumPy (looked up only, imported on first use) and no
+MazeUtils.
+
+The run fails (exit status 1) when the fastest run spends more than
+LIMIT_MS milliseconds in the Maze modules themselves. The standard
+library modules they need (typing, random, ...) are left out of the
+limit, as any program pays for them once.
+
+Usage:
+    python3 -m benchmarks.bench_startup [RUNS] [LIMIT_MS]
+"""
+from typing import Dict, List, Tuple
+import os
+import statistics
+import subprocess
+import sys
+
+DEFAULT_RUNS = 20
+LIMIT_MS = 10.0
+FORBIDDEN = ("pygame", "numpy", "MazeUtils")
+CHECK = (
+    "import sys, Maze; "
+    f"print(','.join(m for m in {FORBIDDEN!r} if m in sys.modules))"
+)
+
+
+def import_times() -> Tuple[float, float, List[str]]:
+    """
+    Import Maze once in a new interpreter.
+
+    Returns:
+        Total import time of Maze in seconds, the part spent in the
+        Maze modules themselves, and the forbidden modules loaded.
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", CHECK],
+        cwd=root, capture_output=True, text=True, check=True)
+
+    own: Dict[str, int] = {}
+    total = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative_us, name = line[12:].split("|")
+        if not self_us.strip().isdigit():
+            continue
+        module = name.strip()
+        if module == "Maze":
+            total = int(cumulative_us)
+        if module == "Maze" or module.startswith("Maze."):
+            own[module] = int(self_us)
+    loaded = [name for name in result.stdout.strip().split(",") if name]
+    return total / 1e6, sum(own.values()) / 1e6, loaded
+
+
+if __name__ == "__main__":
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_RUNS
+    limit = float(sys.argv[2]) if len(sys.argv) > 2 else LIMIT_MS
+    totals = []
+    owns = []
+    for _ in range(runs):
+        total, own, loaded = import_times()
+        if loaded:
+            raise RuntimeError(f"import Maze loaded {', '.join(loaded)}")
+        totals.append(total)
+        owns.append(own)
+    print(f"{'':>14} {'min':>9} {'median':>9}")
+    print(f"{'import Maze':>14} {min(totals) * 1e3:>7.2f}ms "
+          f"{statistics.median(totals) * 1e3:>7.2f}ms")
+    print(f"{'Maze modules':>14} {min(owns) * 1e3:>7.2f}ms "
+          f"{statistics.median(owns) * 1e3:>7.2f}ms")
+    if min(owns) * 1e3 > limit:
+        print(f"Maze modules take {min(owns) * 1e3:.2f}ms to import, "
+              f"more than {limit:.2f}ms")
+        sys.exit(1)
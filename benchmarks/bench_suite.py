@@ -0,0 +1,268 @@
+"""
+Benchmark generation, solving, export and rendering across maze sizes.
+
+Every case uses the same fixed seed, so two runs build the same mazes
+and their results can be compared. The suite sweeps sizes from the
+shipped 20x15 up to thousands of cells per side, both PERFECT modes and
+both menu algorithms (DFS, BFS). It times four phases one by one:
+
+    generate  MazeGenerator.generate(export=False): '42', carving, loops
+    solve     MazeGenerator.solve_maze (BFS, not cached)
+    export    MazeGenerator.export_to with the solution already known
+    render    Display.display_maze into an in-memory sink, not a TTY
+
+Each phase reports its best wall time over --repeat runs and the cells
+per second. Peak memory is then measured in one more run with
+tracemalloc, kept apart so it does not slow the timed runs. Results
+are printed as a table and written as JSON. Pass --compare with an
+older JSON file to print the time ratio of each phase.
+
+Usage:
+    python3 -m benchmarks.bench_suite [--sizes 20x15 500 2000x1000]
+        [--algorithms DFS BFS] [--repeat N] [--no-memory]
+        [--output bench.json] [--compare old.json]
+"""
+from Maze.generator import MazeGenerator
+from MazeUtils.display import Display
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+SEED = 42
+DEFAULT_SIZES = ["20x15", "100x100", "500x500", "1000x1000", "2000x2000"]
+DEFAULT_ALGORITHMS = ["DFS", "BFS"]
+RENDER_LIMIT = 1000
+
+
+def parse_size(text: str) -> Tuple[int, int]:
+    """
+    Parse a WIDTHxHEIGHT size, or a single number for a square.
+
+    Args:
+        text: Size such as "20x15" or "500".
+
+    Returns:
+        (width, height).
+
+    Raises:
+        argparse.ArgumentTypeError: If the size is malformed.
+    """
+    try:
+        parts = [int(part) for part in text.lower().split("x")]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid size: {text}")
+    if len(parts) == 1:
+        parts *= 2
+    if len(parts) != 2 or min(parts) < 1:
+        raise argparse.ArgumentTypeError(f"Invalid size: {text}")
+    return parts[0], parts[1]
+
+
+def make_config(
+    width: int,
+    height: int,
+    perfect: bool,
+    algorithm: str,
+    output_file: str
+) -> Dict[str, Any]:
+    """Build the configuration of one benchmark case."""
+    return {
+        "WIDTH": width, "HEIGHT": height,
+        "ENTRY": (0, 0), "EXIT": (width - 1, height - 1),
+        "PERFECT": perfect, "SEED": SEED, "ALGORITHM": algorithm,
+        "OUTPUT_FILE": output_file,
+    }
+
+
+def phase_steps(
+    config: Dict[str, Any]
+) -> List[Tuple[str, Callable[[], Any]]]:
+    """
+    Build the phases of one case as callables run in order.
+
+    Each phase works on the result of the previous ones, and running
+    the list again starts from a fresh generator.
+
+    Args:
+        config: Configuration of the case.
+
+    Returns:
+        (phase name, callable) pairs; render is left out above
+        RENDER_LIMIT cells per side.
+    """
+    state: Dict[str, Any] = {}
+
+    def generate() -> None:
+        state["gen"] = MazeGenerator(config)
+        state["gen"].generate(export=False)
+
+    def solve() -> None:
+        state["path"] = MazeGenerator.solve_maze(
+            state["gen"].maze, config["WIDTH"], config["HEIGHT"],
+            config["ENTRY"], config["EXIT"])
+
+    def export() -> None:
+        MazeGenerator.export_to(state["gen"].maze, config, state["path"])
+
+    def render() -> None:
+        sink = io.StringIO()
+        with contextlib.redirect_stdout(sink):
+            Display.display_maze(
+                state["gen"].maze, config, True, "BLUE",
+                state["gen"].forty_two_pos, solution=state["path"])
+
+    steps = [("generate", generate), ("solve", solve), ("export", export)]
+    if max(config["WIDTH"], config["HEIGHT"]) <= RENDER_LIMIT:
+        steps.append(("render", render))
+    return steps
+
+
+def run_case(
+    config: Dict[str, Any],
+    repeat: int,
+    memory: bool
+) -> List[Dict[str, Any]]:
+    """
+    Time every phase of one case, then measure its peak memory.
+
+    Args:
+        config: Configuration of the case.
+        repeat: Number of timed runs; the fastest is kept.
+        memory: Also run once under tracemalloc for peak memory.
+
+    Returns:
+        One result dict per phase.
+    """
+    best: Dict[str, float] = {}
+    for _ in range(repeat):
+        for name, step in phase_steps(config):
+            begin = time.perf_counter()
+            step()
+            elapsed = time.perf_counter() - begin
+            best[name] = min(best.get(name, elapsed), elapsed)
+
+    peaks: Dict[str, Optional[int]] = {name: None for name in best}
+    if memory:
+        tracemalloc.start()
+        for name, step in phase_steps(config):
+            tracemalloc.reset_peak()
+            step()
+            peaks[name] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    cells = config["WIDTH"] * config["HEIGHT"]
+    return [
+        {
+            "width": config["WIDTH"],
+            "height": config["HEIGHT"],
+            "algorithm": config["ALGORITHM"],
+            "perfect": config["PERFECT"],
+            "phase": name,
+            "seconds": round(seconds, 6),
+            "cells_per_second": round(cells / seconds) if seconds else None,
+            "peak_bytes": peaks[name],
+        }
+        for name, seconds in best.items()
+    ]
+
+
+def metadata() -> Dict[str, Any]:
+    """Describe the run: commit, Python, platform and seed."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": SEED,
+        "render_limit": RENDER_LIMIT,
+    }
+
+
+def case_key(result: Dict[str, Any]) -> Tuple[Any, ...]:
+    """Key matching the same case and phase across two result files."""
+    return (result["width"], result["height"], result["algorithm"],
+            result["perfect"], result["phase"])
+
+
+def print_result(
+    result: Dict[str, Any],
+    previous: Optional[Dict[str, Any]]
+) -> None:
+    """Print one result line, with the ratio to a previous run."""
+    size = f"{result['width']}x{result['height']}"
+    peak = result["peak_bytes"]
+    memory = f"{peak / 2 ** 20:>9.1f}" if peak is not None else f"{'-':>9}"
+    rate = result["cells_per_second"] or 0
+    line = (f"{size:>11} {result['algorithm']:>6} "
+            f"{str(result['perfect']):>7} {result['phase']:>8} "
+            f"{result['seconds']:>9.4f} {rate:>12.0f} {memory}")
+    if previous is not None and previous["seconds"]:
+        line += f" {result['seconds'] / previous['seconds']:>7.2f}x"
+    print(line)
+
+
+def main() -> None:
+    """Run the suite from the command line."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark generation, solving, export and rendering.")
+    parser.add_argument("--sizes", nargs="+", type=parse_size,
+                        default=[parse_size(s) for s in DEFAULT_SIZES],
+                        help="WIDTHxHEIGHT sizes (default: "
+                        + " ".join(DEFAULT_SIZES) + ")")
+    parser.add_argument("--algorithms", nargs="+",
+                        default=DEFAULT_ALGORITHMS,
+                        help="algorithms to run (default: DFS BFS)")
+    parser.add_argument("--repeat", type=int, default=1,
+                        help="timed runs per case, best kept")
+    parser.add_argument("--no-memory", action="store_true",
+                        help="skip the tracemalloc peak memory run")
+    parser.add_argument("--output", default="bench.json",
+                        help="JSON results file (default: bench.json)")
+    parser.add_argument("--compare",
+                        help="earlier JSON results to compare against")
+    args = parser.parse_args()
+
+    previous: Dict[Tuple[Any, ...], Dict[str, Any]] = {}
+    if args.compare:
+        with open(args.compare) as f:
+            previous = {case_key(r): r for r in json.load(f)["results"]}
+
+    print(f"{'size':>11} {'algo':>6} {'perfect':>7} {'phase':>8} "
+          f"{'seconds':>9} {'cells/s':>12} {'peak MiB':>9}"
+          + (f" {'vs old':>8}" if previous else ""))
+    results: List[Dict[str, Any]] = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for width, height in args.sizes:
+            for algorithm in args.algorithms:
+                for perfect in (True, False):
+                    config = make_config(
+                        width, height, perfect, algorithm.upper(),
+                        os.path.join(tmp, "maze.txt"))
+                    for result in run_case(
+                            config, args.repeat, not args.no_memory):
+                        results.append(result)
+                        print_result(result, previous.get(case_key(result)))
+                        sys.stdout.flush()
+
+    with open(args.output, "w") as f:
+        json.dump({"meta": metadata(), "results": results}, f, indent=1)
+        f.write("\n")
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""
+api.export writes the path of a solver given as an override.
+"""
+from pathlib import Path
+
+import pytest
+
+from Maze.api import export, load, make_config
+from Maze.generator import MazeGenerator
+
+
+def _maze() -> MazeGenerator:
+    """A maze with loops, so the solvers find different paths."""
+    gen = MazeGenerator(make_config(24, 18, perfect=False, seed=7))
+    gen.generate(export=False)
+    return gen
+
+
+def test_export_without_solver_writes_solution(tmp_path: Path) -> None:
+    gen = _maze()
+    path = tmp_path / "maze.txt"
+    export(gen, str(path))
+    assert load(str(path)).solution() == gen.solution()
+
+
+def test_export_with_solver_writes_its_path(tmp_path: Path) -> None:
+    gen = _maze()
+    path = tmp_path / "maze.txt"
+    export(gen, str(path), solver="ASTAR")
+    assert gen.solve("ASTAR")[0] != gen.solution()
+    assert load(str(path)).solution() == gen.solve("ASTAR")[0]
+
+
+def test_export_with_unknown_solver_raises(tmp_path: Path) -> None:
+    path = tmp_path / "maze.txt"
+    with pytest.raises(ValueError, match="Unknown solver"):
+        export(_maze(), str(path), solver="NOPE")
+    assert not path.exists()
@@ -0,0 +1,56 @@
+"""
+Seeded generation must give the same maze in threads as serially.
+
+Every generator draws from its own random.Random, so running many of
+them at once on a thread pool must not interleave their draws.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, List, TypeVar
+
+import pytest
+
+from Maze.api import make_config
+from Maze.generator import MazeGenerator, ALGORITHMS
+from Maze.grid import WALLS
+from Maze.stream import stream_to
+
+SEEDS = range(32)
+WORKERS = 8
+
+T = TypeVar("T")
+
+_WALL_BITS = bytes(value & WALLS for value in range(256))
+
+
+def _serial_and_threaded(run: Callable[[int], T]) -> None:
+    """Check that run(seed) gives the same result both ways."""
+    serial: List[T] = [run(seed) for seed in SEEDS]
+    with ThreadPoolExecutor(max_workers=WORKERS) as pool:
+        threaded = list(pool.map(run, SEEDS))
+    assert threaded == serial
+
+
+@pytest.mark.parametrize("perfect", [True, False])
+@pytest.mark.parametrize("algorithm", sorted(ALGORITHMS))
+def test_generate_in_threads(algorithm: str, perfect: bool) -> None:
+    def run(seed: int) -> bytes:
+        gen = MazeGenerator(make_config(24, 18, perfect=perfect, seed=seed))
+        gen.generate(algorithm=algorithm, export=False)
+        return bytes(gen.maze.cells).translate(_WALL_BITS)
+
+    _serial_and_threaded(run)
+
+
+@pytest.mark.parametrize("perfect", [True, False])
+@pytest.mark.parametrize("algorithm", ["ELLER", "BINARY_TREE"])
+def test_stream_in_threads(
+    algorithm: str, perfect: bool, tmp_path: Path
+) -> None:
+    def run(seed: int) -> bytes:
+        path = tmp_path / f"{seed}-{perfect}.txt"
+        stream_to(make_config(24, 18, perfect=perfect, seed=seed,
+                              output_file=str(path)), algorithm)
+        return path.read_bytes()
+
+    _serial_and_threaded(run)